@@ -1,19 +1,32 @@
 import argparse
+import ast
+import collections
+import functools
+import glob
+import json
+import operator
+import os
 import pathlib
 import re
 import subprocess  # noqa: S404 # this is used as preflight on trusted input
 import sys
-from typing import Any
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from yurei.crypt import decrypt
+from yurei.index import KeyIndex, fingerprint_keys
 from yurei.types_ import Save as SaveType
+from yurei.unlockable import discover_unlockables
 from yurei.utils import get_save_password, to_json
 
-GENERIC_PATTERN: re.Pattern[str] = re.compile(r"\[(?P<generic>[a-zA-Z0-9\.]+),")
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 TEMPLATE: str = r"""
-from typing import TypedDict
+from typing import Any, TypedDict
 
-from .inner_types import Bool, ColourValue, Dict, DifficultyValue, Float, Int, List, SpecialPlayedMaps, String
+from .inner_types import Bool, ColourValue, Dict, DifficultyValue, Float, Int, IntBool, List, SpecialPlayedMaps, String
 
 __all__ = ("Save",)
 
@@ -44,81 +57,503 @@ PYTHON_TYPE_LOOKUP = {
     "System.Int32": "int",
     "Difficulty,Assembly-CSharp": "DifficultyValue",
 }
+GENERIC_LOOKUP = {
+    "System.Collections.Generic.List`1": ("List", "list"),
+    "System.Collections.Generic.Dictionary`2": ("Dict", "dict"),
+}
+# what a key with an unrecognised `__type` is typed as in corpus mode
+UNKNOWN_TYPE = "dict[str, Any]"
 # usually because of dumb json issues with cs
 SPECIAL_CASES = {"playedMaps": "SpecialPlayedMaps", "RoleType": "Int", "currentSeasonalEvent": "Int"}
-CURRENT_SAVE_KEY = get_save_password(password_file=(pathlib.Path(__file__).parent / "resources" / "save_password"))
+TYPES_FILE = pathlib.Path("yurei/types_/save.py")
+VALIDATOR_FILE = pathlib.Path("yurei/types_/validator.py")
+SCHEMAS_DIR = pathlib.Path("yurei/types_/schemas")
+VALIDATOR_TEMPLATE: str = r"""
+# This file is generated by `create_type.py` from `yurei/types_/save.py`, do not edit it by hand.
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
-class ProgramNamespace(argparse.Namespace):
-    file: pathlib.Path
+__all__ = ({exports})
+{metadata}
 
 
-parser = argparse.ArgumentParser()
-parser.add_argument("-f", "--file", type=pathlib.Path, required=True, dest="file")
+# exact type checks throughout, `isinstance` would take a bool for an int
+def _is_colour(value: Any) -> bool:
+    return type(value) is dict and all(type(value.get(channel)) in {{int, float}} for channel in "rgba")
 
-args = parser.parse_args(namespace=ProgramNamespace())
 
-if not args.file.exists():
-    msg_ = f"Provided file {args.file} could not be found."
-    raise FileNotFoundError(msg_)
+def _is_list_of(value: Any, inner: type) -> bool:
+    return type(value) is list and all(type(item) is inner for item in value)
 
 
-def _extract_generic(inp: str) -> tuple[str, ...]:
-    matches = list(GENERIC_PATTERN.finditer(inp))
-    if not matches:
-        raise ValueError("Our pattern is bad or the type is wrong.")
+def _is_dict_of(value: Any, inner: type) -> bool:
+    return type(value) is dict and all(type(item) is inner for item in value.values())
 
-    return tuple(match.group("generic") for match in matches)
 
+def _describe(key: str, expected: str, entry: Any) -> str:
+    if type(entry) is not dict:
+        return f"{{key}}: expected an object with `__type` and `value`, got {{type(entry).__name__}}"
+    return f"{{key}}: expected {{expected}}, got `__type`={{entry.get('__type')!r}} value={{entry.get('value')!r:.50}}"
 
-def _resolve_type(inp: str) -> str:
-    if "System.Collections.Generic.Dictionary" in inp:
-        key, val = _extract_generic(inp)
-        key, val = PYTHON_TYPE_LOOKUP[key], PYTHON_TYPE_LOOKUP[val]
-        return f"Dict[{key}, {val}]"
 
-    if "System.Collections.Generic.List" in inp:
-        resolved, *_ = _extract_generic(inp)
-        resolved = PYTHON_TYPE_LOOKUP[resolved]
-        return f"List[{resolved}]"
+def validate_save(data: Mapping[str, Any], /) -> list[str]:  # noqa: PLR0915 # one straight-line check per key
+    errors: list[str] = []
+    get = data.get
+{checks}
+    return errors
 
-    return LOOKUP[inp]
+"""
+# the validator of the newest registered schema, which was generated from the same `Save` TypedDict
+VALIDATOR_ALIAS_TEMPLATE: str = r"""
+# This file is generated by `create_type.py` from `yurei/types_/save.py`, do not edit it by hand.
+from .schemas.{module} import validate_save
 
+__all__ = ("validate_save",)
+"""
+SCHEMA_METADATA_TEMPLATE: str = r"""
+NAME: str = {name!r}
+FINGERPRINTS: frozenset[str] = frozenset({fingerprints!r})
+# the unlockables of each layout above, so loading a save of one of them doesn't search its keys
+UNLOCKABLES_BY_FINGERPRINT: dict[str, tuple[str, ...]] = {layouts!r}
+KEYS: frozenset[str] = frozenset({keys!r})
+EQUIPMENT: tuple[str, ...] = {equipment!r}
+UNLOCKABLES: tuple[str, ...] = {unlockables!r}
+"""
+SCHEMA_REGISTRY_TEMPLATE: str = r"""
+# This file is generated by `create_type.py`, do not edit it by hand.
+from . import {imports}
 
-def create_json() -> dict[str, Any]:
-    data = decrypt(path=args.file, password=CURRENT_SAVE_KEY, strip_type_key=False, return_type=SaveType)
+__all__ = ("SCHEMA_MODULES",)
 
-    # data is json
+# in order of registration, the last entry is the newest layout
+SCHEMA_MODULES = ({modules},)
+"""
+# type name -> (`__type` check on `tag`, value check on `value`, description)
+VALIDATOR_CHECKS: dict[str, tuple[str, str, str]] = {
+    "Int": ('tag != "int"', "type(value) is not int", "int"),
+    # an `int` the game has been seen writing a bool into
+    "IntBool": ('tag != "int"', "type(value) not in {int, bool}", "int"),
+    "Float": ('tag != "float"', "type(value) not in {int, float}", "float"),
+    "Bool": ('tag != "bool"', "type(value) is not bool", "bool"),
+    "String": ('tag != "string"', "type(value) is not str", "string"),
+    "ColourValue": ('tag != "Color"', "not _is_colour(value)", "Color"),
+    "DifficultyValue": ('tag != "Difficulty,Assembly-CSharp"', "type(value) is not dict", "Difficulty"),
+    "SpecialPlayedMaps": ("type(tag) is not str", "not _is_dict_of(value, int)", "Dictionary<int, int>"),
+    "List[str]": (
+        'not tag.startswith("System.Collections.Generic.List`1[[System.String,")',
+        "not _is_list_of(value, str)",
+        "List<string>",
+    ),
+    "List[int]": (
+        'not tag.startswith("System.Collections.Generic.List`1[[System.Int32,")',
+        "not _is_list_of(value, int)",
+        "List<int>",
+    ),
+    "Dict[str, int]": (
+        'not tag.startswith("System.Collections.Generic.Dictionary`2[[System.String,")',
+        "not _is_dict_of(value, int)",
+        "Dictionary<string, int>",
+    ),
+}
+# anything else (unknown or nested generic types) only has its shape checked
+LOOSE_CHECK: tuple[str, str, str] = ("type(tag) is not str", "", "object")
+CURRENT_SAVE_KEY = get_save_password(password_file=(pathlib.Path(__file__).parent / "resources" / "save_password"))
 
-    with pathlib.Path("decrypted.json").open("w", encoding="utf-8") as fp:
-        fp.write(to_json(data))
 
-    return dict(sorted(data.items()))
+class ProgramNamespace(argparse.Namespace):
+    file: pathlib.Path | None
+    validator_only: bool
+    schema_version: str | None
+    fingerprint_from: list[pathlib.Path]
+    corpus: list[str]
+    jobs: int
+    report: pathlib.Path | None
 
 
-def parse_json(input_: dict[str, Any]) -> str:
-    ret: dict[str, Any] = {}
+parser = argparse.ArgumentParser()
+parser.add_argument("-f", "--file", type=pathlib.Path, default=None, dest="file")
+parser.add_argument(
+    "--validator-only",
+    action="store_true",
+    dest="validator_only",
+    help="Only regenerate the validator from the existing `yurei/types_/save.py`.",
+)
+parser.add_argument(
+    "--schema-version",
+    default=None,
+    dest="schema_version",
+    help="Also register the generated layout as a named schema version within `yurei/types_/schemas/`.",
+)
+parser.add_argument(
+    "--fingerprint-from",
+    type=pathlib.Path,
+    action="append",
+    default=[],
+    dest="fingerprint_from",
+    help="Additional saves whose key layouts should resolve to the registered schema version.",
+)
+parser.add_argument(
+    "-c",
+    "--corpus",
+    action="append",
+    default=[],
+    dest="corpus",
+    help="Infer the union schema of many saves instead of `-f`, accepts files, directories and glob patterns.",
+)
+parser.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    default=os.process_cpu_count() or 1,
+    dest="jobs",
+    help="The amount of worker processes used to decrypt the corpus.",
+)
+parser.add_argument(
+    "--report",
+    type=pathlib.Path,
+    default=None,
+    dest="report",
+    help="Write the per key frequencies and type observations of the corpus to this JSON file.",
+)
+
+
+def _split_generic(inp: str) -> tuple[str, list[str]]:
+    # splits an assembly qualified name such as `List`1[[System.String, mscorlib, ...]],mscorlib` into its name and arguments
+    start = inp.find("[")
+    if start == -1:
+        return inp.split(",", 1)[0].strip(), []
+
+    arguments: list[str] = []
+    depth = 0
+    argument_start = start
+    for idx in range(start, len(inp)):
+        if inp[idx] == "[":
+            depth += 1
+            if depth == 2:
+                argument_start = idx + 1
+        elif inp[idx] == "]":
+            if depth == 2:
+                arguments.append(inp[argument_start:idx])
+            depth -= 1
+            if depth == 0:
+                break
+
+    return inp[:start].strip(), arguments
+
+
+def _resolve_generic(inp: str, *, top_level: bool) -> str:
+    name, arguments = _split_generic(inp)
+    if name not in GENERIC_LOOKUP:
+        return PYTHON_TYPE_LOOKUP[name]
+
+    wrapper, builtin = GENERIC_LOOKUP[name]
+    resolved = ", ".join(_resolve_generic(argument, top_level=False) for argument in arguments)
+    return f"{wrapper if top_level else builtin}[{resolved}]"
+
+
+@functools.cache
+def _resolve_type(inp: str) -> str:
+    if inp.startswith(tuple(GENERIC_LOOKUP)):
+        return _resolve_generic(inp, top_level=True)
+
+    return LOOKUP[inp]
+
+
+def _key_types(input_: dict[str, Any], *, strict: bool = True) -> dict[str, str]:
+    ret: dict[str, str] = {}
     for k, v in input_.items():
-        type_ = v["__type"]
         if k in SPECIAL_CASES:
             ret[k] = SPECIAL_CASES[k]
             continue
         try:
-            ret[k] = _resolve_type(type_)
+            ret[k] = _resolve_type(v["__type"])
         except KeyError as err:
+            if not strict:
+                ret[k] = UNKNOWN_TYPE
+                continue
             msg = f"Key {k!r} has an unknown type(s): {', '.join(map(repr, err.args))}"
             raise KeyError(msg) from err
+        # only the keys a bool was actually seen under an `int` tag in accept one
+        if ret[k] == "Int" and type(v.get("value")) is bool:
+            ret[k] = "IntBool"
+
+    return ret
+
 
+def create_json(file: pathlib.Path, /) -> dict[str, Any]:
+    data = decrypt(path=file, password=CURRENT_SAVE_KEY, strip_type_key=False, return_type=SaveType)
+
+    # data is json
+
+    with pathlib.Path("decrypted.json").open("w", encoding="utf-8") as fp:
+        fp.write(to_json(data))
+
+    return dict(sorted(data.items()))
+
+
+def parse_json(input_: dict[str, Any]) -> str:
+    ret = _key_types(input_)
     return "{" + "\n".join([f'"{k}": {v},' for k, v in ret.items()]) + "}"
 
 
-def main() -> None:
-    json = create_json()
-    type_ = TEMPLATE.format_map({"keyvalmap": parse_json(json)})
-    with pathlib.Path("yurei/types_/save.py").open("w", encoding="utf-8") as fp:
-        fp.write(type_)
+def _observe_save(path: pathlib.Path) -> tuple[str, list[tuple[str, str]]] | None:
+    # runs within the worker processes, so only the small key/type pairs are sent back
+    try:
+        data = decrypt(path=path, password=CURRENT_SAVE_KEY, return_type=SaveType)
+        types = _key_types(data, strict=False)
+    except Exception:  # noqa: BLE001 # one malformed save is reported as failed rather than ending the run
+        return None
+
+    return fingerprint_keys(types), list(types.items())
+
+
+def _expand_corpus(entries: list[str]) -> list[pathlib.Path]:
+    paths: dict[pathlib.Path, None] = {}
+    for entry in entries:
+        path = pathlib.Path(entry).expanduser()
+        if path.is_dir():
+            paths.update(dict.fromkeys(sorted(p for p in path.rglob("*") if p.is_file())))
+        elif path.is_file():
+            paths[path] = None
+        else:
+            paths.update(dict.fromkeys(sorted(pathlib.Path(p) for p in glob.glob(entry, recursive=True))))  # noqa: PTH207 # patterns may be absolute
+
+    return list(paths)
+
+
+class CorpusObservations:
+    __slots__ = ("failed", "key_counts", "layouts", "saves", "type_counts")
+
+    def __init__(self) -> None:
+        self.saves: int = 0
+        self.failed: list[pathlib.Path] = []
+        # fingerprint -> the unlockables of that layout
+        self.layouts: dict[str, tuple[str, ...]] = {}
+        self.key_counts: collections.Counter[str] = collections.Counter()
+        self.type_counts: dict[str, collections.Counter[str]] = collections.defaultdict(collections.Counter)
+
+    def add(self, fingerprint: str, types: list[tuple[str, str]]) -> None:
+        self.saves += 1
+        if fingerprint not in self.layouts:
+            self.layouts[fingerprint] = tuple(discover_unlockables(KeyIndex(key for key, _ in types)))
+        for key, type_ in types:
+            self.key_counts[key] += 1
+            self.type_counts[key][type_] += 1
+
+    def union_types(self) -> dict[str, str]:
+        # the most observed type comes first, conflicting observations become a union
+        return {
+            key: " | ".join(type_ for type_, _ in self.type_counts[key].most_common()) for key in sorted(self.key_counts)
+        }
+
+    def to_typed_dict_body(self) -> str:
+        lines: list[str] = []
+        for key, type_ in self.union_types().items():
+            count = self.key_counts[key]
+            comment = f"  # seen in {count}/{self.saves} saves" if count < self.saves else ""
+            lines.append(f'"{key}": {type_},{comment}')
+        return "{" + "\n".join(lines) + "\n}"
+
+    def to_report(self) -> dict[str, Any]:
+        return {
+            "saves": self.saves,
+            "failed": [str(path) for path in self.failed],
+            "fingerprints": sorted(self.layouts),
+            "keys": {
+                key: {"count": count, "types": dict(self.type_counts[key].most_common())}
+                for key, count in sorted(self.key_counts.items(), key=operator.itemgetter(1, 0))
+            },
+        }
+
+
+def observe_corpus(paths: list[pathlib.Path], *, jobs: int) -> CorpusObservations:
+    observations = CorpusObservations()
+    chunksize = max(1, min(256, len(paths) // (jobs * 8)))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for path, observed in zip(paths, executor.map(_observe_save, paths, chunksize=chunksize), strict=True):
+            if observed is None:
+                observations.failed.append(path)
+                continue
+            observations.add(*observed)
+
+    return observations
+
+
+def _print_corpus_summary(observations: CorpusObservations, *, elapsed: float) -> None:
+    print(  # noqa: T201 # this is a cli output
+        f"Observed {observations.saves} saves ({len(observations.failed)} failed) with {len(observations.key_counts)} keys "
+        f"and {len(observations.layouts)} layouts in {elapsed:.1f}s.",
+        file=sys.stderr,
+    )
+    for key, count in sorted(observations.key_counts.items(), key=operator.itemgetter(1, 0)):
+        types = observations.type_counts[key]
+        if count == observations.saves and len(types) == 1:
+            continue
+        observed = ", ".join(f"{type_} x{amount}" for type_, amount in types.most_common())
+        print(f"  {key}: {count}/{observations.saves} ({observed})", file=sys.stderr)  # noqa: T201 # this is a cli output
+
+
+def _read_typed_keys() -> dict[str, str]:
+    tree = ast.parse(TYPES_FILE.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Call)
+            and len(node.value.args) == 2
+            and isinstance(node.value.args[1], ast.Dict)
+        ):
+            mapping = node.value.args[1]
+            return {
+                key.value: ast.unparse(value)
+                for key, value in zip(mapping.keys, mapping.values, strict=True)
+                if isinstance(key, ast.Constant) and isinstance(key.value, str)
+            }
+
+    msg = f"Unable to find the `Save` TypedDict within {TYPES_FILE}."
+    raise RuntimeError(msg)
+
+
+def create_validator(typed_keys: dict[str, str], *, metadata: str = "") -> str:
+    checks: list[str] = []
+    for key, type_ in typed_keys.items():
+        failures: list[str] = []
+        expected: list[str] = []
+        # an entry is invalid when it fails the checks of every member of a union
+        for member in type_.split(" | "):
+            tag_check, value_check, description = VALIDATOR_CHECKS.get(member, LOOSE_CHECK)
+            # these keys carry obfuscated or otherwise unstable `__type` tags
+            if key in SPECIAL_CASES:
+                tag_check = "type(tag) is not str"
+            failures.append(" or ".join(check for check in (tag_check, value_check) if check))
+            expected.append(description)
+
+        condition = failures[0] if len(failures) == 1 else " and ".join(f"({failure})" for failure in failures)
+        checks.append(
+            f"    entry = get({key!r})\n"
+            "    if entry is not None:\n"
+            "        tag, value = (entry.get('__type'), entry.get('value')) if type(entry) is dict else (None, None)\n"
+            f"        if {condition}:\n"
+            f"            errors.append(_describe({key!r}, {' or '.join(expected)!r}, entry))"
+        )
+
+    exports = (
+        ("EQUIPMENT", "FINGERPRINTS", "KEYS", "NAME", "UNLOCKABLES", "UNLOCKABLES_BY_FINGERPRINT", "validate_save")
+        if metadata
+        else ("validate_save",)
+    )
+    return VALIDATOR_TEMPLATE.format_map(
+        {
+            "checks": "\n".join(checks),
+            "exports": ", ".join(map(repr, exports)) + ",",
+            "metadata": metadata,
+        }
+    )
+
+
+def _schema_module_name(version: str) -> str:
+    return "v_" + re.sub(r"\W+", "_", version).strip("_").lower()
+
+
+def _layout(keys: Iterable[str]) -> tuple[str, tuple[str, ...]]:
+    index = KeyIndex(keys)
+    return index.fingerprint(), tuple(discover_unlockables(index))
+
+
+def register_schema(
+    version: str,
+    typed_keys: dict[str, str],
+    *,
+    layouts: dict[str, tuple[str, ...]],
+    fingerprint_from: list[pathlib.Path],
+) -> tuple[pathlib.Path, pathlib.Path]:
+    index = KeyIndex(typed_keys)
+    layouts = dict([_layout(typed_keys), *layouts.items()])
+    for file in fingerprint_from:
+        data = decrypt(path=file, password=CURRENT_SAVE_KEY, return_type=SaveType)
+        layouts.update([_layout(data)])
+
+    metadata = SCHEMA_METADATA_TEMPLATE.format_map(
+        {
+            "name": version,
+            "fingerprints": sorted(layouts),
+            "layouts": dict(sorted(layouts.items())),
+            "keys": sorted(typed_keys),
+            "equipment": tuple(key.removesuffix("TierOneUnlockOwned") for key in index.with_suffix("TierOneUnlockOwned")),
+            "unlockables": tuple(discover_unlockables(index)),
+        }
+    )
+
+    module_name = _schema_module_name(version)
+    SCHEMAS_DIR.mkdir(exist_ok=True)
+    module_file = SCHEMAS_DIR / f"{module_name}.py"
+    module_file.write_text(create_validator(typed_keys, metadata=metadata), encoding="utf-8")
+
+    registry_file = SCHEMAS_DIR / "__init__.py"
+    registered: list[str] = []
+    if registry_file.exists():
+        registered = re.findall(r"^SCHEMA_MODULES = \((.*)\)$", registry_file.read_text(encoding="utf-8"), re.MULTILINE)
+        registered = [name.strip() for name in registered[0].split(",") if name.strip()] if registered else []
+    if module_name not in registered:
+        registered.append(module_name)
+
+    registry_file.write_text(
+        SCHEMA_REGISTRY_TEMPLATE.format_map({"imports": ", ".join(sorted(registered)), "modules": ", ".join(registered)}),
+        encoding="utf-8",
+    )
+    return module_file, registry_file
+
 
-    sys.exit(subprocess.Popen("ruff format yurei/types_/save.py", shell=True).returncode)  # noqa: S602, S607 # this is used as preflight on trusted input
+def main() -> None:
+    args = parser.parse_args(namespace=ProgramNamespace())
+    if not args.file and not args.validator_only and not args.corpus:
+        parser.error("`-f/--file` is required unless `--validator-only` or `--corpus` is passed.")
+
+    if args.file and not args.file.exists():
+        msg = f"Provided file {args.file} could not be found."
+        raise FileNotFoundError(msg)
+
+    # the layouts of the saves this was generated from are the most likely ones to be seen again
+    layouts: dict[str, tuple[str, ...]] = {}
+    if args.corpus:
+        paths = _expand_corpus(args.corpus)
+        start = time.perf_counter()
+        observations = observe_corpus(paths, jobs=args.jobs)
+        _print_corpus_summary(observations, elapsed=time.perf_counter() - start)
+        if args.report:
+            args.report.write_text(json.dumps(observations.to_report(), indent=2), encoding="utf-8")
+        if not observations.saves:
+            raise RuntimeError("None of the provided corpus files could be decrypted.")
+
+        layouts |= observations.layouts
+        type_ = TEMPLATE.format_map({"keyvalmap": observations.to_typed_dict_body()})
+        with TYPES_FILE.open("w", encoding="utf-8") as fp:
+            fp.write(type_)
+    elif not args.validator_only:
+        assert args.file  # guarded above
+        data = create_json(args.file)
+        layouts.update([_layout(data)])
+        type_ = TEMPLATE.format_map({"keyvalmap": parse_json(data)})
+        with TYPES_FILE.open("w", encoding="utf-8") as fp:
+            fp.write(type_)
+
+    typed_keys = _read_typed_keys()
+    to_format = [TYPES_FILE, VALIDATOR_FILE]
+    if args.schema_version:
+        module_file, registry_file = register_schema(
+            args.schema_version, typed_keys, layouts=layouts, fingerprint_from=args.fingerprint_from
+        )
+        # the schema just registered checks exactly these keys, so it holds the only copy of the checks
+        validator = VALIDATOR_ALIAS_TEMPLATE.format_map({"module": module_file.stem})
+        to_format += [module_file, registry_file]
+    else:
+        validator = create_validator(typed_keys)
+
+    with VALIDATOR_FILE.open("w", encoding="utf-8") as fp:
+        fp.write(validator)
+
+    sys.exit(subprocess.Popen(f"ruff format {' '.join(map(str, to_format))}", shell=True).returncode)  # noqa: S602 # this is used as preflight on trusted input
 
 
 if __name__ == "__main__":
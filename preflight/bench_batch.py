@@ -0,0 +1,49 @@
+import argparse
+import logging
+import pathlib
+import shutil
+import sys
+import tempfile
+
+from yurei.batch import batch
+from yurei.recipe import Recipe
+
+
+class ProgramNamespace(argparse.Namespace):
+    files: list[pathlib.Path]
+    copies: int
+    jobs: list[int]
+
+
+parser = argparse.ArgumentParser(description="Compare the thread and process batch executors on copies of some saves.")
+parser.add_argument("files", type=pathlib.Path, nargs="+")
+parser.add_argument("-c", "--copies", type=int, default=100, dest="copies", help="copies of each save per run")
+parser.add_argument("-j", "--jobs", type=int, nargs="+", default=[1, 2, 4, 8], dest="jobs")
+
+# touches something in every save, so each one is decrypted, edited, encrypted and written
+RECIPE = Recipe(money=123456, inventory={"*": 3}, unlock_gear={"*": 1})
+
+
+def main() -> None:
+    args = parser.parse_args(namespace=ProgramNamespace())
+    logging.getLogger("yurei").setLevel(logging.WARNING)
+    print(f"{sys.version.split()[0]}, GIL {'enabled' if sys._is_gil_enabled() else 'disabled'}")  # noqa: T201 # this is a cli output
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        for jobs in args.jobs:
+            for executor in ("thread", "process"):
+                # fresh copies every run, a second run over the same copies would find nothing to change
+                shutil.rmtree(root / "saves", ignore_errors=True)
+                (root / "saves").mkdir()
+                paths = [
+                    shutil.copy(file, root / "saves" / f"{index}-{file.name}")
+                    for file in args.files
+                    for index in range(args.copies)
+                ]
+                report = batch(map(pathlib.Path, paths), RECIPE, jobs=jobs, executor=executor, create_backup=False)
+                print(f"{executor:>7} x{jobs}: {report.describe()}")  # noqa: T201 # this is a cli output
+
+
+if __name__ == "__main__":
+    main()
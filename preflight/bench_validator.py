@@ -0,0 +1,76 @@
+import argparse
+import functools
+import pathlib
+import timeit
+import typing
+from typing import Any, Literal, TypeVar, get_args, get_origin, is_typeddict
+
+from yurei.crypt import decrypt
+from yurei.save import CURRENT_SAVE_KEY
+from yurei.types_ import colour, difficulty, inner_types
+from yurei.types_.save import Save as SaveType
+from yurei.types_.validator import validate_save
+
+
+class ProgramNamespace(argparse.Namespace):
+    files: list[pathlib.Path]
+    number: int
+
+
+parser = argparse.ArgumentParser(description="Compare the generated save validator against a generic TypedDict walker.")
+parser.add_argument("files", type=pathlib.Path, nargs="+")
+parser.add_argument("-n", "--number", type=int, default=200, dest="number")
+
+TYPE_NAMESPACE: dict[str, Any] = {**vars(inner_types), **vars(colour), **vars(difficulty)}
+
+
+@functools.cache
+def _hints(type_: Any) -> dict[str, Any]:
+    origin = get_origin(type_) or type_
+    hints = typing.get_type_hints(origin, localns=TYPE_NAMESPACE)
+    substitutions = dict(zip(getattr(origin, "__type_params__", ()), get_args(type_), strict=False))
+    ret: dict[str, Any] = {}
+    for key, value in hints.items():
+        # `__type` is name mangled inside the TypedDict class bodies
+        ret["__type" if key.endswith("__type") else key] = (
+            substitutions.get(value, value) if isinstance(value, TypeVar) else value
+        )
+    return ret
+
+
+def generic_check(value: Any, type_: Any) -> bool:  # noqa: PLR0911 # one branch per type form
+    origin = get_origin(type_)
+    if is_typeddict(origin or type_):
+        if not isinstance(value, dict):
+            return False
+        hints = _hints(type_)
+        return all(key not in value or generic_check(value[key], hint) for key, hint in hints.items())
+    if origin is Literal:
+        return value in get_args(type_)
+    if origin is list:
+        (inner,) = get_args(type_)
+        return isinstance(value, list) and all(generic_check(item, inner) for item in value)
+    if origin is dict:
+        _, inner = get_args(type_)
+        return isinstance(value, dict) and all(generic_check(item, inner) for item in value.values())
+    if type_ is float:
+        return isinstance(value, (int, float))
+    if isinstance(type_, type):
+        return isinstance(value, type_)
+    return True
+
+
+def main() -> None:
+    args = parser.parse_args(namespace=ProgramNamespace())
+    for file in args.files:
+        data = decrypt(path=file, password=CURRENT_SAVE_KEY, return_type=SaveType)
+        generated = timeit.timeit(lambda data=data: validate_save(data), number=args.number) / args.number
+        generic = timeit.timeit(lambda data=data: generic_check(data, SaveType), number=args.number) / args.number
+        print(  # noqa: T201 # this is a cli output
+            f"{file.name}: {len(data)} keys, generated={generated * 1e6:.1f}µs generic={generic * 1e6:.1f}µs "
+            f"({generic / generated:.1f}x), errors={len(validate_save(data))}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import multiprocessing
+import pathlib
+import shutil
+import subprocess  # noqa: S404 # runs our own cli
+import sys
+import tempfile
+import time
+
+from yurei.recipe import Recipe
+from yurei.save import Save
+from yurei.utils import to_json
+
+
+class ProgramNamespace(argparse.Namespace):
+    file: pathlib.Path
+    rounds: int
+    timeout: float
+    poll: bool
+
+
+parser = argparse.ArgumentParser(
+    description="Run `yurei watch` on a copy of a save while another process keeps rewriting it, like the game does."
+)
+parser.add_argument("file", type=pathlib.Path)
+parser.add_argument("-r", "--rounds", type=int, default=5, dest="rounds", help="how many times the save is rewritten")
+parser.add_argument("-t", "--timeout", type=float, default=5.0, dest="timeout", help="seconds to wait for each re-apply")
+parser.add_argument("--poll", action="store_true", help="have the watcher poll rather than use inotify")
+
+# level and prestige are missing from some saves, the watcher has to skip them rather than die
+RECIPE = Recipe(money=123456, level=50, prestige=1)
+
+
+def _rewrite(path: pathlib.Path, money: int, /) -> None:
+    save = Save.from_path(path, create_backup=False)
+    save.money = money
+    save.write()
+
+
+def _money(path: pathlib.Path, /) -> int | None:
+    try:
+        return Save.from_path(path, create_backup=False).money
+    except (OSError, ValueError):
+        # caught mid-write
+        return None
+
+
+def main() -> None:
+    args = parser.parse_args(namespace=ProgramNamespace())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        path = pathlib.Path(shutil.copy(args.file, root / args.file.name))
+        recipe_path = root / "recipe.json"
+        recipe_path.write_text(to_json(RECIPE.to_mapping()))
+
+        command = [sys.executable, "-m", "yurei", "watch", str(recipe_path), "--save", str(path), "--no-backup"]
+        watcher = subprocess.Popen([*command, "--poll"] if args.poll else command)  # noqa: S603 # our own cli
+        failures = 0
+        try:
+            for round_ in range(args.rounds):
+                # a different value every round, so each one is a real rewrite the watcher has to notice
+                writer = multiprocessing.Process(target=_rewrite, args=(path, round_))
+                writer.start()
+                writer.join()
+
+                started = time.perf_counter()
+                deadline = started + args.timeout
+                while (money := _money(path)) != RECIPE.money and watcher.poll() is None and time.perf_counter() < deadline:
+                    time.sleep(0.01)
+
+                if watcher.poll() is not None:
+                    print(f"round {round_}: the watcher exited with {watcher.returncode}")  # noqa: T201 # this is a cli output
+                    failures += args.rounds - round_
+                    break
+                if money == RECIPE.money:
+                    print(f"round {round_}: re-applied in {(time.perf_counter() - started) * 1e3:.1f}ms")  # noqa: T201 # this is a cli output
+                else:
+                    print(f"round {round_}: money is still {money} after {args.timeout}s")  # noqa: T201 # this is a cli output
+                    failures += 1
+        finally:
+            watcher.terminate()
+            watcher.wait()
+
+    print(f"{args.rounds - failures}/{args.rounds} rewrites re-applied")  # noqa: T201 # this is a cli output
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,18 @@
-# pyright: reportPrivateUsage=false
-
 import argparse
 import pathlib
 
 import yurei
+from yurei.recipe import Recipe
 
 
 class ProgramNamespace(argparse.Namespace):
     file: pathlib.Path
 
 
+RECIPE = Recipe(
+    values={"recentPlayerIDS": [], "recentPlayerNames": [], "recentPlayerPlatformIDS": [], "recentPlayerPlatforms": []}
+)
+
 parser = argparse.ArgumentParser()
 parser.add_argument("-f", "--file", type=pathlib.Path, required=True, dest="file")
 
@@ -20,9 +23,5 @@ if not args.file.exists():
     raise FileNotFoundError(msg_)
 
 save = yurei.Save.from_path(args.file)
-
-with save:
-    save._data["recentPlayerIDS"]["value"] = []
-    save._data["recentPlayerNames"]["value"] = []
-    save._data["recentPlayerPlatformIDS"]["value"] = []
-    save._data["recentPlayerPlatforms"]["value"] = []
+RECIPE.apply(save)
+save.write()
@@ -5,14 +5,25 @@ __copyright__ = "Copyright 2025-present AbstractUmbra"
 __version__ = "0.0.1"
 
 import logging
+from typing import TYPE_CHECKING, Any
 
 from . import utils
 from .enums import *
-from .save import Save
-from .tui import *
+from .save import CURRENT_SAVE_KEY as CURRENT_SAVE_KEY, Save
 
-CURRENT_SAVE_KEY: str = "t36gref9u84y7f43g"
+if TYPE_CHECKING:
+    from .tui import *
 
 __all__ = ("CURRENT_SAVE_KEY", "Save", "utils")
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+def __getattr__(name: str) -> Any:
+    # the TUI pulls in textual, which the save API, batch and pipeline commands have no use for
+    if name == "YureiApp":
+        from .tui import YureiApp  # noqa: PLC0415
+
+        return YureiApp
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
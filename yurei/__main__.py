@@ -1,4 +1,4 @@
-from .tui.app import YureiApp
+from .cli import main
 
 if __name__ == "__main__":
-    YureiApp().run()
+    main()
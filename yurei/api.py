@@ -0,0 +1,276 @@
+import asyncio
+import collections
+import contextlib
+import json
+import logging
+import os
+import pathlib
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+from .recipe import Recipe
+from .save import Save, SaveConflictError
+from .utils import from_json
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+__all__ = ("SaveLRU", "serve")
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.getenv("YUREI_API_PORT", "8787"))
+# a decrypted save with its key index takes ~30 times the file's size, ~1 MiB for a typical save
+DEFAULT_CACHE_SIZE = 16
+MAX_BODY_SIZE = 1024 * 1024
+# `Host` headers accepted over TCP, anything else is a browser being pointed at us through DNS rebinding
+LOCAL_HOSTS: frozenset[str] = frozenset({"127.0.0.1", "localhost", "[::1]"})
+
+type Handler = Callable[[dict[str, list[str]], bytes], Awaitable[tuple[HTTPStatus, Any]]]
+
+
+class SaveLRU:
+    """Decrypted saves by path, valid for as long as the file keeps the ``(mtime, size)`` they were read or written at.
+
+    Access is serialised per file by :meth:`lock`, which every reader and writer of a path has to hold.
+    """
+
+    __slots__ = ("_entries", "_lock_users", "_locks", "create_backup", "maxsize", "stats")
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, *, create_backup: bool = True) -> None:
+        self.maxsize = maxsize
+        self.create_backup = create_backup
+        self._entries: dict[pathlib.Path, tuple[int, int, Save]] = {}
+        # only paths someone holds or waits on have a lock, so every path ever requested doesn't leave one behind
+        self._locks: dict[pathlib.Path, asyncio.Lock] = {}
+        self._lock_users: collections.Counter[pathlib.Path] = collections.Counter()
+        # "hits", "misses", "evictions" and "writes"
+        self.stats: collections.Counter[str] = collections.Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @contextlib.asynccontextmanager
+    async def lock(self, path: pathlib.Path, /) -> AsyncIterator[None]:
+        lock = self._locks.setdefault(path, asyncio.Lock())
+        self._lock_users[path] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._lock_users[path] -= 1
+            if not self._lock_users[path]:
+                del self._lock_users[path], self._locks[path]
+
+    def _store(self, path: pathlib.Path, save: Save, /) -> None:
+        assert save.disk_state  # read from or written to disk
+        self._entries.pop(path, None)
+        self._entries[path] = (save.disk_state.mtime_ns, save.disk_state.size, save)
+        # dicts keep insertion order, so the first key is the least recently used
+        while len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+            self.stats["evictions"] += 1
+
+    def discard(self, path: pathlib.Path, /) -> None:
+        self._entries.pop(path, None)
+
+    async def get(self, path: pathlib.Path, /) -> Save:
+        """The save at ``path``, decrypted again only if the file changed since. Hold :meth:`lock` while using it."""
+        stat = await asyncio.to_thread(path.stat)
+        entry = self._entries.get(path)
+        if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            self.stats["hits"] += 1
+            self._store(path, entry[2])
+            return entry[2]
+
+        self.stats["misses"] += 1
+        save = await Save.from_path_async(path, create_backup=self.create_backup)
+        self._store(path, save)
+        return save
+
+    def written(self, path: pathlib.Path, save: Save, /) -> None:
+        """Re-key ``save`` after writing it, so the write doesn't count as someone else changing the file."""
+        self.stats["writes"] += 1
+        self._store(path, save)
+
+
+def _path(query: dict[str, list[str]], /) -> pathlib.Path:
+    try:
+        (raw,) = query["path"]
+    except (KeyError, ValueError):
+        msg = "Exactly one `path` query parameter is required."
+        raise ValueError(msg) from None
+    return pathlib.Path(raw).expanduser().resolve()
+
+
+def _hostname(header: str, /) -> str:
+    # "[::1]:8787" keeps its brackets, "localhost:8787" loses its port
+    if header.startswith("["):
+        return header.partition("]")[0] + "]"
+    return header.partition(":")[0]
+
+
+def _stat(save: Save, name: str, /) -> int | None:
+    # not every save has every stat, that is the save's gap rather than anything the client asked for
+    try:
+        return getattr(save, name)
+    except KeyError:
+        return None
+
+
+def _patch(save: Save, recipe: Recipe, /, *, dry_run: bool) -> list[str]:
+    changes = recipe.apply(save)
+    if changes and not dry_run:
+        save.write()
+    return changes
+
+
+class _Api:
+    __slots__ = ("cache", "routes")
+
+    def __init__(self, cache: SaveLRU, /) -> None:
+        self.cache = cache
+        self.routes: dict[tuple[str, str], Handler] = {
+            ("GET", "/save"): self.read_save,
+            ("GET", "/save/values"): self.read_values,
+            ("PATCH", "/save"): self.patch_save,
+            ("GET", "/stats"): self.read_stats,
+        }
+
+    async def read_save(self, query: dict[str, list[str]], _: bytes, /) -> tuple[HTTPStatus, Any]:
+        path = _path(query)
+        async with self.cache.lock(path):
+            save = await self.cache.get(path)
+            return HTTPStatus.OK, {
+                "path": str(path),
+                "level": _stat(save, "level"),
+                "prestige": _stat(save, "prestige"),
+                "money": _stat(save, "money"),
+                "unlockables": list(save.unlockable_manager.available()),
+            }
+
+    async def read_values(self, query: dict[str, list[str]], _: bytes, /) -> tuple[HTTPStatus, Any]:
+        """Values by key, each ``key`` parameter may be a glob, e.g ``*Inventory``."""
+        path = _path(query)
+        async with self.cache.lock(path):
+            save = await self.cache.get(path)
+            keys = [key for pattern in query.get("key", ()) for key in save.find_keys(pattern)]
+            return HTTPStatus.OK, {"path": str(path), "values": {key: save.get_value(key) for key in keys}}
+
+    async def patch_save(self, query: dict[str, list[str]], body: bytes, /) -> tuple[HTTPStatus, Any]:
+        """Apply the recipe in the body, ``dry_run=1`` reports the changes without writing them."""
+        path = _path(query)
+        recipe = Recipe.from_mapping(from_json(body or b"{}"))
+        dry_run = query.get("dry_run", ["0"])[-1] not in {"", "0", "false"}
+        if dry_run:
+            # applied to a copy, the cached save is only ever what is on disk
+            save = await Save.from_path_async(path, create_backup=False)
+            changes = await asyncio.to_thread(_patch, save, recipe, dry_run=True)
+            return HTTPStatus.OK, {"path": str(path), "changes": changes, "written": False}
+
+        async with self.cache.lock(path):
+            save = await self.cache.get(path)
+            try:
+                changes = await asyncio.to_thread(_patch, save, recipe, dry_run=False)
+            except BaseException:
+                # half applied, or not written, either way it no longer matches the file
+                self.cache.discard(path)
+                raise
+            if changes:
+                self.cache.written(path, save)
+            return HTTPStatus.OK, {"path": str(path), "changes": changes, "written": bool(changes)}
+
+    async def read_stats(self, _: dict[str, list[str]], __: bytes, /) -> tuple[HTTPStatus, Any]:
+        return HTTPStatus.OK, {"cached": len(self.cache), "maxsize": self.cache.maxsize, **self.cache.stats}
+
+    async def dispatch(self, method: str, target: str, body: bytes, /) -> tuple[HTTPStatus, Any]:  # noqa: PLR0911 # one status per kind of failure
+        url = urlsplit(target)
+        handler = self.routes.get((method, url.path))
+        if not handler:
+            allowed = any(path == url.path for _, path in self.routes)
+            status = HTTPStatus.METHOD_NOT_ALLOWED if allowed else HTTPStatus.NOT_FOUND
+            return status, {"error": f"No route for {method} {url.path}."}
+
+        try:
+            return await handler(parse_qs(url.query, keep_blank_values=True), body)
+        except FileNotFoundError as err:
+            return HTTPStatus.NOT_FOUND, {"error": f"No save at {err.filename}."}
+        except (IsADirectoryError, NotADirectoryError) as err:
+            return HTTPStatus.BAD_REQUEST, {"error": f"{err.filename} is not a save file."}
+        except PermissionError as err:
+            return HTTPStatus.FORBIDDEN, {"error": f"Not allowed to access {err.filename}."}
+        except TimeoutError as err:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(err)}
+        except SaveConflictError as err:
+            # the file changed underneath a write
+            return HTTPStatus.CONFLICT, {"error": str(err)}
+        except (ValueError, TypeError) as err:
+            return HTTPStatus.BAD_REQUEST, {"error": f"{type(err).__name__}: {err}"}
+        except Exception:
+            # a bug on our side, the client gets an answer and the connection stays usable
+            LOGGER.exception("Failed to handle %s %s", method, target)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, /, *, check_host: bool) -> None:
+        """Serve HTTP/1.1 requests from one client, keeping the connection open between them."""
+        try:
+            while request_line := await reader.readline():
+                started = time.perf_counter()
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()).strip():
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", "0"))
+                if length > MAX_BODY_SIZE:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "The body is too large."}
+                    keep_alive = False
+                elif check_host and _hostname(headers.get("host", "")) not in LOCAL_HOSTS:
+                    await reader.readexactly(length)
+                    status, payload = HTTPStatus.FORBIDDEN, {"error": "Only local clients may use this API."}
+                    keep_alive = False
+                else:
+                    status, payload = await self.dispatch(method, target, await reader.readexactly(length))
+                    keep_alive = headers.get("connection", "").lower() != "close"
+
+                data = json.dumps(payload, separators=(",", ":")).encode()
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n{'' if keep_alive else 'Connection: close\r\n'}\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+                LOGGER.debug("%s %s %s in %.2fms", method, target, status.value, (time.perf_counter() - started) * 1e3)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # a client that went away or can't speak HTTP, neither is worth answering
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(
+    *,
+    socket_path: pathlib.Path | None = None,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    create_backup: bool = True,
+) -> None:
+    """Serve the save API on a Unix socket when ``socket_path`` is given, otherwise over TCP, until cancelled."""
+    api = _Api(SaveLRU(cache_size, create_backup=create_backup))
+    if socket_path:
+        server = await asyncio.start_unix_server(lambda r, w: api.handle(r, w, check_host=False), socket_path)
+        # only our user gets to edit our saves
+        socket_path.chmod(0o600)
+        LOGGER.info("Serving the save API on %s", socket_path)
+    else:
+        server = await asyncio.start_server(lambda r, w: api.handle(r, w, check_host=True), host, port)
+        LOGGER.info("Serving the save API on http://%s:%s", host, port)
+
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,267 @@
+import collections
+import contextlib
+import glob
+import itertools
+import json
+import logging
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Literal, TypedDict
+
+from .crypt import SNIFF_HEADER_SIZE, sniff
+from .save import CURRENT_SAVE_KEY, Save
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
+    from .recipe import Recipe
+
+__all__ = ("BatchReport", "FileResult", "batch", "default_executor", "expand_paths", "read_manifest")
+
+LOGGER = logging.getLogger(__name__)
+# results that mean a file needs nothing more from this recipe, so a rerun skips it
+DONE_STATUSES: frozenset[str] = frozenset({"applied", "unchanged"})
+# what Yurei leaves beside a save: its lock, its staging file while writing and its backups
+SIDECAR_SUFFIXES: tuple[str, ...] = (".yurei-lock", ".yurei-tmp", ".bak")
+# files submitted ahead of the ones being worked on, per worker, enough to keep every worker busy
+TASKS_IN_FLIGHT_PER_JOB = 2
+
+type ExecutorKind = Literal["process", "thread"]
+
+
+class FileResult(TypedDict):
+    path: str
+    status: Literal["applied", "unchanged", "would-apply", "skipped", "failed"]
+    changes: list[str]
+    error: str | None
+    recipe: str
+    # the file as it was left, a rerun only skips it while it still looks like this
+    mtime_ns: int | None
+    size: int | None
+    ms: float
+
+
+class BatchReport:
+    """The outcome of a batch run, counted by result status, plus ``"resumed"`` for files skipped as already done."""
+
+    __slots__ = ("counts", "elapsed")
+
+    def __init__(self, counts: collections.Counter[str], elapsed: float) -> None:
+        self.counts = counts
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return f"<BatchReport processed={self.processed} elapsed={self.elapsed:.2f}s>"
+
+    @property
+    def processed(self) -> int:
+        return self.counts.total() - self.counts["resumed"]
+
+    @property
+    def files_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    def describe(self) -> str:
+        counts = ", ".join(f"{count} {status}" for status, count in sorted(self.counts.items()))
+        return (
+            f"Processed {self.processed} files in {self.elapsed:.2f}s ({self.files_per_second:.1f} files/s): "
+            f"{counts or 'nothing to do'}."
+        )
+
+
+def default_executor() -> ExecutorKind:
+    """Threads when the GIL is off, e.g on ``python3.14t``, as they skip pickling and process startup, else processes."""
+    return "process" if sys._is_gil_enabled() else "thread"
+
+
+def expand_paths(patterns: Iterable[str], /) -> list[pathlib.Path]:
+    """Expand globs (``**`` included) into the files they match, in order and without duplicates.
+
+    Globs leave out the lock, staging and backup files Yurei writes beside saves, paths given as they are are kept.
+    """
+    seen: dict[pathlib.Path, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(os.path.expanduser(pattern), recursive=True)) or [pattern]  # noqa: PTH111, PTH207 # pathlib globs need a base directory
+        is_glob = glob.has_magic(pattern)
+        for match in matches:
+            path = pathlib.Path(match).resolve()
+            if not path.is_dir() and not (is_glob and path.name.endswith(SIDECAR_SUFFIXES)):
+                seen.setdefault(path)
+    return list(seen)
+
+
+def read_manifest(path: pathlib.Path, /) -> list[pathlib.Path]:
+    """Read save paths, or globs of them, one per line. Blank lines and lines starting with ``#`` are ignored."""
+    lines = (line.strip() for line in path.read_text(encoding="utf-8").splitlines())
+    return expand_paths(line for line in lines if line and not line.startswith("#"))
+
+
+def _read_done(log: pathlib.Path, recipe: str, /) -> dict[str, tuple[int | None, int | None]]:
+    done: dict[str, tuple[int | None, int | None]] = {}
+    try:
+        fp = log.open(encoding="utf-8")
+    except FileNotFoundError:
+        return done
+
+    with fp:
+        for line in fp:
+            try:
+                result: FileResult = json.loads(line)
+            except ValueError:
+                # a run killed mid-line, the file it was writing about is simply redone
+                continue
+            if result["status"] in DONE_STATUSES and result["recipe"] == recipe:
+                done[result["path"]] = (result["mtime_ns"], result["size"])
+            else:
+                done.pop(result["path"], None)
+    return done
+
+
+def _is_done(path: pathlib.Path, done: dict[str, tuple[int | None, int | None]], /) -> bool:
+    state = done.get(str(path))
+    if not state:
+        return False
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    # rewritten since, e.g by the game, so the recipe may need applying again
+    return state == (stat.st_mtime_ns, stat.st_size)
+
+
+def _is_save(path: pathlib.Path, /) -> bool:
+    with path.open("rb") as fp:
+        header = fp.read(SNIFF_HEADER_SIZE)
+    return sniff(header, size=path.stat().st_size, password=CURRENT_SAVE_KEY)
+
+
+def _process(path: pathlib.Path, recipe: Recipe, /, *, dry_run: bool, create_backup: bool) -> FileResult:
+    started = time.perf_counter()
+    changes: list[str] = []
+    error: str | None = None
+    skipped = False
+    try:
+        # anything else a glob caught, which would only fail to decrypt
+        skipped = not _is_save(path)
+        if not skipped:
+            save = Save.from_path(path, create_backup=create_backup)
+            changes = recipe.apply(save)
+            if changes and not dry_run:
+                save.write()
+    except (OSError, ValueError, KeyError, NotImplementedError) as err:
+        error = f"{type(err).__name__}: {err}"
+
+    if error:
+        status = "failed"
+    elif skipped:
+        status = "skipped"
+    elif not changes:
+        status = "unchanged"
+    else:
+        status = "would-apply" if dry_run else "applied"
+
+    try:
+        stat = path.stat()
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+    except OSError:
+        mtime_ns = size = None
+    return FileResult(
+        path=str(path),
+        status=status,
+        changes=changes,
+        error=error,
+        recipe=recipe.fingerprint(),
+        mtime_ns=mtime_ns,
+        size=size,
+        ms=round((time.perf_counter() - started) * 1e3, 3),
+    )
+
+
+def _results(
+    paths: list[pathlib.Path],
+    recipe: Recipe,
+    /,
+    *,
+    jobs: int,
+    executor: ExecutorKind,
+    dry_run: bool,
+    create_backup: bool,
+) -> Iterator[FileResult]:
+    if jobs == 1 or len(paths) == 1:
+        for path in paths:
+            yield _process(path, recipe, dry_run=dry_run, create_backup=create_backup)
+        return
+
+    # one save per task, decrypting one takes far longer than shipping its path and result between processes
+    pool = ThreadPoolExecutor(max_workers=jobs) if executor == "thread" else ProcessPoolExecutor(max_workers=jobs)
+    queued = iter(paths)
+    window: set[Future[FileResult]] = set()
+    try:
+        # a bounded window rather than every path up front, so stopping early, e.g on Ctrl-C, leaves only the files
+        # already being worked on to finish, each of the rest is either in the log or untouched
+        while True:
+            window.update(
+                pool.submit(_process, path, recipe, dry_run=dry_run, create_backup=create_backup)
+                for path in itertools.islice(queued, jobs * TASKS_IN_FLIGHT_PER_JOB - len(window))
+            )
+            if not window:
+                return
+            done, window = wait(window, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def batch(
+    paths: Iterable[pathlib.Path],
+    recipe: Recipe,
+    /,
+    *,
+    log: pathlib.Path | None = None,
+    jobs: int | None = None,
+    executor: ExecutorKind | None = None,
+    dry_run: bool = False,
+    create_backup: bool = True,
+) -> BatchReport:
+    """Apply ``recipe`` to every save in ``paths``, in ``jobs`` workers of the ``executor`` kind.
+
+    Every result is appended to ``log`` as a line of JSON as soon as it is known. Rerunning with the same log and
+    recipe skips the files it already applied to, as long as they were not changed since.
+    """
+    counts: collections.Counter[str] = collections.Counter()
+    done = _read_done(log, recipe.fingerprint()) if log else {}
+    pending: list[pathlib.Path] = []
+    for path in paths:
+        if _is_done(path, done):
+            counts["resumed"] += 1
+        else:
+            pending.append(path)
+    if counts["resumed"]:
+        LOGGER.info("Skipping %s files already done according to %s", counts["resumed"], log)
+
+    jobs = max(1, min(jobs or os.process_cpu_count() or 1, len(pending) or 1))
+    executor = executor or default_executor()
+    LOGGER.info(
+        "Applying %r to %s files with %s %s workers%s", recipe, len(pending), jobs, executor, " (dry run)" if dry_run else ""
+    )
+    started = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        fp = stack.enter_context(log.open("a", encoding="utf-8")) if log else None
+        results = _results(pending, recipe, jobs=jobs, executor=executor, dry_run=dry_run, create_backup=create_backup)
+        for result in results:
+            counts[result["status"]] += 1
+            if fp:
+                # flushed per line, so an interrupted run can be resumed from the last file that finished
+                fp.write(json.dumps(result, separators=(",", ":")) + "\n")
+                fp.flush()
+            if result["error"]:
+                LOGGER.warning("Failed on %s: %s", result["path"], result["error"])
+            elif result["status"] == "skipped":
+                LOGGER.info("Skipped %s, it is not a save", result["path"])
+
+    return BatchReport(counts, time.perf_counter() - started)
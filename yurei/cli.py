@@ -0,0 +1,191 @@
+import argparse
+import asyncio
+import logging
+import os
+import pathlib
+import sys
+from typing import TYPE_CHECKING
+
+from .api import DEFAULT_CACHE_SIZE, DEFAULT_HOST, DEFAULT_PORT, serve
+from .batch import batch, expand_paths, read_manifest
+from .recipe import Recipe
+from .stream import decrypt_paths, decrypt_stream, encrypt_stream
+from .utils import resolve_save_path
+from .watch import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL, watch
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+__all__ = ("main",)
+
+
+def _save_path(args: argparse.Namespace, /) -> pathlib.Path:
+    return args.save.expanduser().resolve() if args.save else resolve_save_path()
+
+
+def _watch(args: argparse.Namespace, /) -> None:
+    try:
+        watch(
+            _save_path(args),
+            Recipe.from_path(args.recipe),
+            debounce=args.debounce,
+            poll_interval=args.poll_interval,
+            poll=args.poll,
+            create_backup=not args.no_backup,
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+def _batch(args: argparse.Namespace, /) -> None:
+    paths = expand_paths(args.paths)
+    if args.manifest:
+        paths += [path for path in read_manifest(args.manifest) if path not in paths]
+    if not paths:
+        msg = "No saves to apply the recipe to, pass some paths, globs or a --manifest."
+        raise SystemExit(msg)
+
+    # every edit is in the result log already, one line per edit per save would drown out the failures
+    logging.getLogger("yurei.save").setLevel(logging.WARNING)
+    try:
+        report = batch(
+            paths,
+            Recipe.from_path(args.recipe),
+            log=args.log,
+            jobs=args.jobs,
+            executor=args.executor,
+            dry_run=args.dry_run,
+            create_backup=not args.no_backup,
+        )
+    except KeyboardInterrupt:
+        # everything that finished is in the log already
+        raise SystemExit(130) from None
+
+    print(report.describe())  # noqa: T201 # this is the command's output
+    if report.counts["failed"]:
+        sys.exit(1)
+
+
+def _stdin_paths() -> Iterator[str]:
+    for line in sys.stdin:
+        if path := line.strip():
+            yield path
+
+
+def _decrypt(args: argparse.Namespace, /) -> None:
+    if not args.ndjson:
+        try:
+            decrypt_stream(sys.stdin.buffer, sys.stdout.buffer, strip_types=args.strip_types)
+        except ValueError as err:
+            msg = f"Could not decrypt stdin, is it a save? {err}"
+            raise SystemExit(msg) from None
+        return
+
+    counts = decrypt_paths(_stdin_paths(), sys.stdout.buffer, strip_types=args.strip_types, jobs=args.jobs)
+    if counts["errors"]:
+        sys.exit(1)
+
+
+def _encrypt(_: argparse.Namespace, /) -> None:
+    if sys.stdout.isatty():
+        msg = "Refusing to write an encrypted save to a terminal, redirect it to a file."
+        raise SystemExit(msg)
+    try:
+        encrypt_stream(sys.stdin.buffer, sys.stdout.buffer)
+    except ValueError as err:
+        msg = f"Could not encrypt stdin: {err}"
+        raise SystemExit(msg) from None
+
+
+def _serve_api(args: argparse.Namespace, /) -> None:
+    # every edit is in the response to whoever asked for it
+    logging.getLogger("yurei.save").setLevel(logging.WARNING)
+    try:
+        asyncio.run(
+            serve(
+                socket_path=args.socket,
+                host=args.host,
+                port=args.port,
+                cache_size=args.cache_size,
+                create_backup=not args.no_backup,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="yurei", description="A Phasmophobia save editor, run without a command for the TUI."
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    watch_parser = commands.add_parser("watch", help="re-apply a recipe every time the game rewrites the save")
+    watch_parser.add_argument("recipe", type=pathlib.Path, help="a JSON recipe of the edits to keep applied")
+    watch_parser.add_argument("--save", type=pathlib.Path, help="the save to watch, defaults to the game's save on Windows")
+    watch_parser.add_argument(
+        "--debounce", type=float, default=DEFAULT_DEBOUNCE, help="seconds of quiet that end a burst of writes"
+    )
+    watch_parser.add_argument("--poll", action="store_true", help="poll the save even where inotify is available")
+    watch_parser.add_argument(
+        "--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL, help="seconds between polls when polling"
+    )
+    watch_parser.add_argument("--no-backup", action="store_true", help="do not back up the original save")
+    watch_parser.set_defaults(handler=_watch)
+
+    batch_parser = commands.add_parser("batch", help="apply a recipe to many saves at once, in parallel")
+    batch_parser.add_argument("recipe", type=pathlib.Path, help="a JSON recipe of the edits to apply")
+    batch_parser.add_argument("paths", nargs="*", help="saves, or globs of them, `**` included")
+    batch_parser.add_argument("-m", "--manifest", type=pathlib.Path, help="a file of saves or globs, one per line")
+    batch_parser.add_argument(
+        "--log",
+        type=pathlib.Path,
+        help="append a JSON line per save here, and skip the saves it already lists as done",
+    )
+    batch_parser.add_argument("-j", "--jobs", type=int, help="workers to use, defaults to one per CPU")
+    batch_parser.add_argument(
+        "--executor",
+        choices=("process", "thread"),
+        help="run workers as processes or threads, defaults to threads on free-threaded Python and processes otherwise",
+    )
+    batch_parser.add_argument("-n", "--dry-run", action="store_true", help="report what would change without writing")
+    batch_parser.add_argument("--no-backup", action="store_true", help="do not back up the saves that are written")
+    batch_parser.set_defaults(handler=_batch)
+
+    decrypt_parser = commands.add_parser("decrypt", help="decrypt a save from stdin to JSON on stdout")
+    decrypt_parser.add_argument("--strip-types", action="store_true", help='drop the "__type" keys, leaving only values')
+    decrypt_parser.add_argument(
+        "--ndjson", action="store_true", help="read save paths from stdin instead, writing a line of JSON per save"
+    )
+    decrypt_parser.add_argument("-j", "--jobs", type=int, help="worker processes for --ndjson, defaults to one per CPU")
+    decrypt_parser.set_defaults(handler=_decrypt)
+
+    encrypt_parser = commands.add_parser("encrypt", help="encrypt JSON from stdin to a save on stdout")
+    encrypt_parser.set_defaults(handler=_encrypt)
+
+    api_parser = commands.add_parser("serve-api", help="serve reads and edits of saves as JSON over local HTTP")
+    api_parser.add_argument("--socket", type=pathlib.Path, help="listen on this Unix socket instead of TCP")
+    api_parser.add_argument("--host", default=DEFAULT_HOST, help="the address to listen on, keep it local")
+    api_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="the port to listen on, or $YUREI_API_PORT")
+    api_parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="decrypted saves to keep in memory")
+    api_parser.add_argument("--no-backup", action="store_true", help="do not back up saves before editing them")
+    api_parser.set_defaults(handler=_serve_api)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = _build_parser().parse_args(argv)
+    if not args.command:
+        # only the TUI needs textual, which is most of the startup time of every other command
+        from .tui import entry  # noqa: PLC0415
+
+        entry()
+        return
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        args.handler(args)
+    except BrokenPipeError:
+        # the reader went away, e.g `| head`, so keep the interpreter from failing to flush stdout again at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
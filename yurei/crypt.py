@@ -35,19 +35,25 @@ from Crypto.Util.Padding import pad, unpad
 
 from .utils import MISSING, from_json
 
-SHITTY_NEWTONSOFT_SUB_PATTERN: re.Pattern[str] = re.compile(r"(?<={|,)\s*(\d+)\s*:")
+# no lookbehind, so the scan can jump between `{` and `,` rather than trying every position, about twice as fast
+SHITTY_NEWTONSOFT_SUB_PATTERN: re.Pattern[str] = re.compile(r"([{,])\s*(\d+)\s*:")
 
 if TYPE_CHECKING:
     from os import PathLike
 
 __all__ = (
     "decrypt",
+    "decrypt_text",
     "encrypt",
+    "sniff",
 )
 
+# the initialisation vector plus the first cipher block
+SNIFF_HEADER_SIZE = 32
+
 
 def _resolve_shitty_newtonsoft_int_dict_keys(input_: str) -> str:
-    return SHITTY_NEWTONSOFT_SUB_PATTERN.sub(r'"\1":', input_)
+    return SHITTY_NEWTONSOFT_SUB_PATTERN.sub(r'\1"\2":', input_)
 
 
 def _strip_shitty_type_kv(input_: dict[str, Any] | list[str] | str) -> dict[str, Any] | list[str] | str:
@@ -109,6 +115,13 @@ def decrypt[T: Any](
         read_data = data
         assert read_data  # guarded earlier
 
+    json_data = from_json(decrypt_text(read_data, password=password))
+
+    return cast("T", _strip_shitty_type_kv(json_data) if strip_type_key else json_data)  # pyright: ignore[reportArgumentType] # nested typed
+
+
+def decrypt_text(read_data: bytes, /, *, password: str) -> str:
+    """Decrypt a save to its JSON text, without parsing it."""
     # The initialisation vector is the first 16 bytes of the save file.
     init_vector = read_data[:16]
     # then we take the proceeding N bytes as the data
@@ -125,7 +138,19 @@ def decrypt[T: Any](
 
     # and it's always UTF-8
     resolved_data = decrypted_data.decode("utf-8")
-    resolved_data = _resolve_shitty_newtonsoft_int_dict_keys(resolved_data)
-    json_data = from_json(resolved_data)
+    return _resolve_shitty_newtonsoft_int_dict_keys(resolved_data)
 
-    return cast("T", _strip_shitty_type_kv(json_data) if strip_type_key else json_data)  # pyright: ignore[reportArgumentType] # nested typed
+
+def sniff(header: bytes, /, *, size: int, password: str) -> bool:
+    """Cheaply tell whether a file is an encrypted save from its size and first :data:`SNIFF_HEADER_SIZE` bytes.
+
+    The ciphertext must be whole blocks and only the first block is decrypted, which has to open a JSON object.
+    """
+    if size < SNIFF_HEADER_SIZE or size % AES.block_size or len(header) < SNIFF_HEADER_SIZE:
+        return False
+
+    init_vector = header[:16]
+    key = PBKDF2(password, init_vector, dkLen=16, count=100)
+    cipher = AES.new(key, AES.MODE_CBC, init_vector)  # pyright: ignore[reportUnknownMemberType] # the overload is broken
+    first_block = cipher.decrypt(header[16:SNIFF_HEADER_SIZE])
+    return first_block.isascii() and first_block.lstrip().startswith(b"{")
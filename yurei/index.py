@@ -0,0 +1,237 @@
+import bisect
+import fnmatch
+import hashlib
+import re
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+__all__ = ("FuzzyIndex", "KeyIndex", "fingerprint_keys")
+
+GLOB_SPECIAL_PATTERN: re.Pattern[str] = re.compile(r"\[!?\]?[^\]]*\]|[*?]")
+
+
+def fingerprint_keys(keys: Iterable[str], /) -> str:
+    """A stable hash of a key set, used to recognise a save layout without probing keys."""
+    return hashlib.blake2b("\0".join(sorted(keys)).encode(), digest_size=16).hexdigest()
+
+
+class KeyIndex:
+    """A sorted key array and suffix array over the top level keys of a save.
+
+    Prefix queries bisect the sorted keys, suffix and infix queries bisect the sorted suffixes,
+    so each query costs ``O(log n)`` plus the size of the result.
+    """
+
+    __slots__ = ("_keys", "_suffixes")
+
+    def __init__(self, keys: Iterable[str] = (), /) -> None:
+        self._keys: list[str] = sorted(set(keys))
+        # a read-only sequence when borrowed through `from_suffix_table`, copied into a list by the first edit
+        self._suffixes: Sequence[tuple[str, str]] = sorted((key[idx:], key) for key in self._keys for idx in range(len(key)))
+
+    @classmethod
+    def from_suffix_table(cls, keys: list[str], suffixes: Sequence[tuple[str, str]], /) -> Self:
+        """Wrap already sorted ``keys`` and their ``suffixes``, e.g a view of :meth:`suffix_table` kept elsewhere."""
+        index = cls.__new__(cls)
+        index._keys = keys
+        index._suffixes = suffixes
+        return index
+
+    def __contains__(self, key: object, /) -> bool:
+        if not isinstance(key, str):
+            return False
+        idx = bisect.bisect_left(self._keys, key)
+        return idx < len(self._keys) and self._keys[idx] == key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __repr__(self) -> str:
+        return f"<KeyIndex keys={len(self._keys)}>"
+
+    def fingerprint(self) -> str:
+        return fingerprint_keys(self._keys)
+
+    def suffix_table(self) -> list[tuple[int, int]]:
+        """Each suffix in order as ``(key position, offset into the key)``, the index without repeating any text."""
+        positions = {key: idx for idx, key in enumerate(self._keys)}
+        return [(positions[key], len(key) - len(suffix)) for suffix, key in self._suffixes]
+
+    def _own_suffixes(self) -> list[tuple[str, str]]:
+        if not isinstance(self._suffixes, list):
+            self._suffixes = list(self._suffixes)
+        return self._suffixes
+
+    def _suffixes_from(self, start: int, /) -> Iterator[tuple[str, str]]:
+        # indexed rather than sliced, a slice would copy the whole tail to read the few matches at its head
+        suffixes = self._suffixes
+        for idx in range(start, len(suffixes)):
+            yield suffixes[idx]
+
+    def add(self, key: str, /) -> None:
+        if key in self:
+            return
+
+        bisect.insort(self._keys, key)
+        suffixes = self._own_suffixes()
+        for idx in range(len(key)):
+            bisect.insort(suffixes, (key[idx:], key))
+
+    def discard(self, key: str, /) -> None:
+        idx = bisect.bisect_left(self._keys, key)
+        if idx == len(self._keys) or self._keys[idx] != key:
+            return
+
+        del self._keys[idx]
+        suffixes = self._own_suffixes()
+        for start in range(len(key)):
+            entry = (key[start:], key)
+            del suffixes[bisect.bisect_left(suffixes, entry)]
+
+    def with_prefix(self, prefix: str, /) -> list[str]:
+        ret: list[str] = []
+        for key in self._keys[bisect.bisect_left(self._keys, prefix) :]:
+            if not key.startswith(prefix):
+                break
+            ret.append(key)
+        return ret
+
+    def with_suffix(self, suffix: str, /) -> list[str]:
+        if not suffix:
+            return list(self._keys)
+
+        ret: list[str] = []
+        for found, key in self._suffixes_from(bisect.bisect_left(self._suffixes, (suffix,))):
+            if found != suffix:
+                break
+            ret.append(key)
+        return ret
+
+    def containing(self, infix: str, /) -> list[str]:
+        if not infix:
+            return list(self._keys)
+
+        seen: dict[str, None] = {}
+        for found, key in self._suffixes_from(bisect.bisect_left(self._suffixes, (infix,))):
+            if not found.startswith(infix):
+                break
+            seen[key] = None
+        return sorted(seen)
+
+    def matching(self, pattern: str, /) -> list[str]:
+        """Return every key matching the glob ``pattern``, in sorted order.
+
+        The longest literal run of the pattern is used to narrow the candidates before the full match.
+        """
+        literals = GLOB_SPECIAL_PATTERN.split(pattern)
+        if len(literals) == 1:
+            return [pattern] if pattern in self else []
+
+        head, tail = literals[0], literals[-1]
+        longest = max(literals, key=len)
+        if head and len(head) >= len(tail) and len(head) >= len(longest):
+            candidates = self.with_prefix(head)
+        elif tail and len(tail) >= len(longest):
+            candidates = self.with_suffix(tail)
+        else:
+            candidates = self.containing(longest)
+
+        matcher = re.compile(fnmatch.translate(pattern))
+        return [key for key in candidates if matcher.match(key)]
+
+
+def _char_mask(text: str, /) -> int:
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def _fuzzy_score(needle: str, haystack: str, /) -> float:
+    idx = haystack.find(needle)
+    if idx != -1:
+        # contiguous matches always beat scattered ones, a match of the whole text scores 1
+        return (0.6 if idx else 0.7) + 0.3 * len(needle) / len(haystack)
+
+    first = pos = -1
+    for char in needle:
+        pos = haystack.find(char, pos + 1)
+        if pos == -1:
+            return 0.0
+        if first == -1:
+            first = pos
+    # scattered matches are ranked by how tightly they cluster
+    return 0.5 * len(needle) / (pos - first + 1)
+
+
+class FuzzyIndex:
+    """A case insensitive subsequence matcher over ``key -> text`` documents.
+
+    Every document keeps a bitmask of the characters it contains so most misses cost a single ``&``, and a query
+    that extends the previous one only rescans the previous matches.
+    """
+
+    __slots__ = ("_documents", "_last_matches", "_last_query")
+
+    def __init__(self, documents: Iterable[tuple[str, str]] = (), /) -> None:
+        self._documents: dict[str, tuple[str, str, int]] = {}
+        self._last_query: str = ""
+        self._last_matches: list[str] = []
+        for key, text in documents:
+            self.set(key, text)
+
+    def __contains__(self, key: object, /) -> bool:
+        return key in self._documents
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._documents)
+
+    def __repr__(self) -> str:
+        return f"<FuzzyIndex documents={len(self._documents)}>"
+
+    def get(self, key: str, /) -> str | None:
+        document = self._documents.get(key)
+        return document[0] if document else None
+
+    def set(self, key: str, text: str, /) -> None:
+        lowered = text.lower()
+        self._documents[key] = (text, lowered, _char_mask(lowered))
+        self._last_query = ""
+
+    def discard(self, key: str, /) -> None:
+        if self._documents.pop(key, None):
+            self._last_query = ""
+
+    def search(self, query: str, /, *, limit: int = 50) -> list[tuple[float, str, str]]:
+        """Return up to ``limit`` ``(score, key, text)`` matches for ``query``, best first.
+
+        Whitespace in the query is ignored, so ``"money 115"`` matches ``"PlayersMoney = 11573"``.
+        """
+        needle = "".join(query.lower().split())
+        if not needle:
+            return []
+
+        candidates = self._last_matches if self._last_query and needle.startswith(self._last_query) else self._documents
+        mask = _char_mask(needle)
+        matches: list[str] = []
+        hits: list[tuple[float, str, str]] = []
+        for key in candidates:
+            text, lowered, document_mask = self._documents[key]
+            if mask & ~document_mask:
+                continue
+            score = _fuzzy_score(needle, lowered)
+            if score:
+                matches.append(key)
+                hits.append((score, key, text))
+
+        self._last_query, self._last_matches = needle, matches
+        hits.sort(key=lambda hit: (-hit[0], hit[1]))
+        return hits[:limit]
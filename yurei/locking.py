@@ -0,0 +1,123 @@
+import collections
+import contextlib
+import logging
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator
+
+__all__ = ("LOCK_METRICS", "count_lock_metric", "save_lock")
+
+LOGGER = logging.getLogger(__name__)
+LOCK_TIMEOUT = 10.0
+LOCK_POLL_INTERVAL = 0.01
+# "acquired", "contended", "timeouts" and "wait_ns" per lock, and "conflicts" and "rebased" from `Save` writes
+LOCK_METRICS: Final[collections.Counter[str]] = collections.Counter()
+# `+=` on a counter is a read then a write, which threads without the GIL can interleave and lose counts in
+_METRICS_LOCK = threading.Lock()
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _try_lock(fd: int, /) -> bool:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _release(fd: int, lock_path: pathlib.Path, /) -> None:
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+        # open files can't be removed here, so this only succeeds when no other process is waiting on it
+        with contextlib.suppress(OSError):
+            lock_path.unlink()
+
+else:
+    import fcntl
+
+    def _try_lock(fd: int, /) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _release(fd: int, lock_path: pathlib.Path, /) -> None:
+        try:
+            # removed while still held, a waiter that then locks the removed file notices and starts over
+            with contextlib.suppress(FileNotFoundError):
+                lock_path.unlink()
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+def count_lock_metric(name: str, amount: int = 1, /) -> None:
+    with _METRICS_LOCK:
+        LOCK_METRICS[name] += amount
+
+
+def _is_current(fd: int, lock_path: pathlib.Path, /) -> bool:
+    try:
+        current = lock_path.stat()
+    except FileNotFoundError:
+        return False
+    locked = os.fstat(fd)
+    return (locked.st_dev, locked.st_ino) == (current.st_dev, current.st_ino)
+
+
+def _acquire(lock_path: pathlib.Path, path: pathlib.Path, /, *, timeout: float) -> int:
+    started: int | None = None
+    deadline = time.monotonic() + timeout
+    while True:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while not _try_lock(fd):
+                if started is None:
+                    count_lock_metric("contended")
+                    started = time.perf_counter_ns()
+                if time.monotonic() >= deadline:
+                    count_lock_metric("timeouts")
+                    msg = f"Timed out after {timeout}s waiting for another Yurei process to finish writing {path}."
+                    raise TimeoutError(msg)
+                time.sleep(LOCK_POLL_INTERVAL)
+            current = _is_current(fd, lock_path)
+        except BaseException:
+            os.close(fd)
+            raise
+
+        if current:
+            break
+        # its holder removed it while we waited, the lock is whichever file is there now
+        os.close(fd)
+
+    if started is not None:
+        waited = time.perf_counter_ns() - started
+        count_lock_metric("wait_ns", waited)
+        LOGGER.info("Waited %.1fms for the lock on %s", waited / 1e6, path)
+    count_lock_metric("acquired")
+    return fd
+
+
+@contextlib.contextmanager
+def save_lock(path: pathlib.Path, /, *, timeout: float = LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold an advisory lock on ``path`` for the duration of the block.
+
+    The lock lives on a sibling ``.yurei-lock`` file, removed again on release, so it is only honoured by other Yurei
+    processes; the game itself never takes it. An uncontended lock costs an open, a lock call, a stat and an unlink.
+    """
+    lock_path = path.with_name(path.name + ".yurei-lock")
+    fd = _acquire(lock_path, path, timeout=timeout)
+    try:
+        yield
+    finally:
+        _release(fd, lock_path)
@@ -0,0 +1,207 @@
+import hashlib
+import logging
+from typing import TYPE_CHECKING, Any, Literal, Self, cast
+
+from .enums import Equipment
+from .save import EQUIPMENT, EQUIPMENT_TIER_LOOKUP
+from .utils import from_json, to_json
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Mapping
+
+    from .save import Save
+
+__all__ = ("Recipe",)
+
+LOGGER = logging.getLogger(__name__)
+# stands in for every piece of equipment in `unlock_gear` and `inventory`
+ALL_EQUIPMENT = "*"
+UNLOCKABLE_FIELDS: tuple[str, ...] = ("completed", "received", "progression")
+# the keys each stat's setter writes, a save missing any of them can't take the stat
+STAT_KEYS: dict[str, tuple[str, ...]] = {
+    "prestige": ("Prestige", "PrestigeIndex"),
+    "level": ("Level", "NewLevel", "Experience"),
+    "money": ("PlayersMoney",),
+}
+# the TUI's bounds, money only can't be negative
+STAT_MAXIMUMS: dict[str, int | None] = {"prestige": 100, "level": 100, "money": None}
+
+
+def _check_amount(field: str, value: object, /, *, maximum: int | None = None) -> None:
+    # bools are ints to python, but a save with `true` for its money is broken
+    if type(value) is not int or value < 0 or (maximum is not None and value > maximum):
+        bounds = f"from 0 to {maximum}" if maximum is not None else "of 0 or more"
+        msg = f"{field} has to be a whole number {bounds}, not {value!r}."
+        raise ValueError(msg)
+
+
+def _equipment_mapping(field: str, data: Mapping[str, int], /) -> dict[str, int]:
+    ret: dict[str, int] = {}
+    for name, amount in data.items():
+        if name != ALL_EQUIPMENT:
+            try:
+                name = Equipment(name).value  # noqa: PLW2901 # normalised in place
+            except ValueError:
+                msg = f"Unknown equipment {name!r} in {field}."
+                raise ValueError(msg) from None
+        ret[name] = amount
+    return ret
+
+
+class Recipe:
+    """A stored set of edits, applied the same way the TUI applies them.
+
+    Recipes are JSON objects, e.g.::
+
+        {
+            "money": 250000, "prestige": 20, "level": 100,
+            "unlock_gear": {"*": 3}, "inventory": {"EMFReader": 6},
+            "unlockables": {"moneybags": {"completed": true, "received": true}},
+            "values": {"recentPlayerIDS": []}
+        }
+
+    ``"*"`` stands for every piece of equipment. Applying a recipe only touches what differs, so applying it twice
+    changes nothing the second time.
+    """
+
+    __slots__ = ("inventory", "level", "money", "prestige", "unlock_gear", "unlockables", "values")
+
+    FIELDS: tuple[str, ...] = ("money", "level", "prestige", "unlock_gear", "inventory", "unlockables", "values")
+
+    def __init__(
+        self,
+        *,
+        money: int | None = None,
+        level: int | None = None,
+        prestige: int | None = None,
+        unlock_gear: Mapping[str, int] | None = None,
+        inventory: Mapping[str, int] | None = None,
+        unlockables: Mapping[str, Mapping[str, bool | int]] | None = None,
+        values: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.money = money
+        self.level = level
+        self.prestige = prestige
+        self.unlock_gear = _equipment_mapping("unlock_gear", unlock_gear or {})
+        self.inventory = _equipment_mapping("inventory", inventory or {})
+        self.unlockables: dict[str, dict[str, bool | int]] = {
+            name: dict(state) for name, state in (unlockables or {}).items()
+        }
+        self.values: dict[str, Any] = dict(values or {})
+
+        # checked before any save sees the recipe, so a bad one fails once rather than once per save
+        for field, maximum in STAT_MAXIMUMS.items():
+            if (value := getattr(self, field)) is not None:
+                _check_amount(field, value, maximum=maximum)
+        for name, amount in self.inventory.items():
+            _check_amount(f"inventory[{name}]", amount)
+        for tier in self.unlock_gear.values():
+            if type(tier) is not int or tier not in EQUIPMENT_TIER_LOOKUP:
+                msg = f"Gear tiers are 1, 2 or 3, not {tier!r}."
+                raise ValueError(msg)
+        for name, state in self.unlockables.items():
+            unknown = state.keys() - set(UNLOCKABLE_FIELDS)
+            if unknown:
+                msg = f"Unknown fields for unlockable {name!r}: {', '.join(sorted(unknown))}."
+                raise ValueError(msg)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS if getattr(self, name))
+        return f"<Recipe {fields}>"
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any], /) -> Self:
+        if not isinstance(data, dict):
+            msg = "A recipe has to be a JSON object."
+            raise ValueError(msg)  # noqa: TRY004 # it is a value error to the caller, whatever the type
+        unknown = data.keys() - set(cls.FIELDS)
+        if unknown:
+            msg = f"Unknown recipe fields: {', '.join(sorted(unknown))}."
+            raise ValueError(msg)
+        return cls(**data)
+
+    @classmethod
+    def from_path(cls, path: pathlib.Path, /) -> Self:
+        return cls.from_mapping(from_json(path.read_bytes()))
+
+    def to_mapping(self) -> dict[str, Any]:
+        return {name: value for name in self.FIELDS if (value := getattr(self, name)) not in (None, {})}
+
+    def fingerprint(self) -> str:
+        """A short digest of the recipe, equal for recipes that make the same edits."""
+        return hashlib.blake2b(to_json(self.to_mapping()).encode(), digest_size=8).hexdigest()
+
+    def _apply_equipment(self, save: Save, /, applied: list[str]) -> None:
+        for name, tier in self.unlock_gear.items():
+            suffix = f"Tier{EQUIPMENT_TIER_LOOKUP[tier]}UnlockOwned"
+            keys = save.key_index.with_suffix(suffix) if name == ALL_EQUIPMENT else [name + suffix]
+            if not all(key in save for key in keys):
+                LOGGER.warning("Skipping unlocking %s at tier %s, it is not in %s", name, tier, save.save_path)
+                continue
+            if not all(save.get_value(key) for key in keys):
+                item = None if name == ALL_EQUIPMENT else Equipment(name)
+                # validated in `__init__`
+                save.unlock_equipment(item=item, tier=cast("Literal[1, 2, 3]", tier))
+                applied.append(f"unlock_gear[{name}]={tier}")
+
+        amounts: dict[str, int] = {}
+        if ALL_EQUIPMENT in self.inventory:
+            for key in save.key_index.with_suffix("Inventory"):
+                if (name := key.removesuffix("Inventory")) in EQUIPMENT:
+                    amounts[name] = self.inventory[ALL_EQUIPMENT]
+        # named equipment overrides "*", rather than the two overwriting each other on every apply
+        amounts.update((name, amount) for name, amount in self.inventory.items() if name != ALL_EQUIPMENT)
+        for name, amount in amounts.items():
+            key = name + "Inventory"
+            if key not in save:
+                LOGGER.warning("Skipping the inventory of %s, it is not in %s", name, save.save_path)
+                continue
+            if save.get_value(key) != amount:
+                save.add_equipment(item=Equipment(name), amount=amount)
+                applied.append(f"inventory[{name}]={amount}")
+
+    def _apply_unlockables(self, save: Save, /, applied: list[str]) -> None:
+        for name, state in self.unlockables.items():
+            if name not in save.unlockable_manager:
+                LOGGER.warning("Skipping the unlockable %r, it is not in %s", name, save.save_path)
+                continue
+            handler = save.unlockable_manager.get_handler(name)
+            for field, value in state.items():
+                current = getattr(handler, field)
+                if current != (bool(value) if isinstance(current, bool) else value):
+                    setattr(handler, field, value)
+                    applied.append(f"unlockables[{name}].{field}={value!r}")
+
+    def apply(self, save: Save, /) -> list[str]:
+        """Apply the edits to ``save`` and describe each one that changed something."""
+        applied: list[str] = []
+        # the level a save reports depends on its prestige, so prestige goes first
+        for field, keys in STAT_KEYS.items():
+            value = getattr(self, field)
+            if value is None:
+                continue
+            try:
+                current = getattr(save, field)
+            except KeyError:
+                current = None
+            # a save that never prestiged has no `Prestige` and is already at 0
+            if current == value:
+                continue
+            if not all(key in save for key in keys):
+                LOGGER.warning("Skipping %s, it is not in %s", field, save.save_path)
+                continue
+            setattr(save, field, value)
+            applied.append(f"{field}={value}")
+
+        self._apply_equipment(save, applied)
+        self._apply_unlockables(save, applied)
+
+        for key, value in self.values.items():
+            if key not in save:
+                LOGGER.warning("Skipping %r, it is not in %s", key, save.save_path)
+                continue
+            if save.get_value(key) != value:
+                save.set_value(key, value)
+                applied.append(f"{key}={value!r}")
+        return applied
@@ -1,21 +1,33 @@
+import asyncio
+import collections
 import datetime
+import functools
+import hashlib
 import logging
+import os
 import pathlib
-from typing import TYPE_CHECKING, Any, Final, Literal, Self, cast
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple, Self, cast
 
 from .crypt import decrypt, encrypt
 from .data import XPLevel
 from .enums import Equipment
+from .index import KeyIndex
+from .locking import count_lock_metric, save_lock
+from .schema import resolve_schema
 from .types_.save import Save as SaveType
-from .unlockable import UnlockableManager
+from .unlockable import UNLOCKABLE_SUFFIXES, UnlockableManager
 from .utils import MISSING, from_json, get_save_password, resolve_save_path, to_json
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
     from types import TracebackType
 
     from .unlockable import CURRENT_UNLOCKABLES, Achievement
 
-__all__ = ("Save",)
+__all__ = ("DiskState", "Save", "SaveConflictError")
 
 TEMP_FILE = pathlib.Path(__file__).parent.parent / ("./_previously_decrypted_file.json")
 LOGGER = logging.getLogger(__name__)
@@ -23,26 +35,141 @@ EQUIPMENT: set[str] = {e.value for e in Equipment}
 EQUIPMENT_TIER_LOOKUP: dict[int, str] = {1: "One", 2: "Two", 3: "Three"}
 CURRENT_SAVE_KEY = get_save_password(password_file=(pathlib.Path(__file__).parent.parent / "resources" / "save_password"))
 LEVEL_SCALES_FILE = pathlib.Path(__file__).parent.parent / "resources" / "levelscaling.json"
+# saves at or above this size are decrypted in a worker process rather than a thread
+LARGE_SAVE_THRESHOLD = 4 * 1024 * 1024
+# subscribing to this key is notified of every change
+ALL_KEYS: Final[str] = "*"
 
 
-class Save:
+class SaveConflictError(OSError):
+    """The save changed on disk since it was loaded, and :attr:`Save.on_conflict` is ``"fail"``."""
+
+
+class DiskState(NamedTuple):
+    """What a save file looked like when it was last read or written, to notice changes made by someone else."""
+
+    mtime_ns: int
+    size: int
+    digest: bytes
+
+    @staticmethod
+    def read(path: pathlib.Path, /) -> DiskState:
+        return _read_save(path)[1]
+
+    @staticmethod
+    def read_file(path: pathlib.Path, /) -> tuple[bytes, DiskState]:
+        """The file's contents along with its state, both from the same read."""
+        return _read_save(path)
+
+
+def _digest(data: bytes, /) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _read_save(path: pathlib.Path, /) -> tuple[bytes, DiskState]:
+    with path.open("rb") as fp:
+        stat = os.fstat(fp.fileno())
+        raw = fp.read()
+    return raw, DiskState(stat.st_mtime_ns, stat.st_size, _digest(raw))
+
+
+def _decrypt_save(path: pathlib.Path, /) -> tuple[SaveType, DiskState]:
+    raw, state = _read_save(path)
+    return decrypt(data=raw, password=CURRENT_SAVE_KEY, return_type=SaveType), state
+
+
+def _dump_decrypted(decrypted: bytes, /) -> None:
+    # staged per thread and renamed into place, so saves written concurrently never interleave within the dump
+    staging = TEMP_FILE.with_name(f"{TEMP_FILE.name}.{os.getpid()}-{threading.get_ident()}")
+    try:
+        staging.write_bytes(decrypted)
+        staging.replace(TEMP_FILE)
+    finally:
+        # only still there when the write or rename failed
+        staging.unlink(missing_ok=True)
+
+
+@functools.cache
+def _process_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=min(2, os.process_cpu_count() or 1))
+
+
+async def _decrypt_save_async(path: pathlib.Path, /) -> tuple[SaveType, DiskState]:
+    size = (await asyncio.to_thread(path.stat)).st_size
+    if size < LARGE_SAVE_THRESHOLD:
+        return await asyncio.to_thread(_decrypt_save, path)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_process_pool(), _decrypt_save, path)
+
+
+class Save:  # noqa: PLR0904 # this is the primary interface
     TUI_ALLOWED_OPERATIONS: Final[set[tuple[str, str]]] = {
         ("Unlock Gear", "unlock-gear"),
         ("Add Gear", "add-gear"),
         ("Edit Money", "edit-money"),
         ("Alter Prestige/Level", "alter-level"),
         ("Manage Unlockables", "manage-unlockables"),
+        ("Browse All Keys", "browse-keys"),
     }
 
-    __slots__ = ("_create_backup", "_data", "_written", "save_path", "unlockable_manager", "xp_manager")
-
-    def __init__(self, *, data: SaveType, path: pathlib.Path, create_backup: bool = True) -> None:
+    __slots__ = (
+        "_autosave",
+        "_autosave_at",
+        "_backed_up",
+        "_changed_keys",
+        "_create_backup",
+        "_data",
+        "_disk_state",
+        "_listeners",
+        "_version",
+        "_written",
+        "_written_digest",
+        "_written_version",
+        "key_index",
+        "last_backup",
+        "on_conflict",
+        "save_path",
+        "schema",
+        "unlockable_manager",
+        "write_counts",
+        "xp_manager",
+    )
+
+    def __init__(
+        self,
+        *,
+        data: SaveType,
+        path: pathlib.Path,
+        create_backup: bool = True,
+        disk_state: DiskState | None = None,
+        on_conflict: Literal["fail", "rebase"] = "fail",
+        key_index: KeyIndex | None = None,
+    ) -> None:
         self._data: SaveType = data
+        self._listeners: dict[str, list[Callable[[str], None]]] = {}
+        # given when it was built ahead of time, it has to index exactly the keys of `data`
+        self.key_index = key_index or KeyIndex(data)
+        self.schema = resolve_schema(self.key_index)
         self.unlockable_manager = UnlockableManager(self)
         self.xp_manager = XPLevel.from_file(LEVEL_SCALES_FILE)
         self.save_path = path
         self._create_backup = create_backup
         self._written: bool = False
+        # bumped by every change, compared against the version last written to skip writes that change nothing
+        self._version: int = 0
+        self._written_version: int = 0
+        self._written_digest: bytes | None = None
+        self._backed_up: bool = False
+        self.last_backup: pathlib.Path | None = None
+        self._autosave: asyncio.Task[pathlib.Path] | None = None
+        self._autosave_at: float = 0.0
+        # "requested", "written", "skipped" and "backups", for the lifetime of this save
+        self.write_counts: collections.Counter[str] = collections.Counter()
+        # the file as we last saw it, and the keys we changed since, for writing over a file that changed underneath us
+        self._disk_state = disk_state
+        self._changed_keys: set[str] = set()
+        self.on_conflict: Literal["fail", "rebase"] = on_conflict
 
     def __enter__(self) -> Self:
         return self
@@ -65,19 +192,26 @@ class Save:
 
     @classmethod
     def from_path(cls, path: pathlib.Path, *, create_backup: bool = True) -> Self:
-        data = path.read_bytes()
-
-        return cls(
-            data=decrypt(data=data, password=CURRENT_SAVE_KEY, return_type=SaveType), path=path, create_backup=create_backup
-        )
+        data, state = _decrypt_save(path)
+        return cls(data=data, path=path, create_backup=create_backup, disk_state=state)
 
     @classmethod
     def from_default_path(cls, *, create_backup: bool = True) -> Self:
-        path = resolve_save_path()
+        return cls.from_path(resolve_save_path(), create_backup=create_backup)
+
+    @classmethod
+    async def from_path_async(cls, path: pathlib.Path, *, create_backup: bool = True) -> Self:
+        """Load a save without blocking the event loop.
 
-        return cls(
-            data=decrypt(path=path, password=CURRENT_SAVE_KEY, return_type=SaveType), path=path, create_backup=create_backup
-        )
+        Cancelling the awaiting task abandons the load, the decrypted result of an in-flight worker is discarded.
+        """
+        data, state = await _decrypt_save_async(path)
+        # building the key index and schema is cheap, but not free enough for the loop
+        return await asyncio.to_thread(cls, data=data, path=path, create_backup=create_backup, disk_state=state)
+
+    @classmethod
+    async def from_default_path_async(cls, *, create_backup: bool = True) -> Self:
+        return await cls.from_path_async(resolve_save_path(), create_backup=create_backup)
 
     def create_backup(self) -> pathlib.Path:
         now = datetime.datetime.now(datetime.UTC)
@@ -87,16 +221,64 @@ class Save:
             backup_path.unlink(missing_ok=True)
 
         LOGGER.info("Creating backup at %r", str(backup_path))
-        return self.save_path.copy(backup_path)
+        self.last_backup = self.save_path.copy(backup_path)
+        self._backed_up = True
+        self.write_counts["backups"] += 1
+        return self.last_backup
+
+    async def create_backup_async(self) -> pathlib.Path:
+        return await asyncio.to_thread(self.create_backup)
 
     def _has_value(self, key: str) -> bool:
-        return key in self._data
+        return key in self.key_index
+
+    def _pop_value(self, key: str) -> None:
+        self._data.pop(key, None)
+        self.key_index.discard(key)
+        self._notify(key)
+
+    def subscribe(self, callback: Callable[[str], None], /, *keys: str) -> Callable[[], None]:
+        """Call ``callback`` with the changed key whenever one of ``keys``, or any key if none are given, changes.
+
+        Callbacks run on whichever thread made the change. Returns a function that removes the subscription.
+        """
+        targets = keys or (ALL_KEYS,)
+        for key in targets:
+            self._listeners.setdefault(key, []).append(callback)
+
+        def unsubscribe() -> None:
+            for key in targets:
+                listeners = self._listeners.get(key, [])
+                if callback in listeners:
+                    listeners.remove(callback)
+
+        return unsubscribe
+
+    def _notify(self, key: str, /) -> None:
+        self._version += 1
+        self._changed_keys.add(key)
+        # copied, so a callback may unsubscribe while we iterate
+        for callback in (*self._listeners.get(key, ()), *self._listeners.get(ALL_KEYS, ())):
+            callback(key)
+
+    @property
+    def entries(self) -> MappingProxyType[str, Any]:
+        """A read-only view of the raw ``{"__type": ..., "value": ...}`` entries, keyed by save key."""
+        return MappingProxyType(self._data)
+
+    def find_keys(self, pattern: str, /) -> list[str]:
+        return self.key_index.matching(pattern)
 
     def get_value[T: Any = Any](self, key: str, _: type[T] = MISSING, *, default: T = MISSING) -> T:
         if default is not MISSING:
             return cast("T", self._data.get(key, {}).get("value", default))
         return cast("T", self._data[key]["value"])
 
+    def set_value(self, key: str, value: Any, /) -> None:
+        LOGGER.info("Setting %r to %r", key, value)
+        self._data[key]["value"] = value
+        self._notify(key)
+
     @property
     def level(self) -> int:
         if self.prestige >= 1:
@@ -113,6 +295,9 @@ class Save:
         else:
             self._data["Level"]["value"] = 100
             self._data["NewLevel"]["value"] = value
+            self._notify("Level")
+        self._notify("Experience")
+        self._notify("NewLevel")
 
     @property
     def prestige(self) -> int:
@@ -122,11 +307,13 @@ class Save:
     def prestige(self, value: int) -> None:
         LOGGER.info("Setting prestige to %s", value)
         if value == 0:
-            self._data.pop("Prestige", 0)
-            self._data.pop("PrestigeIndex", 0)
+            self._pop_value("Prestige")
+            self._pop_value("PrestigeIndex")
         else:
             self._data["Prestige"]["value"] = value
             self._data["PrestigeIndex"]["value"] = value
+            self._notify("Prestige")
+            self._notify("PrestigeIndex")
 
     @property
     def money(self) -> int:
@@ -136,10 +323,14 @@ class Save:
     def money(self, value: int) -> None:
         LOGGER.info("Setting money to %s", value)
         self._data["PlayersMoney"]["value"] = value
+        self._notify("PlayersMoney")
 
     def _do_unlock(self, *, formatted_string: str, bulk: bool) -> None:
-        LOGGER.info("%sUnlocking %r", "BULK: " if bulk else "", formatted_string)
+        # bulk callers log once for the lot, every record takes the handler's lock, which threads would queue on
+        if not bulk:
+            LOGGER.info("Unlocking %r", formatted_string)
         self._data[formatted_string]["value"] = True
+        self._notify(formatted_string)
 
     def unlock_equipment(self, *, item: Equipment | None = None, tier: Literal[1, 2, 3]) -> None:
         fmt = EQUIPMENT_TIER_LOOKUP[tier]
@@ -149,62 +340,247 @@ class Save:
             self._do_unlock(formatted_string=to_unlock, bulk=False)
             return
 
-        for equipment in EQUIPMENT:
-            to_unlock = f"{equipment}{tier_str}"
+        keys = self.key_index.with_suffix(tier_str)
+        LOGGER.info("BULK: Unlocking %s items at tier %s", len(keys), tier)
+        for to_unlock in keys:
             self._do_unlock(formatted_string=to_unlock, bulk=True)
 
-    def _do_add_equipment(self, item: str, amount: int, *, bulk: bool) -> None:
-        LOGGER.info("%sAdding %sx %r", "BULK: " if bulk else "", item, amount)
-        self._data[item + "Inventory"]["value"] = amount
+    def _do_add_equipment(self, key: str, amount: int, *, bulk: bool) -> None:
+        if not bulk:
+            LOGGER.info("Adding %sx %r", amount, key)
+        self._data[key]["value"] = amount
+        self._notify(key)
 
     def add_equipment(self, *, item: Equipment | None = None, amount: int) -> None:
         if item:
-            self._do_add_equipment(item, amount, bulk=False)
+            self._do_add_equipment(item + "Inventory", amount, bulk=False)
             return
-        for equipment in EQUIPMENT:
-            self._do_add_equipment(equipment, amount, bulk=True)
+        keys = [key for key in self.key_index.with_suffix("Inventory") if key.removesuffix("Inventory") in EQUIPMENT]
+        LOGGER.info("BULK: Adding %sx of %s items", amount, len(keys))
+        for key in keys:
+            self._do_add_equipment(key, amount, bulk=True)
 
     def has_unlockable_(self, name: str) -> bool:
-        keys = [f"{name}{progress}" for progress in ["Completed", "Progression", "Received"]]
-
-        return any(key in self._data for key in keys)
+        return any(key.removeprefix(name) in UNLOCKABLE_SUFFIXES for key in self.key_index.with_prefix(name))
 
     def manage_unlockable(self, unlockable: CURRENT_UNLOCKABLES) -> Achievement:
-        return getattr(self.unlockable_manager, unlockable)
+        return self.unlockable_manager.get_handler(unlockable)
+
+    def validate(self) -> list[str]:
+        return self.schema.validate(self._data)
 
     def to_json_string(self) -> str:
         return to_json(self._data)
 
     def from_json_string(self, input_: str, /) -> None:
-        self._data = from_json(input_)
+        self._replace_data(from_json(input_))
+
+    def _replace_data(self, data: SaveType, /) -> set[str]:
+        previous = self._data
+        self._data = data
+        self.key_index = KeyIndex(self._data)
+        self.schema = resolve_schema(self.key_index)
+        changed = {key for key in previous.keys() | data.keys() if previous.get(key) != data.get(key)}
+        for key in changed:
+            self._notify(key)
+        return changed
+
+    def update_entries(self, changed: Mapping[str, Any], removed: Iterable[str] = (), /) -> None:
+        """Replace whole ``{"__type": ..., "value": ...}`` entries, adding or removing keys as needed."""
+        for key in removed:
+            self._pop_value(key)
+        for key, entry in changed.items():
+            self._data[key] = entry
+            self.key_index.add(key)
+        self.schema = resolve_schema(self.key_index)
+        for key in changed:
+            self._notify(key)
 
     def _merge_unlockables(self) -> None:
-        for attr in self.unlockable_manager.__slots__:
-            if attr.startswith("_") or attr not in self.unlockable_manager:
-                continue
-
-            unlockable = self.unlockable_manager.get_handler(attr)  # pyright: ignore[reportArgumentType] # our slots are the literal
+        for unlockable in self.unlockable_manager.pop_dirty():
             unlockable_data = unlockable.to_data()
             LOGGER.info("UNLOCKABLE: Merging %r", unlockable)
             self._data.update(unlockable_data)  # pyright: ignore[reportArgumentType, reportCallIssue] # our keys match but we can't narrow, alas
+            for key in unlockable_data:
+                self.key_index.add(key)
+                self._notify(key)
 
-    def write(self) -> pathlib.Path:
-        from . import CURRENT_SAVE_KEY  # noqa: PLC0415 # cyclic circumvention
+    @property
+    def disk_state(self) -> DiskState | None:
+        """The file as it was last read or written, if this save came from disk."""
+        return self._disk_state
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything was edited since the save was loaded or last written."""
+        return self._version != self._written_version or self.unlockable_manager.has_dirty()
+
+    def _begin_write(self) -> int | None:
+        """Merge pending unlockable edits and return the version to write, or ``None`` when there is nothing to write.
+
+        Changes the save and notifies subscribers, so it runs on the caller's thread.
+        """
+        if not self.has_changes:
+            return None
 
         # merge unlockables
         self._merge_unlockables()
+        return self._version
+
+    def _encode(self, version: int, /) -> tuple[bytes, int, bytes] | None:
+        """Validate and encrypt the data as of ``version``, ``None`` when it matches what was last written.
+
+        Only reads the save, so it is safe to run in a worker thread.
+        """
+        errors = self.validate()
+        if errors:
+            raise ValueError(f"Refusing to write an invalid save to {self.save_path}:\n" + "\n".join(errors))
 
         decrypted = to_json(self._data).encode()
-        with TEMP_FILE.open("wb") as fp:
-            fp.write(decrypted)
+        digest = hashlib.blake2b(decrypted, digest_size=16).digest()
+        if digest == self._written_digest:
+            return None
 
-        encrypted = encrypt(data=decrypted, password=CURRENT_SAVE_KEY)
+        _dump_decrypted(decrypted)
 
-        self.create_backup()
+        return encrypt(data=decrypted, password=CURRENT_SAVE_KEY), version, digest
 
-        with self.save_path.open("wb") as fp:
-            fp.write(encrypted)
+    def _prepare_write(self) -> tuple[bytes, int, bytes] | None:
+        version = self._begin_write()
+        if version is None:
+            return None
 
+        prepared = self._encode(version)
+        if not prepared:
+            # edited back to what was last written
+            self._written_version = version
+        return prepared
+
+    def _skip_write(self) -> pathlib.Path:
         self._written = True
+        self.write_counts["skipped"] += 1
+        LOGGER.info("Nothing changed since the last write, leaving %s untouched", self.save_path.absolute())
+        return self.save_path
+
+    def _disk_changed(self) -> bool:
+        expected = self._disk_state
+        if not expected:
+            return False
+        try:
+            stat = self.save_path.stat()
+        except FileNotFoundError:
+            return True
+        if (stat.st_mtime_ns, stat.st_size) == (expected.mtime_ns, expected.size):
+            return False
+        # touched, but not necessarily rewritten
+        return _digest(self.save_path.read_bytes()) != expected.digest
+
+    def _rebase(self, theirs: SaveType, state: DiskState, /) -> None:
+        """Take the save read from disk and replay the keys we changed on top of it, ours win where both sides changed.
+
+        Swaps the data and notifies subscribers, so it runs on the caller's thread.
+        """
+        count_lock_metric("rebased")
+        for key in self._changed_keys:
+            if key in self._data:
+                theirs[key] = self._data[key]
+            else:
+                theirs.pop(key, None)
+
+        ours = self._changed_keys
+        self._replace_data(theirs)
+        self._changed_keys = ours
+        self._disk_state = state
+        # anything we wrote before is gone from disk now
+        self._written_digest = None
+        LOGGER.info("Rebased %d changed keys onto the newer %s", len(ours), self.save_path)
+
+    def _commit_write(self, prepared: tuple[bytes, int, bytes], /) -> pathlib.Path | None:
+        """Swap ``prepared`` in, or return ``None`` when the file changed and has to be rebased onto first.
+
+        Only reads the save until the swap, so it is safe to run in a worker thread.
+        """
+        # other Yurei processes wait here, anything else writing the file is caught by the state check
+        with save_lock(self.save_path):
+            if self._disk_changed():
+                count_lock_metric("conflicts")
+                if self.on_conflict == "fail":
+                    msg = f"{self.save_path} changed on disk since it was loaded, reload it before saving."
+                    raise SaveConflictError(msg)
+                # rebasing swaps the data under the caller, so it is left to the caller's thread
+                return None
+
+            return self._replace_file(prepared)
+
+    def _replace_file(self, prepared: tuple[bytes, int, bytes], /) -> pathlib.Path:
+        encrypted, version, digest = prepared
+        # the first backup of a session keeps the original, later writes only replace our own output
+        if self._create_backup and not self._backed_up:
+            self.create_backup()
+
+        # write beside the save and swap it in, so an interrupted write never leaves a truncated save
+        staging_path = self.save_path.with_name(self.save_path.name + ".yurei-tmp")
+        try:
+            with staging_path.open("wb") as fp:
+                fp.write(encrypted)
+                fp.flush()
+                stat = os.fstat(fp.fileno())
+            staging_path.replace(self.save_path)
+        finally:
+            # only still there when the write or swap failed, the save itself is untouched then
+            staging_path.unlink(missing_ok=True)
+
+        self._written = True
+        self._written_version, self._written_digest = version, digest
+        self._disk_state = DiskState(stat.st_mtime_ns, stat.st_size, _digest(encrypted))
+        self._changed_keys.clear()
+        self.write_counts["written"] += 1
         LOGGER.info("Written to %s", self.save_path.absolute())
         return self.save_path
+
+    def write(self) -> pathlib.Path:
+        self.write_counts["requested"] += 1
+        while prepared := self._prepare_write():
+            if written := self._commit_write(prepared):
+                return written
+            self._rebase(*_decrypt_save(self.save_path))
+        return self._skip_write()
+
+    async def write_async(self) -> pathlib.Path:
+        """Write the save without blocking the event loop.
+
+        Cancelling before the encrypted payload is ready leaves the file on disk untouched,
+        once the backup and swap have started they are shielded and run to completion.
+        A save that changed on disk is read in a thread and rebased onto here, on the loop.
+        """
+        self.write_counts["requested"] += 1
+        while (version := self._begin_write()) is not None:
+            prepared = await asyncio.to_thread(self._encode, version)
+            if not prepared:
+                # edited back to what was last written
+                self._written_version = version
+                break
+            if written := await asyncio.shield(asyncio.to_thread(self._commit_write, prepared)):
+                return written
+            self._rebase(*await asyncio.to_thread(_decrypt_save, self.save_path))
+        return self._skip_write()
+
+    def schedule_write(self, delay: float, /) -> asyncio.Task[pathlib.Path]:
+        """Write once ``delay`` seconds pass without another call, so a burst of edits costs a single write.
+
+        Every call in the same burst returns the same task.
+        """
+        loop = asyncio.get_running_loop()
+        self._autosave_at = loop.time() + delay
+        if not self._autosave:
+            self._autosave = loop.create_task(self._write_when_idle())
+        return self._autosave
+
+    async def _write_when_idle(self) -> pathlib.Path:
+        loop = asyncio.get_running_loop()
+        while (remaining := self._autosave_at - loop.time()) > 0:  # noqa: ASYNC110 # each edit moves the deadline
+            await asyncio.sleep(remaining)
+
+        # edits from here on start a new burst, the write below may already have read past them
+        self._autosave = None
+        return await self.write_async()
@@ -0,0 +1,122 @@
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Self
+
+from .index import KeyIndex
+from .types_.save import Save as SaveType
+from .types_.schemas import SCHEMA_MODULES
+from .types_.validator import validate_save
+from .unlockable import discover_unlockables
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from types import ModuleType
+
+__all__ = ("CURRENT_SCHEMA", "SCHEMAS", "SaveSchema", "resolve_schema")
+
+LOGGER = logging.getLogger(__name__)
+# unseen layouts remembered at once, the daemons can be shown any number of them over their lifetime
+MAX_UNSEEN_LAYOUTS = 64
+
+
+class SaveSchema:
+    __slots__ = ("equipment", "fingerprints", "keys", "layout_unlockables", "name", "unlockables", "validate")
+
+    def __init__(
+        self,
+        name: str,
+        /,
+        *,
+        keys: frozenset[str],
+        fingerprints: frozenset[str],
+        equipment: tuple[str, ...],
+        unlockables: tuple[str, ...],
+        layout_unlockables: Mapping[str, tuple[str, ...]],
+        validate: Callable[[Mapping[str, Any]], list[str]],
+    ) -> None:
+        self.name = name
+        self.keys = keys
+        self.fingerprints = fingerprints
+        self.equipment = equipment
+        self.unlockables = unlockables
+        # fingerprint -> unlockables, for each of the layouts in `fingerprints`
+        self.layout_unlockables = layout_unlockables
+        self.validate = validate
+
+    def __repr__(self) -> str:
+        return f"<SaveSchema name={self.name!r} keys={len(self.keys)}>"
+
+    @classmethod
+    def from_module(cls, module: ModuleType, /) -> Self:
+        return cls(
+            module.NAME,
+            keys=module.KEYS,
+            fingerprints=module.FINGERPRINTS,
+            equipment=module.EQUIPMENT,
+            unlockables=module.UNLOCKABLES,
+            layout_unlockables=module.UNLOCKABLES_BY_FINGERPRINT,
+            validate=module.validate_save,
+        )
+
+    def distance(self, index: KeyIndex, /) -> int:
+        return sum(key not in self.keys for key in index) + sum(key not in index for key in self.keys)
+
+    def unlockables_of(self, index: KeyIndex, /) -> Sequence[str]:
+        """The data key of every unlockable within ``index``, looked up rather than searched for on a known layout."""
+        try:
+            return self.layout_unlockables[index.fingerprint()]
+        except KeyError:
+            return discover_unlockables(index)
+
+
+SCHEMAS: tuple[SaveSchema, ...] = tuple(SaveSchema.from_module(module) for module in SCHEMA_MODULES)
+
+
+def _current_schema() -> SaveSchema:
+    if SCHEMAS:
+        return SCHEMAS[-1]
+
+    # no registered versions, fall back to the unversioned `Save` TypedDict
+    keys = frozenset(SaveType.__annotations__)
+    index = KeyIndex(keys)
+    unlockables = tuple(discover_unlockables(index))
+    return SaveSchema(
+        "current",
+        keys=keys,
+        fingerprints=frozenset({index.fingerprint()}),
+        equipment=tuple(key.removesuffix("TierOneUnlockOwned") for key in index.with_suffix("TierOneUnlockOwned")),
+        unlockables=unlockables,
+        layout_unlockables={index.fingerprint(): unlockables},
+        validate=validate_save,
+    )
+
+
+CURRENT_SCHEMA: SaveSchema = _current_schema()
+_FINGERPRINT_LOOKUP: dict[str, SaveSchema] = {
+    fingerprint: schema for schema in (SCHEMAS or (CURRENT_SCHEMA,)) for fingerprint in schema.fingerprints
+}
+# in the order they were matched, saves are edited from many threads at once
+_UNSEEN_LOOKUP: dict[str, SaveSchema] = {}
+_UNSEEN_LOCK = threading.Lock()
+
+
+def resolve_schema(index: KeyIndex, /) -> SaveSchema:
+    fingerprint = index.fingerprint()
+    try:
+        return _FINGERPRINT_LOOKUP[fingerprint]
+    except KeyError:
+        pass
+
+    with _UNSEEN_LOCK:
+        schema = _UNSEEN_LOOKUP.get(fingerprint)
+    if schema:
+        return schema
+
+    # an unseen key layout, so find the closest known schema and remember it for a while
+    schema = min(reversed(SCHEMAS or (CURRENT_SCHEMA,)), key=lambda schema: schema.distance(index))
+    LOGGER.info("Matched unseen save layout %s to schema %r", fingerprint, schema.name)
+    with _UNSEEN_LOCK:
+        _UNSEEN_LOOKUP[fingerprint] = schema
+        if len(_UNSEEN_LOOKUP) > MAX_UNSEEN_LAYOUTS:
+            del _UNSEEN_LOOKUP[next(iter(_UNSEEN_LOOKUP))]
+    return schema
@@ -0,0 +1,193 @@
+"""Decoded saves shared between processes, so ``yurei-web`` sessions viewing the same file hold it once.
+
+A snapshot of a save is its entries as compact JSON plus its key index's suffix table, written once into a named
+:mod:`multiprocessing.shared_memory` segment by whichever session decrypts that version of the file first. Later
+sessions skip the decrypt and the index build: they parse their own entries, which they are free to edit, and their
+key index reads the shared suffix table until their first added or removed key copies it.
+
+Enabled by ``YUREI_SHARED_SAVES``, a directory in which each path's current segment is recorded so it can be
+removed once the file changes, and all of them when the server stops. ``yurei-web`` sets it up.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import struct
+from collections.abc import Sequence
+from itertools import starmap
+from multiprocessing.shared_memory import SharedMemory
+from typing import overload
+
+from .crypt import decrypt
+from .index import KeyIndex
+from .save import CURRENT_SAVE_KEY, DiskState, Save
+from .types_.save import Save as SaveType
+from .utils import from_json, resolve_save_path
+
+__all__ = ("SHARED_SAVES_DIRECTORY", "load_shared", "open_save", "unlink_segments")
+
+LOGGER = logging.getLogger(__name__)
+SHARED_SAVES_DIRECTORY = os.getenv("YUREI_SHARED_SAVES")
+MAGIC = b"YUREISV1"
+# magic, entries size, keys size, key count, suffix count, then a digest of everything after the header
+HEADER = struct.Struct("=8sIIII16s")
+SUFFIX = struct.Struct("=II")
+
+
+def _digest(data: bytes | memoryview, /) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _segment_name(directory: str, path: pathlib.Path, state: DiskState, /) -> str:
+    # short enough for macOS, which caps names at 31 characters
+    return "yurei-" + hashlib.blake2b(f"{directory}\0{path}".encode() + state.digest, digest_size=10).hexdigest()
+
+
+class _SharedSuffixes(Sequence[tuple[str, str]]):
+    """The ``(suffix, key)`` pairs of a shared suffix table, built on access and never kept."""
+
+    __slots__ = ("_count", "_keys", "_segment", "_start")
+
+    def __init__(self, segment: SharedMemory, start: int, count: int, keys: list[str], /) -> None:
+        # held for as long as an index reads from it, the mapping goes with the last reader
+        self._segment = segment
+        self._start = start
+        self._count = count
+        # the key index's own list, positions in the table are positions in the keys as they were shared
+        self._keys = tuple(keys)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, idx: int, /) -> tuple[str, str]: ...
+    @overload
+    def __getitem__(self, idx: slice, /) -> list[tuple[str, str]]: ...
+    def __getitem__(self, idx: int | slice, /) -> tuple[str, str] | list[tuple[str, str]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._count))]
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError(idx)
+        position, offset = SUFFIX.unpack_from(self._segment.buf, self._start + idx * SUFFIX.size)
+        key = self._keys[position]
+        return key[offset:], key
+
+
+def _encode(data: SaveType, index: KeyIndex, /) -> bytes:
+    entries = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+    keys = "\0".join(index).encode()
+    # padded, so the table's integers are aligned
+    padding = b"\0" * (-(len(entries) + len(keys)) % SUFFIX.size)
+    body = b"".join((entries, keys, padding, *starmap(SUFFIX.pack, index.suffix_table())))
+    suffixes = (len(body) - len(entries) - len(keys) - len(padding)) // SUFFIX.size
+    return HEADER.pack(MAGIC, len(entries), len(keys), len(index), suffixes, _digest(body)) + body
+
+
+def _decode(segment: SharedMemory, /) -> tuple[SaveType, KeyIndex] | None:
+    buf = segment.buf
+    magic, entries_size, keys_size, key_count, suffixes, digest = HEADER.unpack_from(buf)
+    start = HEADER.size + entries_size + keys_size
+    start += -(entries_size + keys_size) % SUFFIX.size
+    end = start + suffixes * SUFFIX.size
+    # a segment is only complete once its digest matches, until then it may still be being written
+    if magic != MAGIC or end > len(buf) or _digest(buf[HEADER.size : end]) != digest:
+        return None
+
+    data: SaveType = from_json(bytes(buf[HEADER.size : HEADER.size + entries_size]))
+    raw_keys = bytes(buf[HEADER.size + entries_size : HEADER.size + entries_size + keys_size]).decode()
+    keys = raw_keys.split("\0") if key_count else []
+    return data, KeyIndex.from_suffix_table(keys, _SharedSuffixes(segment, start, suffixes, keys))
+
+
+def _record(directory: str, path: pathlib.Path, name: str, /) -> None:
+    """Note ``name`` as the current segment of ``path``, removing the one it replaces."""
+    registry = pathlib.Path(directory, hashlib.blake2b(str(path).encode(), digest_size=10).hexdigest())
+    with contextlib.suppress(FileNotFoundError):
+        previous = registry.read_text(encoding="ascii")
+        if previous != name:
+            # sessions that mapped it keep their mapping, only the name goes
+            _unlink(previous)
+
+    staging = registry.with_name(f"{registry.name}.{os.getpid()}")
+    staging.write_text(name, encoding="ascii")
+    staging.replace(registry)
+
+
+def _unlink(name: str, /) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        segment = SharedMemory(name, track=False)
+        segment.close()
+        segment.unlink()
+
+
+def _publish(name: str, data: SaveType, index: KeyIndex, /) -> None:
+    payload = _encode(data, index)
+    try:
+        segment = SharedMemory(name, create=True, size=len(payload), track=False)
+    except FileExistsError:
+        # another session decrypted the same version at the same time, theirs will do
+        return
+    try:
+        segment.buf[: len(payload)] = payload
+    finally:
+        segment.close()
+
+
+def load_shared(path: pathlib.Path, /, *, create_backup: bool = True) -> Save:
+    """Load the save at ``path`` from its shared snapshot, decrypting and sharing it first if nobody has yet.
+
+    Blocks, so call it off the event loop. Requires ``YUREI_SHARED_SAVES``.
+    """
+    directory = SHARED_SAVES_DIRECTORY
+    if not directory:
+        msg = "Sharing saves needs YUREI_SHARED_SAVES to name a directory."
+        raise RuntimeError(msg)
+
+    path = path.expanduser().resolve()
+    raw, state = DiskState.read_file(path)
+    name = _segment_name(directory, path, state)
+    try:
+        segment = SharedMemory(name, track=False)
+    except FileNotFoundError:
+        decoded = None
+    else:
+        decoded = _decode(segment)
+        if not decoded:
+            segment.close()
+
+    if decoded:
+        data, index = decoded
+        LOGGER.debug("Loaded %s from shared memory segment %s", path, name)
+    else:
+        data = decrypt(data=raw, password=CURRENT_SAVE_KEY, return_type=SaveType)
+        index = KeyIndex(data)
+        _publish(name, data, index)
+        _record(directory, path, name)
+        LOGGER.debug("Shared %s as shared memory segment %s", path, name)
+
+    return Save(data=data, path=path, create_backup=create_backup, disk_state=state, key_index=index)
+
+
+async def open_save(path: pathlib.Path | None = None, /, *, create_backup: bool = True) -> Save:
+    """Load the save at ``path``, or the default save, through shared memory when ``YUREI_SHARED_SAVES`` is set."""
+    if not SHARED_SAVES_DIRECTORY:
+        if path:
+            return await Save.from_path_async(path, create_backup=create_backup)
+        return await Save.from_default_path_async(create_backup=create_backup)
+    return await asyncio.to_thread(load_shared, path or resolve_save_path(), create_backup=create_backup)
+
+
+def unlink_segments(directory: pathlib.Path, /) -> int:
+    """Remove every segment recorded in ``directory``, for when nothing will read them again. Returns how many."""
+    removed = 0
+    for registry in directory.iterdir():
+        with contextlib.suppress(OSError, ValueError):
+            _unlink(registry.read_text(encoding="ascii"))
+            removed += 1
+    return removed
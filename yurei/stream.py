@@ -0,0 +1,139 @@
+import collections
+import json
+import os
+import pathlib
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from .crypt import decrypt, decrypt_text, encrypt
+from .save import CURRENT_SAVE_KEY
+from .utils import from_json
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import BinaryIO
+
+__all__ = ("decrypt_paths", "decrypt_stream", "encrypt_stream")
+
+# paths decrypted ahead of the one being written, per worker; a slow reader stalls the workers at this depth
+RECORDS_IN_FLIGHT_PER_JOB = 4
+
+
+def _dumps(obj: Any, /) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def decrypt_stream(src: BinaryIO, dst: BinaryIO, /, *, strip_types: bool = False) -> None:
+    """Decrypt the save read from ``src`` and write its JSON to ``dst``."""
+    raw = src.read()
+    if strip_types:
+        text = _dumps(decrypt(data=raw, password=CURRENT_SAVE_KEY, strip_type_key=True))
+    else:
+        # written out as the game wrote it, there is nothing to gain from parsing it
+        text = decrypt_text(raw, password=CURRENT_SAVE_KEY)
+    dst.write(text.encode())
+
+
+def encrypt_stream(src: BinaryIO, dst: BinaryIO, /) -> None:
+    """Encrypt the JSON read from ``src`` into a save written to ``dst``. Refuses anything that isn't a JSON object."""
+    raw = src.read()
+    if not isinstance(from_json(raw), dict):
+        msg = "A save has to be a JSON object."
+        raise ValueError(msg)  # noqa: TRY004 # it is a value error to the caller, whatever the type
+    dst.write(encrypt(data=raw, password=CURRENT_SAVE_KEY))
+
+
+def _record(path: str, /, *, strip_types: bool) -> tuple[bool, str]:
+    try:
+        raw = pathlib.Path(path).read_bytes()
+        if strip_types:
+            data = _dumps(decrypt(data=raw, password=CURRENT_SAVE_KEY, strip_type_key=True))
+        else:
+            data = decrypt_text(raw, password=CURRENT_SAVE_KEY)
+            if "\n" in data:
+                # saves Yurei wrote are indented, a record has to fit on one line
+                data = _dumps(from_json(data))
+    except (OSError, ValueError, UnicodeDecodeError) as err:
+        return False, _dumps({"path": path, "error": f"{type(err).__name__}: {err}"})
+    # spliced rather than parsed and dumped again, the save is already valid JSON
+    return True, f'{{"path":{_dumps(path)},"data":{data}}}'
+
+
+type _WindowItem = Future[tuple[bool, str]] | Exception | None
+
+
+def _submit_paths(
+    paths: Iterable[str],
+    executor: ProcessPoolExecutor,
+    window: queue.Queue[_WindowItem],
+    stop: threading.Event,
+    /,
+    *,
+    strip_types: bool,
+) -> None:
+    try:
+        for path in paths:
+            if stop.is_set():
+                break
+            window.put(executor.submit(_record, path, strip_types=strip_types))
+    except Exception as err:  # noqa: BLE001 # handed to the consumer, which raises it
+        window.put(err)
+    finally:
+        window.put(None)
+
+
+def _records(paths: Iterable[str], /, *, strip_types: bool, jobs: int) -> Iterator[tuple[bool, str]]:
+    if jobs == 1:
+        for path in paths:
+            yield _record(path, strip_types=strip_types)
+        return
+
+    # a bounded window of futures, in input order: once it is full the reader thread stops reading paths until the
+    # oldest record is written out, so a slow consumer holds back the workers and the producer instead of piling up
+    # records. Paths are read in their own thread, so a finished record never waits on the producer's next path.
+    window: queue.Queue[_WindowItem] = queue.Queue(maxsize=jobs * RECORDS_IN_FLIGHT_PER_JOB)
+    stop = threading.Event()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        reader = threading.Thread(
+            target=_submit_paths,
+            args=(paths, executor, window, stop),
+            kwargs={"strip_types": strip_types},
+            name="yurei-ndjson-paths",
+            # it may be blocked reading a pipe nobody will write to again
+            daemon=True,
+        )
+        reader.start()
+        try:
+            while (item := window.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item.result()
+        finally:
+            stop.set()
+            # stopped early, e.g by a closed pipe: unblock the reader and drop the records nobody will read
+            while True:
+                try:
+                    item = window.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, Future):
+                    item.cancel()
+
+
+def decrypt_paths(
+    paths: Iterable[str], dst: BinaryIO, /, *, strip_types: bool = False, jobs: int | None = None
+) -> collections.Counter[str]:
+    """Write a line of JSON to ``dst`` per save in ``paths``, either ``{"path", "data"}`` or ``{"path", "error"}``.
+
+    Records keep the order of ``paths``, which is consumed lazily, so it can be a pipe that is still being written to.
+    Returns how many ``"records"`` and ``"errors"`` were written.
+    """
+    counts: collections.Counter[str] = collections.Counter()
+    jobs = max(1, jobs or os.process_cpu_count() or 1)
+    for ok, record in _records(paths, strip_types=strip_types, jobs=jobs):
+        dst.write(record.encode() + b"\n")
+        dst.flush()
+        counts["records" if ok else "errors"] += 1
+    return counts
@@ -1,3 +1,9 @@
+import os
+
+# textual reads its frame rate on import, and textual-serve asks for 60 per second
+if os.getenv("YUREI_LOW_BANDWIDTH", "0") not in {"", "0"}:
+    os.environ["TEXTUAL_FPS"] = os.getenv("YUREI_LOW_BANDWIDTH_FPS", "10")
+
 from .app import YureiApp
 
 __all__ = ("YureiApp",)
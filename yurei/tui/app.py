@@ -1,25 +1,37 @@
+import asyncio
+import functools
+import os
 import pathlib
+import time
 from typing import TYPE_CHECKING, ClassVar
 
-from textual import on
+from textual import events, on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.command import CommandPalette
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.css.query import NoMatches
 from textual.widgets import (
+    DataTable,
     DirectoryTree,
     Footer,
     Header,
     Input,
     RadioButton,
     RadioSet,
+    TextArea,
 )
+from textual.worker import Worker, WorkerState
 
 from yurei.save import EQUIPMENT, Save
+from yurei.shared import open_save
 
 from .widgets.add_gear import AddGearGrid
-from .widgets.code_editor import CodeEditor
-from .widgets.file_browser import PathInputBrowser, SafeDirectoryTree
+from .widgets.binding import on_loop
+from .widgets.code_editor import EDITOR_SUBTITLE, CodeEditor, render_blocks
+from .widgets.file_browser import PREFETCHED, SAVE_INFO, PathInputBrowser, SafeDirectoryTree
+from .widgets.key_search import SaveKeyProvider, build_search_index
+from .widgets.key_table import KeyTable
 from .widgets.level import LevelGrid
 from .widgets.money import MoneyGrid
 from .widgets.unlock_gear import UnlockGearGrid
@@ -29,20 +41,46 @@ if TYPE_CHECKING:
     from textual.binding import BindingType
     from textual.dom import DOMNode
     from textual.events import Focus
+    from textual.notifications import SeverityLevel
     from textual.timer import Timer
+    from textual.widget import Widget
 
+    from yurei.index import FuzzyIndex
     from yurei.unlockable import Achievement
 
+# seconds without an edit before the save is written by itself, unset or 0 leaves saving to the user
+AUTOSAVE_DELAY = float(os.getenv("YUREI_AUTOSAVE_DELAY", "0"))
+# seconds without a key press or mouse event before the app writes any unsaved edits and closes itself, unset or 0
+# never; a write that fails keeps the app open for another period
+IDLE_TIMEOUT = float(os.getenv("YUREI_IDLE_TIMEOUT", "0"))
+# fewer, larger screen updates for textual-serve and slow SSH links: no clock, the editor starts hidden and is
+# refreshed at most once a period, notifications arriving within a period are shown as one
+LOW_BANDWIDTH = os.getenv("YUREI_LOW_BANDWIDTH", "0") not in {"", "0"}
+LOW_BANDWIDTH_PERIOD = 1.0
+SEVERITIES: tuple[SeverityLevel, ...] = ("information", "warning", "error")
 
-class YureiApp(App[None]):
+
+class YureiApp(App[None]):  # noqa: PLR0904 # textual calls its handlers and actions by name
     _has_touched_editor: bool
+    _load_worker: Worker[None] | None = None
+    _autosave: asyncio.Task[pathlib.Path] | None = None
+    _last_input: float = 0.0
+    # the editor refresh and the notifications waiting out the low bandwidth period
+    _editor_refresh: Timer | None = None
+    _pending_notifications: list[tuple[str, str, SeverityLevel, float | None, bool]]
+    _pending_notifications_flush: Timer | None = None
+    # panes built for the current save, keyed by the radio button that shows them
+    _option_panes: dict[str, Widget]
     save_file: Save
-    debounce_timer: Timer | None
+    search_index: FuzzyIndex
+    debounce_timer: Timer | None = None
     BINDINGS: ClassVar[list[BindingType]] = [
         Binding("ctrl+q", "quit", "Exit the application, making no changes", show=True, priority=True),
         ("o", "open_file", "Browse for a save file"),
         ("O", "open_file(True)", "Open the default save file at known path"),
         Binding("ctrl+w", "save_file", "Save the current edits to the selected file", priority=True),
+        Binding("ctrl+f", "search_keys", "Search keys and values", priority=True),
+        ("e", "toggle_editor", "Show or hide the decoded save"),
     ]
     CSS_PATH = "../../css/layout.tcss"
     TITLE = "Yurei"
@@ -50,30 +88,93 @@ class YureiApp(App[None]):
 
     def compose(self) -> ComposeResult:
         self.theme = "textual-dark"
-        yield Header(name="Yurei", id="app-header", show_clock=True)
-        with Container(id="app-grid"):
+        yield Header(name="Yurei", id="app-header", show_clock=not LOW_BANDWIDTH)
+        with Container(id="app-grid", classes="-editor-hidden" if LOW_BANDWIDTH else ""):
             yield PathInputBrowser("left-pane", path=".")
             with Horizontal(id="top-right"):
                 yield Container(id="top-right-container")
             with Container(id="bottom-right"), VerticalScroll(id="data-pane"):
                 ta = CodeEditor.code_editor(id="decrypted-output", language="json", read_only=False, show_line_numbers=True)
                 ta.border_title = "Decoded save output"
-                ta.border_subtitle = "Edit at your own risk!"
+                ta.border_subtitle = EDITOR_SUBTITLE
                 yield ta
         yield Footer(show_command_palette=False)
 
     async def on_mount(self) -> None:
+        self._pending_notifications = []
         self._has_touched_editor = False
+        self._option_panes = {}
         self.set_focus(self.query_one("#open-save-tree", SafeDirectoryTree))
+        if IDLE_TIMEOUT > 0:
+            self._last_input = time.monotonic()
+            self.set_interval(min(IDLE_TIMEOUT, 30.0), self._close_if_idle)
+
+    async def on_event(self, event: events.Event) -> None:
+        if isinstance(event, events.InputEvent):
+            self._last_input = time.monotonic()
+        await super().on_event(event)
+
+    def on_descendant_focus(self, event: events.DescendantFocus) -> None:
+        # a blinking cursor repaints twice a second for as long as it has focus
+        if LOW_BANDWIDTH and isinstance(event.widget, (Input, TextArea)):
+            event.widget.cursor_blink = False
+
+    def _close_if_idle(self) -> None:
+        if time.monotonic() - self._last_input < IDLE_TIMEOUT:
+            return
+        save_file: Save | None = getattr(self, "save_file", None)
+        if not save_file or not save_file.has_changes:
+            self.exit(None, 0, message=f"Closed after {IDLE_TIMEOUT:.0f}s without any input.")
+            return
+
+        self.run_worker(
+            functools.partial(self._save_and_close, save_file),
+            name="idle-close",
+            group="idle-close",
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    async def _save_and_close(self, save_file: Save, /) -> None:
+        self._set_progress("Writing save...")
+        try:
+            await save_file.write_async()
+        except (OSError, ValueError) as err:
+            # closing now would drop the edits, so they stay open for whoever comes back
+            self._last_input = time.monotonic()
+            self.notify(
+                f"{err}\nThe edits are kept, closing is put off for another {IDLE_TIMEOUT:.0f}s.",
+                title="Unable to save before closing!",
+                severity="error",
+                timeout=None,
+            )
+            return
+        finally:
+            self._set_progress(None)
+
+        self.exit(
+            None,
+            0,
+            message=f"Saved the edits to {save_file.save_path} and closed after {IDLE_TIMEOUT:.0f}s without any input.",
+        )
 
     def action_exit_app(self) -> None:
         self.exit(None, 0, message="Closing without saving any changes.")
 
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:  # noqa: ARG002 # not yet anyway
-        if action == "save_file" and not getattr(self, "save_file", None):  # noqa: SIM103 # this may need more nesting
+        if action == "search_keys" and not getattr(self, "save_file", None):
+            return False
+        if action == "save_file" and (not getattr(self, "save_file", None) or self.is_loading_save):  # noqa: SIM103 # this may need more nesting
             return False
         return True
 
+    @property
+    def is_loading_save(self) -> bool:
+        return self._load_worker is not None and self._load_worker.state in {WorkerState.PENDING, WorkerState.RUNNING}
+
+    def _set_progress(self, stage: str | None, /) -> None:
+        self.sub_title = stage or self.SUB_TITLE
+
     async def on_focus(self, event: Focus) -> None:
         x = event.control
         if not x:
@@ -112,6 +213,7 @@ class YureiApp(App[None]):
             tree.focus()
             return None
 
+        await self.query("#unlockables-pane").remove()
         await pane.remove()
         browser = PathInputBrowser("left-pane", path=".")
         await self.mount(browser)
@@ -119,31 +221,199 @@ class YureiApp(App[None]):
         directory_tree.focus()
         return None
 
-    async def action_save_file(self) -> None:
+    def action_save_file(self) -> None:
         if not getattr(self, "save_file", None):
             self.notify("There is no save file being actively edited!", severity="warning", timeout=3.0)
             return
 
-        backup_path = self.save_file.create_backup()
-        self.notify(
-            f"Created a backup of the original save file at\n[i]{backup_path}[/i]", severity="information", timeout=3.0
-        )
+        self.run_worker(self._save_file, name="save-file", group="save-file", exclusive=True, exit_on_error=False)
 
-        self.save_file.write()
+    async def _save_file(self) -> None:
+        save_file = self.save_file
+        if not save_file.has_changes:
+            self.notify("Nothing has changed since the last save.", severity="information", timeout=3.0)
+            return
+
+        # the save only backs up the original once, on its first write
+        previous_backup = save_file.last_backup
+        self._set_progress("Writing save...")
+        try:
+            await save_file.write_async()
+            await asyncio.to_thread(SAVE_INFO.record, save_file)
+        except (OSError, ValueError) as err:
+            self.notify(str(err), title="Unable to save!", severity="error", timeout=10.0)
+            return
+        finally:
+            self._set_progress(None)
+
+        if save_file.last_backup and save_file.last_backup is not previous_backup:
+            self.notify(
+                f"Created a backup of the original save file at\n[i]{save_file.last_backup}[/i]",
+                severity="information",
+                timeout=3.0,
+            )
         self.notify("The selected file has been written to!", severity="information", timeout=3.0)
 
     def refresh_code_container(self) -> None:
-        text_area = self.query_one("#decrypted-output", CodeEditor)
-        text_area.replace(insert=self.save_file.to_json_string(), start=(0, 0), end=text_area.document.end)
-        text_area.refresh()
+        # each refresh supersedes the last, so a burst of edits only renders the final state
+        self.run_worker(
+            self._refresh_code_container,
+            name="refresh-editor",
+            group="refresh-editor",
+            exclusive=True,
+            exit_on_error=False,
+        )
 
-    async def file_selected(self, file: pathlib.Path | None = None, /) -> None:
-        self.save_file = Save.from_path(file) if file else Save.from_default_path()
+    async def _refresh_code_container(self) -> None:
+        try:
+            blocks = await asyncio.to_thread(render_blocks, self.save_file.entries)
+        except RuntimeError:
+            # the save was edited mid-serialisation, the refresh queued by that edit will render it
+            return
+
+        self.query_one("#decrypted-output", CodeEditor).render_save(blocks)
+
+    def _refresh_code_container_later(self) -> None:
+        self._editor_refresh = None
         self.refresh_code_container()
 
+    def _on_save_changed(self, _: str, /) -> None:
+        if not LOW_BANDWIDTH:
+            self.refresh_code_container()
+        elif not self._editor_refresh:
+            # at most one repaint of the whole editor per period, however many edits land in it
+            self._editor_refresh = self.set_timer(LOW_BANDWIDTH_PERIOD, self._refresh_code_container_later)
+        if AUTOSAVE_DELAY > 0:
+            self._schedule_autosave()
+
+    def _schedule_autosave(self) -> None:
+        # the save coalesces a burst of edits into one write, we only watch each write once
+        write = self.save_file.schedule_write(AUTOSAVE_DELAY)
+        if write is self._autosave:
+            return
+
+        self._autosave = write
+        self.run_worker(
+            functools.partial(self._await_autosave, write), name="autosave", group="autosave", exit_on_error=False
+        )
+
+    async def _await_autosave(self, write: asyncio.Task[pathlib.Path], /) -> None:
+        try:
+            await write
+            await asyncio.to_thread(SAVE_INFO.record, self.save_file)
+        except (OSError, ValueError) as err:
+            self.notify(str(err), title="Unable to autosave!", severity="error", timeout=10.0)
+            return
+        self.notify("Autosaved.", severity="information", timeout=2.0)
+
+    def action_toggle_editor(self) -> None:
+        # hidden, the editor is kept up to date but never painted
+        self.query_one("#app-grid").toggle_class("-editor-hidden")
+
+    def notify(
+        self,
+        message: str,
+        *,
+        title: str = "",
+        severity: SeverityLevel = "information",
+        timeout: float | None = None,
+        markup: bool = True,
+    ) -> None:
+        if not LOW_BANDWIDTH:
+            super().notify(message, title=title, severity=severity, timeout=timeout, markup=markup)
+            return
+
+        # every toast is drawn, then redrawn as the rack shifts when it leaves, so a burst of them becomes one
+        self._pending_notifications.append((message, title, severity, timeout, markup))
+        if not self._pending_notifications_flush:
+            self._pending_notifications_flush = self.set_timer(LOW_BANDWIDTH_PERIOD, self._flush_notifications)
+
+    def _flush_notifications(self) -> None:
+        pending, self._pending_notifications, self._pending_notifications_flush = self._pending_notifications, [], None
+        if len(pending) == 1:
+            message, title, severity, timeout, markup = pending[0]
+            super().notify(message, title=title, severity=severity, timeout=timeout, markup=markup)
+            return
+
+        markup = all(notification[4] for notification in pending)
+        super().notify(
+            "\n".join(f"{title}: {message}" if title else message for message, title, *_ in pending),
+            title=f"{len(pending)} notifications",
+            severity=max((notification[2] for notification in pending), key=SEVERITIES.index),
+            timeout=max((notification[3] for notification in pending if notification[3] is not None), default=None),
+            markup=markup,
+        )
+
+    def action_search_keys(self) -> None:
+        if not CommandPalette.is_open(self):
+            self.push_screen(CommandPalette(providers=[SaveKeyProvider], placeholder="Search keys and values…"))
+
+    def jump_to_key(self, key: str, /) -> None:
+        # prefer the key table when it is showing, it can hold the row under the cursor
+        try:
+            table = self.query_one("#key-table", DataTable)
+        except NoMatches:
+            pass
+        else:
+            if key in table.rows:
+                table.move_cursor(row=table.get_row_index(key))
+                table.focus()
+                return
+
+        self.query_one("#app-grid").remove_class("-editor-hidden")
+        if not self.query_one("#decrypted-output", CodeEditor).jump_to_key(key):
+            self.notify(f"{key!r} is not in the editor, it may have been edited away.", severity="warning", timeout=3.0)
+
+    async def file_selected(self, file: pathlib.Path | None = None, /) -> None:
+        # a newer pick supersedes whatever is still loading
+        self._load_worker = self.run_worker(
+            functools.partial(self._load_save, file),
+            name="load-save",
+            group="load-save",
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    async def _load_save(self, file: pathlib.Path | None, /) -> None:
+        text_area = self.query_one("#decrypted-output", CodeEditor)
+        top_right = self.query_one("#top-right", Horizontal)
+
+        # anything bound to the previous save goes away until the new one is ready
+        await top_right.remove_children()
+        self._option_panes.clear()
+        text_area.loading = True
+        top_right.loading = True
+        self._set_progress(f"Decrypting {file.name if file else 'the default save'}...")
+        try:
+            # a save the browser prefetched while it was highlighted skips the decrypt entirely
+            save_file = await asyncio.to_thread(PREFETCHED.take, file) if file else None
+            if not save_file:
+                save_file = await open_save(file)
+            self._set_progress("Rendering...")
+            blocks = await asyncio.to_thread(render_blocks, save_file.entries)
+            search_index = await asyncio.to_thread(build_search_index, save_file.entries)
+            await asyncio.to_thread(SAVE_INFO.record, save_file)
+        except (OSError, ValueError, NotImplementedError) as err:
+            self.notify(str(err), title="Unable to open save!", severity="error", timeout=10.0)
+            return
+        finally:
+            text_area.loading = False
+            top_right.loading = False
+            self._set_progress(None)
+
+        self.save_file = save_file
+        self.search_index = search_index
+        # every edit, whichever widget made it, reaches the editor through here
+        save_file.subscribe(on_loop(self, self._on_save_changed))
+        text_area.render_save(blocks)
+        await self._show_options()
+
+    async def _show_options(self) -> None:
         pane = self.query_one("#left-pane")
 
+        await self.query("#unlockables-pane").remove()
         await pane.remove_children()
+        pane.display = True
         pane.border_title = "Options"
         buttons: list[RadioButton] = []
         for item in sorted(self.save_file.TUI_ALLOWED_OPERATIONS):
@@ -155,45 +425,102 @@ class YureiApp(App[None]):
         await pane.mount(radio_set)
         self.set_focus(radio_set)
 
+    async def _mount_unlockable_pane(self) -> UnlockablePane:
+        unlockable_pane = UnlockablePane(
+            "unlockables-pane", radio_set_id="unlockables", unlockables=self.save_file.unlockable_manager.available()
+        )
+        await self.query_one("#app-grid", Container).mount(unlockable_pane, before=0)
+        return unlockable_pane
+
     async def set_unlockable_pane(self) -> None:
-        new_pane = UnlockablePane("left-pane", radio_set_id="unlockables")
-        current_pane = self.query_one("#left-pane")
-        await current_pane.remove()
+        try:
+            unlockable_pane = self.query_one("#unlockables-pane", UnlockablePane)
+        except NoMatches:
+            unlockable_pane = await self._mount_unlockable_pane()
+
+        self.query_one("#left-pane").display = False
+        unlockable_pane.display = True
+        self.set_focus(unlockable_pane.query_one("#unlockables", RadioSet))
 
-        app_grid = self.query_one("#app-grid", Container)
-        await app_grid.mount(new_pane, before=0)
-        self.set_focus(new_pane.query_one("#unlockables", RadioSet))
+    def show_methods_pane(self) -> None:
+        self.query_one("#unlockables-pane").display = False
+        pane = self.query_one("#left-pane")
+        pane.display = True
+
+        radio_set = pane.query_one("#methods", RadioSet)
+        pressed = radio_set.pressed_button
+        # released without the set noticing, pressing it again then reports a change as if it was never pressed
+        if pressed and pressed.value and pressed.id == "manage-unlockables":
+            with radio_set.prevent(RadioButton.Changed):
+                pressed.value = False
+        self.set_focus(radio_set)
+
+    async def rebind_unlockables(self) -> None:
+        """Rebuild the panes holding the save's unlockables, for after ``Save._reload`` replaced its manager.
+
+        Only the panes on screen are built again, the others are built from the new manager when next shown.
+        """
+        manager = self.save_file.unlockable_manager
+        grid = self._option_panes.get("achievement")
+        if isinstance(grid, AchievementManageGrid):
+            del self._option_panes["achievement"]
+            shown, name = grid.display, grid.achievement.attribute_name
+            await grid.remove()
+            if shown and name in manager:
+                replacement = AchievementManageGrid(manager.get_handler(name))
+                self._option_panes["achievement"] = replacement
+                await self.query_one("#top-right", Horizontal).mount(replacement)
+
+        try:
+            pane = self.query_one("#unlockables-pane", UnlockablePane)
+        except NoMatches:
+            return
+        shown = pane.display
+        await pane.remove()
+        if shown:
+            await self._mount_unlockable_pane()
+
+    def _show_option_pane(self, pane: Widget, /) -> None:
+        top_right = self.query_one("#top-right", Horizontal)
+        for child in top_right.children:
+            child.display = child is pane
+        top_right.border_title = pane.border_title
+        self.set_focus(pane)
 
     async def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected) -> None:
         await self.file_selected(event.path)
 
     @on(RadioSet.Changed, "#methods")
     async def on_methods_radio_changed(self, message: RadioSet.Changed) -> None:
-        if not message.pressed.id:
+        button_id = message.pressed.id
+        if not button_id:
+            return None
+        if button_id in self._option_panes:
+            # built panes stay bound to the save, so showing one again is just a visibility flip
+            self._show_option_pane(self._option_panes[button_id])
             return None
 
-        match message.pressed.id:
+        match button_id:
             case "edit-money":
                 to_mount = MoneyGrid()
             case "alter-level":
                 to_mount = LevelGrid()
             case "unlock-gear":
-                items = [(item, item) for item in sorted(EQUIPMENT)]
+                items = [(item, item) for item in sorted(EQUIPMENT.intersection(self.save_file.schema.equipment))]
                 to_mount = UnlockGearGrid(items)
             case "add-gear":
-                items = [(item, item) for item in sorted(EQUIPMENT)]
+                items = [(item, item) for item in sorted(EQUIPMENT.intersection(self.save_file.schema.equipment))]
                 to_mount = AddGearGrid(items)
+            case "browse-keys":
+                to_mount = KeyTable()
             case "manage-unlockables":
                 return await self.set_unlockable_pane()
             case _:
                 return None
 
-        top_right = self.query_one("#top-right", Horizontal)
-        await top_right.remove_children()
-
-        top_right.border_title = to_mount.border_title
-        await top_right.mount(to_mount)
-        self.set_focus(to_mount)
+        self._option_panes[button_id] = to_mount
+        await self.query_one("#top-right", Horizontal).mount(to_mount)
+        self._show_option_pane(to_mount)
         return None
 
     @on(RadioSet.Changed, "#unlockables")
@@ -202,17 +529,19 @@ class YureiApp(App[None]):
         if not button_id:
             return
 
-        data: Achievement = getattr(self.save_file.unlockable_manager, button_id)
-        to_mount = AchievementManageGrid(data)
-
-        top_right = self.query_one("#top-right", Horizontal)
-        for child in list(top_right.children):
-            await child.remove()
+        data: Achievement = self.save_file.unlockable_manager.get_handler(button_id)
+        current = self._option_panes.get("achievement")
+        if isinstance(current, AchievementManageGrid) and current.achievement is data:
+            self._show_option_pane(current)
+            return
 
-        top_right.border_title = to_mount.border_title
-        await top_right.mount(to_mount)
-        self.refresh(layout=True)
-        self.set_focus(to_mount)
+        # one achievement grid at a time, its children share ids between achievements
+        if current:
+            await current.remove()
+        to_mount = AchievementManageGrid(data)
+        self._option_panes["achievement"] = to_mount
+        await self.query_one("#top-right", Horizontal).mount(to_mount)
+        self._show_option_pane(to_mount)
 
     def _handle_money_value(self, event: Input.Submitted | Input.Blurred) -> None:
         if event.validation_result and not event.validation_result.is_valid:
@@ -262,8 +591,5 @@ class YureiApp(App[None]):
                 return
             case "money-value":
                 self._handle_money_value(event)
-                return
             case _:
                 pass
-
-        self.refresh_code_container()
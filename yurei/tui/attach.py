@@ -0,0 +1,38 @@
+"""Hand this process's stdio to a worker of ``yurei.tui.prefork`` and exit with the session's exit code.
+
+textual-serve runs this once per session. It is run by path and only imports the standard library, so it starts in
+a few milliseconds; when the pool isn't there it becomes the plain ``yurei`` app instead.
+"""
+
+import json
+import os
+import socket
+import struct
+import sys
+
+STATUS = struct.Struct("!i")
+
+
+def main() -> None:
+    socket_path = sys.argv[1]
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(socket_path)
+    except OSError:
+        conn.close()
+        # no pool, e.g it is still warming up, a slower start beats no start
+        os.execv(sys.executable, [sys.executable, "-m", "yurei"])  # noqa: S606 # our own interpreter and module
+
+    with conn:
+        socket.send_fds(conn, [json.dumps(dict(os.environ)).encode()], [0, 1, 2])
+        # our copies of stdio are the worker's now, nothing more gets written through them
+        status = b""
+        while len(status) < STATUS.size and (chunk := conn.recv(STATUS.size - len(status))):
+            status += chunk
+
+    # a worker that died without reporting, e.g killed by a limit
+    sys.exit(STATUS.unpack(status)[0] if len(status) == STATUS.size else 1)
+
+
+if __name__ == "__main__":
+    main()
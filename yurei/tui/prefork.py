@@ -0,0 +1,182 @@
+"""A pool of pre-forked, warmed up app processes for ``yurei-web``, one per browser session.
+
+Starting a session the plain way spawns a new interpreter that imports textual, builds the app and parses its CSS
+before it draws anything, ~0.7s of CPU each, which stacks up when several browsers connect at once. The master here
+pays for all of that once, then forks idle workers that wait on a Unix socket. ``attach.py``, the command
+textual-serve runs per session, hands a worker its stdio and environment and waits for it to exit.
+
+Workers serve a single session and exit with it, so nothing a session leaves behind outlives it. Run as
+``python -m yurei.tui.prefork SOCKET``, with the web driver's environment already set, as textual reads it on import.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import resource
+import select
+import signal
+import socket
+import struct
+import sys
+import time
+
+from .app import YureiApp
+
+__all__ = ("serve_pool",)
+
+LOGGER = logging.getLogger(__name__)
+# idle workers kept ready, each one costs ~10 MiB that isn't shared with the master
+WORKERS = int(os.getenv("YUREI_WEB_WORKERS", "4"))
+# sessions running at once, the rest wait on the socket for one to end
+MAX_SESSIONS = int(os.getenv("YUREI_WEB_MAX_SESSIONS", "32"))
+# per session limits, 0 for none: address space in MiB and CPU time in seconds
+SESSION_MEMORY = int(os.getenv("YUREI_WEB_SESSION_MEMORY", "2048"))
+SESSION_CPU = int(os.getenv("YUREI_WEB_SESSION_CPU", "0"))
+# the most a session's environment may take, textual-serve's is the server's plus a few `TEXTUAL_*` variables
+MAX_HELLO_SIZE = 1024 * 1024
+STATUS = struct.Struct("!i")
+
+
+def _warm_app() -> YureiApp:
+    app = YureiApp()
+    # parsed stylesheets are cached by their source, so every worker forked after this skips parsing its own
+    app.stylesheet.read_all(app.css_path)
+    app.stylesheet.parse()
+    return app
+
+
+def _limit_session() -> None:
+    if SESSION_MEMORY > 0:
+        limit = SESSION_MEMORY * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if SESSION_CPU > 0:
+        # SIGXCPU at the soft limit, which kills the session, SIGKILL a second later if it somehow doesn't
+        resource.setrlimit(resource.RLIMIT_CPU, (SESSION_CPU, SESSION_CPU + 1))
+
+
+def _receive(conn: socket.socket, /) -> dict[str, str]:
+    hello, fds, _, _ = socket.recv_fds(conn, MAX_HELLO_SIZE, 3)
+    if len(fds) != 3:  # stdin, stdout and stderr
+        for fd in fds:
+            os.close(fd)
+        msg = f"Expected stdin, stdout and stderr, got {len(fds)} file descriptors."
+        raise ValueError(msg)
+
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    return json.loads(hello)
+
+
+def _work(listener: socket.socket, status: int, app: YureiApp, /) -> int:
+    """Wait for a session, run it and return its exit code. Only ever runs in a forked worker."""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    conn, _ = listener.accept()
+    listener.close()
+    os.write(status, STATUS.pack(os.getpid()))
+    os.close(status)
+
+    with conn:
+        try:
+            env = _receive(conn)
+        except (OSError, ValueError):
+            LOGGER.exception("Dropped a session that didn't attach properly")
+            return 1
+
+        # `COLUMNS`, `ROWS` and the like are read when the driver starts, which is after this
+        os.environ.clear()
+        os.environ.update(env)
+        _limit_session()
+        # textual writes to and reads from fds 1 and 0, which are the session's now
+        app.run()
+        code = app.return_code or 0
+        sys.stdout.flush()
+        with contextlib.suppress(OSError):
+            # the attach process may already be gone along with its browser
+            conn.sendall(STATUS.pack(code))
+        return code
+
+
+def _fork(listener: socket.socket, status: tuple[int, int], app: YureiApp, /) -> int:
+    # anything still buffered would be written again by the worker
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid:
+        return pid
+
+    code = 1
+    try:
+        os.close(status[0])
+        code = _work(listener, status[1], app)
+    except BaseException:
+        LOGGER.exception("Session worker %s failed", os.getpid())
+    finally:
+        # skips the master's cleanup, which isn't ours to run
+        os._exit(code)
+
+
+def serve_pool(socket_path: str, /, *, workers: int = WORKERS, max_sessions: int = MAX_SESSIONS) -> None:
+    """Keep ``workers`` idle workers waiting on ``socket_path``, until SIGTERM or SIGINT."""
+    started = time.perf_counter()
+    app = _warm_app()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(socket_path)  # noqa: PTH108 # a stale socket from a master that was killed
+    listener.bind(socket_path)
+    # only our user gets to attach to our saves
+    os.chmod(socket_path, 0o600)  # noqa: PTH101
+    listener.listen(max_sessions)
+
+    status = os.pipe()
+    idle: set[int] = set()
+    busy: set[int] = set()
+    stopping = False
+
+    def stop(*_: object) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    LOGGER.info("Warmed up in %.0fms, serving sessions on %s", (time.perf_counter() - started) * 1e3, socket_path)
+
+    try:
+        while not stopping:
+            while len(idle) < workers and len(idle) + len(busy) < max_sessions:
+                idle.add(_fork(listener, status, app))
+
+            with contextlib.suppress(InterruptedError):
+                # a worker announces itself as soon as it accepts a session, the timeout is for reaping
+                ready, _, _ = select.select([status[0]], [], [], 1.0)
+                if ready:
+                    # writes this small to a pipe are atomic, so reads always end on a whole pid
+                    for (pid,) in STATUS.iter_unpack(os.read(status[0], STATUS.size * 64)):
+                        idle.discard(pid)
+                        busy.add(pid)
+
+            while True:
+                try:
+                    pid, _ = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    break
+                if not pid:
+                    break
+                if pid in idle:
+                    LOGGER.warning("Idle session worker %s exited, replacing it", pid)
+                idle.discard(pid)
+                busy.discard(pid)
+    finally:
+        listener.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)  # noqa: PTH108
+        for pid in idle | busy:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    serve_pool(sys.argv[1])
@@ -1,16 +1,71 @@
+import contextlib
 import os
+import pathlib
+import shlex
+import subprocess  # noqa: S404 # runs our own interpreter
+import sys
+import tempfile
+from typing import TYPE_CHECKING
 
 try:
     from textual_serve.server import Server
 except ModuleNotFoundError:
     raise RuntimeError("The `web` extra is required to use the web extension.") from None
 
+from yurei.shared import unlink_segments
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 PORT = int(os.getenv("YUREI_PORT", "8000"))
 HOST = os.getenv("YUREI_BIND_ADDRESS", "localhost")
+# idle pre-forked sessions, 0 starts an interpreter per session instead; forking needs a POSIX system
+WORKERS = int(os.getenv("YUREI_WEB_WORKERS", "4" if hasattr(os, "fork") else "0"))
+# textual reads these on import, so the pool has to be started with them rather than handed them per session
+WEB_DRIVER_ENVIRONMENT: dict[str, str] = {
+    "TEXTUAL_DRIVER": "textual.drivers.web_driver:WebDriver",
+    "TEXTUAL_FPS": "60",
+    "TEXTUAL_COLOR_SYSTEM": "truecolor",
+}
+# a browser tab left open holds a process, web sessions close after half an hour without input unless told otherwise
+DEFAULT_IDLE_TIMEOUT = "1800"
 
 __all__ = ("run_server",)
 
 
+@contextlib.contextmanager
+def _session_pool(tmp: pathlib.Path, /) -> Iterator[str]:
+    """Run the pre-forked pool of ``yurei.tui.prefork`` and yield the command that attaches a session to it."""
+    socket_path = str(tmp / "sessions.sock")
+    pool = subprocess.Popen(  # noqa: S603 # our own interpreter and module
+        [sys.executable, "-m", "yurei.tui.prefork", socket_path],
+        env=os.environ | WEB_DRIVER_ENVIRONMENT,
+        stdin=subprocess.DEVNULL,
+    )
+    attach = pathlib.Path(__file__).with_name("attach.py")
+    try:
+        # sessions that start before the pool is listening run the app the slow way
+        yield shlex.join([sys.executable, str(attach), socket_path])
+    finally:
+        pool.terminate()
+        pool.wait()
+
+
 def run_server() -> None:
-    server = Server("yurei", host=HOST, port=PORT)
-    server.serve()
+    with tempfile.TemporaryDirectory(prefix="yurei-web-") as tmp:
+        shared = pathlib.Path(tmp, "shared")
+        shared.mkdir()
+        # every session inherits these, through the pool or directly
+        os.environ.setdefault("YUREI_IDLE_TIMEOUT", DEFAULT_IDLE_TIMEOUT)
+        os.environ.setdefault("YUREI_SHARED_SAVES", str(shared))
+        try:
+            if WORKERS <= 0:
+                Server("yurei", host=HOST, port=PORT).serve()
+                return
+
+            with _session_pool(pathlib.Path(tmp)) as command:
+                Server(command, host=HOST, port=PORT).serve()
+        finally:
+            # sessions are gone by now, anything they shared would otherwise outlive the server
+            if os.environ["YUREI_SHARED_SAVES"] == str(shared):
+                unlink_segments(shared)
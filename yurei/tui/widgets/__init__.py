@@ -1,3 +1,3 @@
-from . import add_gear, file_browser, level, money, unlock_gear, unlockables
+from . import add_gear, file_browser, key_search, key_table, level, money, unlock_gear, unlockables
 
-__all__ = ("add_gear", "file_browser", "level", "money", "unlock_gear", "unlockables")
+__all__ = ("add_gear", "file_browser", "key_search", "key_table", "level", "money", "unlock_gear", "unlockables")
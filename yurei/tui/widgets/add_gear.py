@@ -43,5 +43,4 @@ class AddGearGrid(Grid):
         amount = self.query_one("#add-gear-input", Input)
         for value in select.selected:
             self.app.save_file.add_equipment(item=Equipment(value), amount=int(amount.value))
-        self.app.refresh_code_container()
         self.notify(f"Added {amount.value}x of {', '.join(select.selected)}")
@@ -0,0 +1,49 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from textual.app import App
+
+    from yurei.tui.app import YureiApp
+
+__all__ = ("SaveBound", "on_loop")
+
+
+def on_loop[**P](app: App[Any], callback: Callable[P, None], /) -> Callable[P, None]:
+    """Wrap ``callback`` so it always runs on ``app``'s event loop, whichever thread calls it."""
+
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # a worker thread, e.g. unlockables being merged during a write
+            app.call_from_thread(callback, *args, **kwargs)
+        else:
+            callback(*args, **kwargs)
+
+    return wrapper
+
+
+class SaveBound:
+    """Keeps a widget in step with some keys of the app's save while it is mounted.
+
+    Subclasses list the keys in ``BOUND_KEYS``, or leave it empty to hear about every key, and copy the new values
+    into reactives in ``sync_from_save``, so only what changed is repainted.
+    """
+
+    app: YureiApp
+    BOUND_KEYS: ClassVar[tuple[str, ...]] = ()
+    _unsubscribe: Callable[[], None] | None = None
+
+    def sync_from_save(self, key: str, /) -> None:
+        """Called on the app's loop with each bound ``key`` that changed. Does nothing unless overridden."""
+
+    def on_mount(self) -> None:
+        self._unsubscribe = self.app.save_file.subscribe(on_loop(self.app, self.sync_from_save), *self.BOUND_KEYS)
+
+    def on_unmount(self) -> None:
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
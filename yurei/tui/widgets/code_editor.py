@@ -1,21 +1,297 @@
-from typing import TYPE_CHECKING, ClassVar
+import bisect
+import difflib
+import itertools
+import re
+from typing import TYPE_CHECKING, Any, ClassVar
 
+from rich.segment import Segment
+from rich.style import Style
+from textual import on
 from textual.binding import Binding
+from textual.geometry import Offset
+from textual.strip import Strip
 from textual.widgets import TextArea
 
+from yurei.utils import from_json, to_json
+
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from yurei.tui.app import YureiApp
 
-__all__ = ("CodeEditor",)
+__all__ = ("EDITOR_SUBTITLE", "CodeEditor", "render_blocks")
+
+EDITOR_SUBTITLE = "Edit at your own risk!"
+# seconds of typing inactivity before the edited entries are re-parsed and validated
+PARSE_DEBOUNCE = 0.3
+# every entry starts on its own line, indented once, with its key
+ENTRY_START_PATTERN: re.Pattern[str] = re.compile(r'^  ("(?:[^"\\]|\\.)*")\s*:')
+ERROR_STYLE = Style(bgcolor="#5f0000")
+
+
+def render_blocks(data: Mapping[str, Any], /) -> tuple[str, ...]:
+    """Serialise each top level entry of ``data`` as the whole lines it occupies in the pretty printed document.
+
+    Joined and wrapped in braces, the blocks are identical to ``to_json(data)``.
+    """
+    # `to_json` of a single entry mapping is "{\n  <entry>\n}", so strip the braces to keep only the entry lines
+    blocks = [to_json({key: value})[2:-2] + ",\n" for key, value in sorted(data.items())]
+    if blocks:
+        blocks[-1] = blocks[-1][:-2] + "\n"
+    return tuple(blocks)
+
+
+def _join_blocks(blocks: tuple[str, ...], /) -> str:
+    return "{\n" + "".join(blocks) + "}" if blocks else "{}"
+
+
+def _block_key(block: str, /) -> str:
+    match = ENTRY_START_PATTERN.match(block)
+    assert match  # blocks are only ever built from lines that matched
+    return from_json(match[1])
+
+
+def _block_starts(blocks: tuple[str, ...], /) -> list[int]:
+    # the first line of the document is the opening brace, the final start is the closing brace
+    starts = [1]
+    for block in blocks:
+        starts.append(starts[-1] + block.count("\n"))
+    return starts
+
+
+class _ParseError(ValueError):
+    def __init__(self, row: int, message: str, /) -> None:
+        super().__init__(message)
+        self.row = row
+        self.message = message
+
+
+def _parse_region(lines: list[str], start: int, end: int, /, *, is_last: bool) -> tuple[dict[str, Any], tuple[str, ...]]:
+    """Parse the entries on ``lines[start:end]``, returning them and the blocks they occupy."""
+    region = lines[start:end]
+    if not any(line.strip() for line in region):
+        return {}, ()
+
+    body = "\n".join(region).rstrip()
+    if not is_last:
+        if not body.endswith(","):
+            raise _ParseError(end - 1, "Expected ',' after this entry")
+        body = body[:-1]
+
+    try:
+        parsed = from_json("{" + body + "}")
+    except ValueError as err:
+        raise _ParseError(start + getattr(err, "lineno", 1) - 1, getattr(err, "msg", str(err))) from err
+
+    entry_starts = [idx for idx, line in enumerate(region) if ENTRY_START_PATTERN.match(line)]
+    if not entry_starts or entry_starts[0] != 0:
+        raise _ParseError(start, "Each entry must start on its own line, indented by two spaces")
+    if len(entry_starts) != len(parsed):
+        raise _ParseError(start, "Duplicate key, or more than one entry on a line")
+
+    for key, entry in parsed.items():
+        if type(entry) is not dict or entry.keys() != {"__type", "value"}:
+            row = start + entry_starts[list(parsed).index(key)]
+            raise _ParseError(row, f"{key}: expected an object with only `__type` and `value`")
+
+    entry_starts.append(len(region))
+    blocks = tuple("\n".join(region[head:tail]) + "\n" for head, tail in itertools.pairwise(entry_starts))
+    return parsed, blocks
 
 
 class CodeEditor(TextArea):
     app: YureiApp
     BINDINGS: ClassVar[list[Binding]] = [Binding("ctrl+s", "save", "Save your text-area edits", show=True)]
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # the last successfully parsed document, as one block of lines per entry
+        self._blocks: tuple[str, ...] = ()
+        self._error_rows: dict[int, str] = {}
+        # parsed edits not yet committed to the save
+        self._pending: dict[str, Any] = {}
+        self._removed: set[str] = set()
+        super().__init__(*args, **kwargs)
+
+    def render_line(self, y: int) -> Strip:
+        strip = super().render_line(y)
+        if not self._error_rows:
+            return strip
+
+        absolute_y = self.scroll_offset.y + y
+        if absolute_y >= self.wrapped_document.height:
+            return strip
+        row, _ = self.wrapped_document.offset_to_location(Offset(0, absolute_y))
+        if row not in self._error_rows:
+            return strip
+        # over the theme's own background, which every segment of the line carries
+        return Strip(Segment.apply_style(strip, post_style=ERROR_STYLE), strip.cell_length)
+
+    def _set_errors(self, errors: dict[int, str], /) -> None:
+        self._error_rows = errors
+        self.refresh()
+
+        if not errors:
+            self.border_subtitle = EDITOR_SUBTITLE
+            return
+        row, message = min(errors.items())
+        more = f" (+{len(errors) - 1} more)" if len(errors) > 1 else ""
+        self.border_subtitle = f"Line {row + 1}: {message}{more}"
+
+    def render_save(self, blocks: tuple[str, ...], /) -> int:
+        """Bring the document in line with ``blocks``, only replacing the lines from the first to the last changed entry.
+
+        Any uncommitted hand edits are discarded. Returns the number of edits applied, ``0`` when the document was
+        already up to date.
+        """
+        edits = self._apply_blocks(blocks)
+        self._pending.clear()
+        self._removed.clear()
+        if self._error_rows:
+            self._set_errors({})
+        return edits
+
+    def _apply_blocks(self, blocks: tuple[str, ...], /) -> int:
+        if blocks == self._blocks and self.text == _join_blocks(blocks):
+            return 0
+
+        opcodes: list[tuple[str, int, int, int, int]] = []
+        if self._blocks and self.text == _join_blocks(self._blocks):
+            opcodes = [
+                opcode
+                for opcode in difflib.SequenceMatcher(None, self._blocks, blocks, autojunk=False).get_opcodes()
+                if opcode[0] != "equal"
+            ]
+
+        if not opcodes:
+            # first render, or a hand edited document whose block positions are stale
+            self.replace(insert=_join_blocks(blocks), start=(0, 0), end=self.document.end)
+            self._blocks = blocks
+            return 1
+
+        # a single replace from the first changed entry to the last, as every edit re-highlights the whole document
+        starts = _block_starts(self._blocks)
+        _, old_start, _, new_start, _ = opcodes[0]
+        _, _, old_end, _, new_end = opcodes[-1]
+        self.replace(
+            insert="".join(blocks[new_start:new_end]),
+            start=(starts[old_start], 0),
+            end=(starts[old_end], 0),
+        )
+        self._blocks = blocks
+        return len(opcodes)
+
+    def jump_to_key(self, key: str, /) -> bool:
+        for block, start in zip(self._blocks, _block_starts(self._blocks), strict=False):
+            if _block_key(block) == key:
+                self.move_cursor((start, 2), center=True)
+                self.focus()
+                return True
+        return False
+
+    @on(TextArea.Changed)
+    def _schedule_validation(self, _: TextArea.Changed) -> None:
+        if self.app.debounce_timer:
+            self.app.debounce_timer.stop()
+        self.app.debounce_timer = self.set_timer(PARSE_DEBOUNCE, self.validate_edits)
+
+    def validate_edits(self) -> bool:
+        """Re-parse only the entries edited since the last good parse, then validate the uncommitted edits.
+
+        Errors are marked on their lines. Returns whether the document is valid.
+        """
+        self.app.debounce_timer = None
+        if not getattr(self.app, "save_file", None):
+            return False
+
+        lines = self.document.lines
+        old_lines = _join_blocks(self._blocks).split("\n")
+        if lines != old_lines:
+            try:
+                self._reparse(lines, old_lines)
+            except _ParseError as err:
+                self._set_errors({err.row: err.message})
+                return False
+
+        starts = _block_starts(self._blocks)
+        rows = {_block_key(block): start for block, start in zip(self._blocks, starts, strict=False)}
+        errors: dict[int, str] = {}
+        for message in self.app.save_file.schema.validate(self._pending):
+            errors.setdefault(rows.get(message.partition(":")[0], 0), message)
+        self._set_errors(errors)
+        return not errors
+
+    def _reparse(self, lines: list[str], old_lines: list[str], /) -> None:
+        limit = min(len(lines), len(old_lines))
+        top = 0
+        while top < limit and lines[top] == old_lines[top]:
+            top += 1
+        bottom = 0
+        while bottom < limit - top and lines[-1 - bottom] == old_lines[-1 - bottom]:
+            bottom += 1
+        old_end = len(old_lines) - bottom
+
+        starts = _block_starts(self._blocks)
+        if not self._blocks or top == 0 or old_end >= len(old_lines):
+            # the braces were touched, or there is nothing to anchor to, so parse every entry
+            if lines[0].strip() != "{":
+                raise _ParseError(0, "Expected '{' to open the save")
+            if lines[-1].strip() != "}":
+                raise _ParseError(len(lines) - 1, "Expected '}' to close the save")
+            first, last = 0, len(self._blocks)
+        else:
+            # the blocks spanning the changed lines, a pure insertion lands in the block it was typed into
+            first = bisect.bisect_right(starts, top) - 1
+            last = max(bisect.bisect_right(starts, old_end - 1), first + 1)
+
+        shift = len(lines) - len(old_lines)
+        region_end = len(lines) - 1 if last == len(self._blocks) else starts[last] + shift
+        parsed, blocks = _parse_region(lines, starts[first], region_end, is_last=last == len(self._blocks))
+
+        outside = {_block_key(block) for block in self._blocks[:first] + self._blocks[last:]}
+        for key in parsed:
+            if key in outside:
+                raise _ParseError(starts[first], f"{key}: duplicate key")
+
+        entries = self.app.save_file.entries
+        for key in {_block_key(block) for block in self._blocks[first:last]}.difference(parsed):
+            self._pending.pop(key, None)
+            if key in entries:
+                self._removed.add(key)
+        for key, entry in parsed.items():
+            self._removed.discard(key)
+            if entries.get(key) == entry:
+                self._pending.pop(key, None)
+            else:
+                self._pending[key] = entry
+
+        self._blocks = self._blocks[:first] + blocks + self._blocks[last:]
+
     def action_save(self) -> None:
-        self.app.save_file.from_json_string(self.text)
-        self.app.save_file._reload()  # pyright: ignore[reportPrivateUsage] # we need to reload internals after loading content manually
-        self.app.save_file.write()
+        self.app.run_worker(self._save, name="save-editor", group="save-editor", exclusive=True, exit_on_error=False)
+
+    async def _save(self) -> None:
+        if self.app.debounce_timer:
+            self.app.debounce_timer.stop()
+        if not self.validate_edits():
+            self.app.notify(
+                f"Fix the marked errors before saving.\n{self.border_subtitle}", title="Invalid save!", severity="error"
+            )
+            return
+
+        # the edits are already parsed and validated, so commit them without re-reading the document
+        save_file = self.app.save_file
+        if self._pending or self._removed:
+            save_file.update_entries(self._pending, self._removed)
+            save_file._reload()  # pyright: ignore[reportPrivateUsage] # we need to reload internals after loading content manually
+            await self.app.rebind_unlockables()
+        if not save_file.has_changes:
+            self.app.notify("Nothing has changed since the last save.", severity="information", timeout=3.0)
+            return
+        try:
+            await save_file.write_async()
+        except (OSError, ValueError) as err:
+            self.app.notify(str(err), title="Invalid save!", severity="error", timeout=10.0)
+            return
+        self._pending.clear()
+        self._removed.clear()
         self.app.notify("Successfully saved the editor contents!", title="Success!", severity="information", timeout=3.0)
-        self.app.refresh_code_container()
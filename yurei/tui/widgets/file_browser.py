@@ -1,23 +1,303 @@
+import asyncio
+import datetime
+import functools
 import pathlib
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
+from textual.binding import Binding
 from textual.containers import VerticalScroll
+from textual.reactive import reactive
 from textual.validation import Function, Length
 from textual.widgets import DirectoryTree, Input
 
+from yurei.crypt import SNIFF_HEADER_SIZE, sniff
+from yurei.save import CURRENT_SAVE_KEY, LARGE_SAVE_THRESHOLD, Save
+from yurei.shared import open_save
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
-__all__ = ("PathInput", "PathInputBrowser", "SafeDirectoryTree")
+    from rich.style import Style
+    from rich.text import Text
+    from textual.binding import BindingType
+    from textual.widgets import Tree
+    from textual.widgets.directory_tree import DirEntry
+    from textual.widgets.tree import TreeNode
+
+__all__ = (
+    "PREFETCHED",
+    "SAVE_INFO",
+    "PathInput",
+    "PathInputBrowser",
+    "SafeDirectoryTree",
+    "SaveCache",
+    "SaveInfo",
+    "SaveInfoCache",
+)
+
+MAX_CACHED_SAVE_INFO = 4096
+# how long a highlight has to rest on a save before it is decrypted, so scrolling past saves costs nothing
+PREFETCH_DELAY = 0.25
+MAX_PREFETCHED_SAVES = 4
+# measured on the encrypted files, a decrypted save with its key index takes ~30 times as much memory
+MAX_PREFETCHED_BYTES = 1024 * 1024
 
 
 def is_real_path(input_: str) -> bool:
-    return pathlib.Path(input_).expanduser().resolve().exists()
+    # no `resolve()`, existence doesn't depend on symlinks being spelled out
+    return pathlib.Path(input_).expanduser().exists()
+
+
+def _format_size(size: int, /) -> str:
+    if size < 1024:
+        return f"{size} B"
+    scaled = size / 1024
+    for unit in ("KiB", "MiB"):
+        if scaled < 1024:
+            return f"{scaled:.1f} {unit}"
+        scaled /= 1024
+    return f"{scaled:.1f} GiB"
+
+
+class SaveInfo(NamedTuple):
+    is_save: bool
+    size: int
+    modified: float
+    level: int | None = None
+    money: int | None = None
+
+    def describe(self) -> str:
+        modified = datetime.datetime.fromtimestamp(self.modified).astimezone().strftime("%Y-%m-%d %H:%M")
+        parts = [_format_size(self.size), modified]
+        if self.level is not None:
+            parts.append(f"lvl {self.level}")
+        if self.money is not None:
+            parts.append(f"${self.money:,}")
+        return " · ".join(parts)
+
+
+def _normalise(path: pathlib.Path, /) -> pathlib.Path:
+    # the tree's paths are relative to where it was opened, loaded saves may come from anywhere
+    return path.expanduser().resolve()
+
+
+class SaveInfoCache:
+    """Sniffed save metadata keyed by ``(path, mtime, size)``, with every path resolved first.
+
+    An unchanged file is only ever probed once, and the level and money are only known once the save was decrypted
+    for another reason, so browsing never decrypts anything.
+    """
+
+    __slots__ = ("_aliases", "_entries", "_latest", "_lock")
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[pathlib.Path, int, int], SaveInfo] = {}
+        # the most recently stored entry of each path, for looking one up without a stat
+        self._latest: dict[pathlib.Path, SaveInfo] = {}
+        # each probed path as the caller had it -> resolved, so `get` is a lookup rather than a realpath walk
+        self._aliases: dict[pathlib.Path, pathlib.Path] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: tuple[pathlib.Path, int, int], info: SaveInfo, /) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = info
+            self._latest[key[0]] = info
+            # dicts keep insertion order, so the first key is the least recently stored
+            if len(self._entries) > MAX_CACHED_SAVE_INFO:
+                evicted = next(iter(self._entries))
+                if self._latest.get(evicted[0]) is self._entries.pop(evicted):
+                    del self._latest[evicted[0]]
+
+    def _alias(self, path: pathlib.Path, /) -> pathlib.Path:
+        resolved = self._aliases.get(path)
+        if resolved is None:
+            resolved = _normalise(path)
+            with self._lock:
+                self._aliases[path] = resolved
+                if len(self._aliases) > MAX_CACHED_SAVE_INFO:
+                    del self._aliases[next(iter(self._aliases))]
+        return resolved
+
+    def get(self, path: pathlib.Path, /) -> SaveInfo | None:
+        """The most recently stored info for ``path``, if any. Never touches the filesystem, so it's cheap to render.
+
+        ``path`` is looked up as it was probed, or as it is when it wasn't, e.g an already resolved path.
+        """
+        return self._latest.get(self._aliases.get(path, path))
+
+    def probe(self, path: pathlib.Path, /) -> SaveInfo:
+        """Stat ``path`` and, unless it is cached already, sniff its header. Blocks, so call it off the event loop."""
+        path = self._alias(path)
+        stat = path.stat()
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        info = self._entries.get(key)
+        if info:
+            return info
+
+        with path.open("rb") as fp:
+            header = fp.read(SNIFF_HEADER_SIZE)
+        info = SaveInfo(sniff(header, size=stat.st_size, password=CURRENT_SAVE_KEY), stat.st_size, stat.st_mtime)
+        self._store(key, info)
+        return info
+
+    def record(self, save: Save, /) -> SaveInfo:
+        """Remember the level and money of a decrypted save. Blocks on a stat of the file."""
+        path = _normalise(save.save_path)
+        stat = path.stat()
+        try:
+            level = save.level
+        except KeyError:
+            level = None
+        money = save.get_value("PlayersMoney", int, default=None)
+        info = SaveInfo(True, stat.st_size, stat.st_mtime, level, money)  # noqa: FBT003 # positional field
+        self._store((path, stat.st_mtime_ns, stat.st_size), info)
+        return info
+
+
+def _file_key(path: pathlib.Path, /) -> tuple[pathlib.Path, int, int]:
+    stat = path.stat()
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+class SaveCache:
+    """A small LRU of decrypted saves keyed by ``(path, mtime, size)``, bounded by count and by total file size.
+
+    Saves are handed out with :meth:`take`, which removes them, as the taker is free to edit them in place.
+    """
+
+    __slots__ = ("_entries", "_lock", "_total")
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[pathlib.Path, int, int], Save] = {}
+        self._lock = threading.Lock()
+        self._total = 0
+
+    def __contains__(self, key: object, /) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, key: tuple[pathlib.Path, int, int], save: Save, /) -> None:
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = save
+            self._total += key[2]
+            while len(self._entries) > MAX_PREFETCHED_SAVES or self._total > MAX_PREFETCHED_BYTES:
+                evicted = next(iter(self._entries))
+                del self._entries[evicted]
+                self._total -= evicted[2]
+
+    def take(self, path: pathlib.Path, /) -> Save | None:
+        """Remove and return the save for ``path`` if it is cached and the file is unchanged. Blocks on a stat."""
+        try:
+            key = _file_key(path.expanduser().resolve())
+        except OSError:
+            return None
+
+        with self._lock:
+            save = self._entries.pop(key, None)
+            if save:
+                self._total -= key[2]
+        return save
+
+
+# shared by every browser, so reopening one or revisiting a directory reuses earlier probes
+SAVE_INFO = SaveInfoCache()
+PREFETCHED = SaveCache()
 
 
 class SafeDirectoryTree(DirectoryTree):
+    """A directory tree that hides dotfiles and marks encrypted saves with their size, age, level and money.
+
+    Directories are listed, and their files sniffed, in the tree's background loader. With ``saves_only`` set,
+    files that are not saves are hidden too.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("s", "toggle_saves_only", "Toggle showing only saves"),
+    ]
+
+    saves_only: reactive[bool] = reactive(True, init=False)  # noqa: FBT003 # reactive default
+
+    def __init__(self, path: str | pathlib.Path, *, id: str | None = None) -> None:  # noqa: A002 # matches textual
+        super().__init__(path, id=id)
+
     def filter_paths(self, paths: Iterable[pathlib.Path]) -> Iterable[pathlib.Path]:
-        return [p for p in paths if not p.name.startswith(".")]
+        ret: list[pathlib.Path] = []
+        for path in paths:
+            if path.name.startswith("."):
+                continue
+            if self._safe_is_dir(path):
+                ret.append(path)
+                continue
+
+            try:
+                info = SAVE_INFO.probe(path)
+            except OSError:
+                continue
+            if info.is_save or not self.saves_only:
+                ret.append(path)
+        return ret
+
+    def render_label(self, node: TreeNode[DirEntry], base_style: Style, style: Style) -> Text:
+        label = super().render_label(node, base_style, style)
+        # shared with the app, which records the level and money of every save it loads
+        info = SAVE_INFO.get(node.data.path) if node.data and not node.allow_expand else None
+        if not info:
+            return label
+        if not info.is_save:
+            label.stylize("dim")
+            return label
+
+        label.stylize("bold")
+        return label.append(f"  {info.describe()}", style="dim italic")
+
+    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted[DirEntry]) -> None:
+        node = event.node
+        if not node.data or node.allow_expand:
+            return
+        # a newer highlight cancels the previous prefetch, so at most one save is being decrypted for us
+        self.run_worker(
+            functools.partial(self._prefetch, node.data.path),
+            name="prefetch-save",
+            group="prefetch-save",
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    async def _prefetch(self, path: pathlib.Path, /) -> None:
+        await asyncio.sleep(PREFETCH_DELAY)
+        info = SAVE_INFO.get(path)
+        # larger saves need the process pool, they are not worth tying it up for a maybe
+        if not info or not info.is_save or info.size >= LARGE_SAVE_THRESHOLD:
+            return
+
+        try:
+            key = await asyncio.to_thread(_file_key, path.expanduser().resolve())
+            if key in PREFETCHED:
+                return
+            save = await open_save(key[0])
+        except (OSError, ValueError, NotImplementedError):
+            # the sniff was wrong or the file went away, selecting it will report why
+            return
+
+        PREFETCHED.put(key, save)
+        await asyncio.to_thread(SAVE_INFO.record, save)
+        self.refresh()
+
+    def watch_saves_only(self) -> None:
+        self.reload()
+
+    def action_toggle_saves_only(self) -> None:
+        self.saves_only = not self.saves_only
+        self.notify("Showing only saves." if self.saves_only else "Showing every file.", timeout=2.0)
 
 
 class PathInput(Input):
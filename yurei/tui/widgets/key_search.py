@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING, Any
+
+from textual.command import Hit, Hits, Provider
+
+from yurei.index import FuzzyIndex
+
+from .key_table import display_value
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from yurei.tui.app import YureiApp
+
+__all__ = ("SaveKeyProvider", "build_search_index", "sync_search_index")
+
+# the palette only ever shows a screenful, so don't build hits nobody will see
+MAX_HITS = 30
+
+
+def _document(key: str, entry: Any, /) -> str:
+    return f"{key} = {display_value(entry['value'])}" if type(entry) is dict else key
+
+
+def build_search_index(entries: Mapping[str, Any], /) -> FuzzyIndex:
+    return FuzzyIndex((key, _document(key, entry)) for key, entry in entries.items())
+
+
+def sync_search_index(index: FuzzyIndex, entries: Mapping[str, Any], /) -> None:
+    """Bring ``index`` up to date with ``entries``, only touching the documents that changed."""
+    for key in [key for key in index if key not in entries]:
+        index.discard(key)
+    for key, entry in entries.items():
+        document = _document(key, entry)
+        if index.get(key) != document:
+            index.set(key, document)
+
+
+class SaveKeyProvider(Provider):
+    """Command palette search over every key and value of the loaded save."""
+
+    @property
+    def _app(self) -> YureiApp:
+        return self.app  # pyright: ignore[reportReturnType] # this provider is only registered by `YureiApp`
+
+    async def startup(self) -> None:
+        # values may have been edited since the index was built on load
+        sync_search_index(self._app.search_index, self._app.save_file.entries)
+
+    async def search(self, query: str) -> Hits:
+        matcher = self.matcher(query)
+        for score, key, text in self._app.search_index.search(query, limit=MAX_HITS):
+            yield Hit(score, matcher.highlight(text), lambda key=key: self._app.jump_to_key(key), text=text)
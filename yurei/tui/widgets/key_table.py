@@ -0,0 +1,225 @@
+import json
+import re
+from typing import TYPE_CHECKING, Any, Literal
+
+from textual import on
+from textual.containers import Horizontal, Vertical
+from textual.widgets import DataTable, Input, Label
+
+from yurei.unlockable import UNLOCKABLE_SUFFIXES
+from yurei.utils import from_json
+
+from .binding import SaveBound
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from textual.app import ComposeResult
+
+    from yurei.tui.app import YureiApp
+
+__all__ = ("KeyTable", "display_value", "key_group", "short_type_name")
+
+GROUPS: tuple[str, ...] = ("Equipment", "Unlockables", "Tasks", "Ghosts", "Settings", "Statistics")
+ASSEMBLY_QUALIFIER_PATTERN: re.Pattern[str] = re.compile(r",\s*(?:mscorlib|Assembly-CSharp)(?:,\s*Version=[^\]]*)?")
+GENERIC_ARITY_PATTERN: re.Pattern[str] = re.compile(r"`\d+\[\[")
+TASK_KEY_PATTERN: re.Pattern[str] = re.compile(r"^(?:daily|weekly|objective)")
+CURSED_POSSESSION_PREFIXES: tuple[str, ...] = (
+    "Bone",
+    "MirrorsFound",
+    "MonkeyPaw",
+    "MusicBoxes",
+    "Ouijas",
+    "Tarot",
+    "Voodoos",
+)
+SETTING_MARKERS: tuple[str, ...] = (
+    "Color",
+    "Difficulty",
+    "Last",
+    "Loadout",
+    "RoleType",
+    "Seed",
+    "Theme",
+    "Tutorial",
+    "Version",
+)
+# containers up to this size are shown inline, larger ones are summarised so opening the table never serialises them
+INLINE_CONTAINER_SIZE = 8
+MAX_CELL_WIDTH = 48
+
+
+def short_type_name(type_name: str, /) -> str:
+    """Turn an assembly qualified .NET type name into something readable, e.g. ``Dictionary<Int32, Int32>``."""
+    name = GENERIC_ARITY_PATTERN.sub("<", ASSEMBLY_QUALIFIER_PATTERN.sub("", type_name))
+    name = name.replace("],[", ", ").replace("]]", ">")
+    return name.replace("System.Collections.Generic.", "").replace("System.", "")
+
+
+def key_group(key: str, /, *, equipment: Iterable[str], unlockables: Iterable[str]) -> str:
+    if key.startswith("ACH_") or any(
+        key.startswith(name) and key.removeprefix(name) in UNLOCKABLE_SUFFIXES for name in unlockables
+    ):
+        return "Unlockables"
+    if TASK_KEY_PATTERN.match(key):
+        return "Tasks"
+    if key.endswith("Inventory") or any(key.startswith((item, f"committed{item}")) for item in equipment):
+        return "Equipment"
+    if "ghost" in key.lower() or key.startswith(CURSED_POSSESSION_PREFIXES):
+        return "Ghosts"
+    if any(marker in key for marker in SETTING_MARKERS):
+        return "Settings"
+    return "Statistics"
+
+
+def display_value(value: Any, /) -> str:
+    if isinstance(value, list | dict) and len(value) > INLINE_CONTAINER_SIZE:  # pyright: ignore[reportUnknownArgumentType] # we only need the length
+        return f"[{len(value)} items]" if isinstance(value, list) else f"{{{len(value)} entries}}"  # pyright: ignore[reportUnknownArgumentType] # as above
+
+    text = json.dumps(value) if isinstance(value, list | dict) else str(value)
+    return text if len(text) <= MAX_CELL_WIDTH else text[: MAX_CELL_WIDTH - 1] + "…"
+
+
+# the input type used to edit each scalar `__type`, anything else is edited as JSON
+SCALAR_INPUT_TYPES: dict[str, Literal["integer", "number", "text"]] = {"int": "integer", "float": "number", "string": "text"}
+BOOL_WORDS: dict[str, bool] = {"true": True, "false": False, "yes": True, "no": False, "y": True, "n": False}
+
+
+def _parse_typed(text: str, /, *, type_name: str, current: Any) -> Any:
+    # some `int` keys actually hold a bool, so go by the value rather than the `__type`
+    if isinstance(current, bool):
+        try:
+            return BOOL_WORDS[text.strip().lower()]
+        except KeyError:
+            msg = f"Expected true or false, got {text!r}."
+            raise ValueError(msg) from None
+
+    match type_name:
+        case "int":
+            return int(text)
+        case "float":
+            return float(text)
+        case "string":
+            return text
+        case _:
+            pass
+
+    value = from_json(text)
+    if type(value) is not type(current):
+        msg = f"Expected a {type(current).__name__}, got a {type(value).__name__}."
+        raise ValueError(msg)
+    return value
+
+
+class KeyTable(SaveBound, Vertical):
+    """Every top level key of the save as a table, with an inline editor for the selected row.
+
+    ``DataTable`` only renders the rows in view, and containers are summarised, so this stays quick on large saves.
+    """
+
+    app: YureiApp
+
+    DEFAULT_CSS = """
+    #key-table-pane {
+        height: 100%;
+        width: 100%;
+    }
+
+    #key-table {
+        height: 1fr;
+    }
+
+    #key-editor {
+        height: auto;
+        padding: 0 1;
+    }
+
+    #key-editor-label {
+        padding: 1 1 0 0;
+    }
+
+    #key-editor-value {
+        width: 1fr;
+    }
+    """
+
+    def __init__(self) -> None:
+        super().__init__(id="key-table-pane")
+        self.border_title = "Browse all keys"
+        self._editing: str | None = None
+
+    def compose(self) -> ComposeResult:
+        yield DataTable[str](id="key-table", cursor_type="row", zebra_stripes=True)
+        with Horizontal(id="key-editor"):
+            yield Label("Select a row to edit it", id="key-editor-label")
+            yield Input(id="key-editor-value", disabled=True, validate_on=["submitted"])
+
+    def on_mount(self) -> None:
+        save = self.app.save_file
+        table: DataTable[str] = self.query_one("#key-table", DataTable)
+        table.add_column("Group", key="group")
+        table.add_column("Key", key="key")
+        table.add_column("Type", key="type")
+        table.add_column("Value", key="value")
+
+        rows: list[tuple[int, str, str]] = []
+        for key in save.entries:
+            group = key_group(key, equipment=save.schema.equipment, unlockables=save.schema.unlockables)
+            rows.append((GROUPS.index(group), key, group))
+        for _, key, group in sorted(rows):
+            entry = save.entries[key]
+            table.add_row(group, key, short_type_name(entry["__type"]), display_value(entry["value"]), key=key)
+        table.focus()
+
+    def sync_from_save(self, key: str, /) -> None:
+        save = self.app.save_file
+        table: DataTable[str] = self.query_one("#key-table", DataTable)
+        entry = save.entries.get(key)
+        if key not in table.rows:
+            if entry:
+                group = key_group(key, equipment=save.schema.equipment, unlockables=save.schema.unlockables)
+                table.add_row(group, key, short_type_name(entry["__type"]), display_value(entry["value"]), key=key)
+        elif not entry:
+            table.remove_row(key)
+        else:
+            # only this cell is repainted
+            table.update_cell(key, "type", short_type_name(entry["__type"]))
+            table.update_cell(key, "value", display_value(entry["value"]))
+
+    def _set_value(self, key: str, value: Any, /) -> None:
+        self.app.save_file.set_value(key, value)
+        self.notify(f"Set {key!r} to {display_value(value)}", title="Success!", severity="information", timeout=3.0)
+
+    @on(DataTable.RowSelected, "#key-table")
+    def on_row_selected(self, event: DataTable.RowSelected) -> None:
+        key = event.row_key.value
+        if not key:
+            return
+
+        entry = self.app.save_file.entries[key]
+        current = entry["value"]
+        # a click or Enter only opens the editor, bools included, nothing changes until the edit is submitted
+        is_bool = isinstance(current, bool)
+        editor = self.query_one("#key-editor-value", Input)
+        self._editing = key
+        self.query_one("#key-editor-label", Label).update(f"{key} (true/false):" if is_bool else f"{key}:")
+        editor.type = "text" if is_bool else SCALAR_INPUT_TYPES.get(entry["__type"], "text")
+        editor.value = current if isinstance(current, str) else json.dumps(current)
+        editor.disabled = False
+        editor.focus()
+
+    @on(Input.Submitted, "#key-editor-value")
+    def on_editor_submitted(self, event: Input.Submitted) -> None:
+        key = self._editing
+        if not key:
+            return
+
+        entry = self.app.save_file.entries[key]
+        try:
+            value = _parse_typed(event.value, type_name=entry["__type"], current=entry["value"])
+        except ValueError as err:
+            self.notify(str(err), title=f"Invalid value for {key!r}", severity="error", timeout=3.0)
+            return
+
+        self._set_value(key, value)
+        self.query_one("#key-table", DataTable).focus()
@@ -2,26 +2,34 @@ from typing import TYPE_CHECKING
 
 from textual import on
 from textual.containers import Grid
+from textual.reactive import reactive
 from textual.validation import Integer
 from textual.widgets import Input, Label
 
+from .binding import SaveBound
+
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
     from ..app import YureiApp  # noqa: TID252
 
 
-class LevelGrid(Grid):
+class LevelGrid(SaveBound, Grid):
     app: YureiApp
+    BOUND_KEYS = ("Level", "NewLevel", "Prestige")
+    level: reactive[int] = reactive(0, init=False)
+    prestige: reactive[int] = reactive(0, init=False)
 
     def __init__(self) -> None:
         super().__init__(id="level-prestige-grid", classes="two-col")
         self.border_title = "Alter your level/prestige"
+        self.set_reactive(LevelGrid.level, self.app.save_file.level)
+        self.set_reactive(LevelGrid.prestige, self.app.save_file.prestige)
 
     def compose(self) -> ComposeResult:
         yield Label("Prestige:", id="prestige-label")
         yield Input(
-            placeholder=str(self.app.save_file.prestige),
+            placeholder=str(self.prestige),
             type="integer",
             validate_on=["blur", "submitted"],
             validators=[
@@ -31,7 +39,7 @@ class LevelGrid(Grid):
         )
         yield (Label("Level:", id="level-label"))
         yield Input(
-            placeholder=str(self.app.save_file.level),
+            placeholder=str(self.level),
             type="integer",
             validate_on=["submitted", "blur"],
             validators=[
@@ -40,6 +48,17 @@ class LevelGrid(Grid):
             id="level-level-input",
         )
 
+    def sync_from_save(self, _: str, /) -> None:
+        # the level a save reports depends on its prestige, so either key refreshes both
+        self.level = self.app.save_file.level
+        self.prestige = self.app.save_file.prestige
+
+    def watch_level(self, level: int) -> None:
+        self.query_one("#level-level-input", Input).placeholder = str(level)
+
+    def watch_prestige(self, prestige: int) -> None:
+        self.query_one("#level-prestige-input", Input).placeholder = str(prestige)
+
     @on(Input.Submitted, "#level-level-input")
     @on(Input.Blurred, "#level-level-input")
     async def handle_level_input(self, event: Input.Submitted | Input.Blurred) -> None:
@@ -1,28 +1,40 @@
 from typing import TYPE_CHECKING
 
 from textual.containers import Grid
+from textual.reactive import reactive
 from textual.validation import Integer
 from textual.widgets import Input, Label
 
+from .binding import SaveBound
+
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
     from ..app import YureiApp  # noqa: TID252
 
 
-class MoneyGrid(Grid):
+class MoneyGrid(SaveBound, Grid):
     app: YureiApp
+    BOUND_KEYS = ("PlayersMoney",)
+    money: reactive[int] = reactive(0, init=False)
 
     def __init__(self) -> None:
         super().__init__(id="money-scroll", classes="two-col")
         self.border_title = "Alter your money"
+        self.set_reactive(MoneyGrid.money, self.app.save_file.money)
 
     def compose(self) -> ComposeResult:
         yield Label("Money:", id="money-label")
         yield Input(
-            placeholder=f"{self.app.save_file.money}",
+            placeholder=f"{self.money}",
             type="integer",
             validate_on=["submitted", "blur"],
             validators=[Integer(0, 249999, "must be between 0 and 249,999")],
             id="money-value",
         )
+
+    def sync_from_save(self, _: str, /) -> None:
+        self.money = self.app.save_file.money
+
+    def watch_money(self, money: int) -> None:
+        self.query_one("#money-value", Input).placeholder = str(money)
@@ -59,5 +59,4 @@ class UnlockGearGrid(Grid):
         for value in select.selected:
             self.app.save_file.unlock_equipment(item=Equipment(value), tier=tier.selection)
 
-        self.app.refresh_code_container()
         self.notify(f"Unlocked {human_join(select.selected)} at tier {tier.selection}.")
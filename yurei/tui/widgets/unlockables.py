@@ -6,8 +6,6 @@ from textual.css.query import NoMatches
 from textual.validation import Integer
 from textual.widgets import Button, Checkbox, Input, RadioButton, RadioSet, Static
 
-from yurei.unlockable import LOOKUP
-
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
@@ -18,9 +16,9 @@ if TYPE_CHECKING:
 class UnlockablePane(VerticalScroll):
     app: YureiApp
 
-    def __init__(self, id_: str, /, *, radio_set_id: str) -> None:
+    def __init__(self, id_: str, /, *, radio_set_id: str, unlockables: dict[str, str]) -> None:
         super().__init__(
-            RadioSet(*[RadioButton(k, id=v) for k, v in LOOKUP.items()], id=radio_set_id),
+            RadioSet(*[RadioButton(v, id=k) for k, v in unlockables.items()], id=radio_set_id),
             Button("Back", variant="default", name="back-button", id="unlockables-back-button", flat=True),
             id=id_,
         )
@@ -28,8 +26,9 @@ class UnlockablePane(VerticalScroll):
         self.border_subtitle = "Achievements and Easter Eggs"
 
     @on(Button.Pressed, "#unlockables-back-button")
-    async def revert_to_primary_screen(self) -> None:
-        return await self.app.file_selected(self.app.save_file.save_path)
+    def revert_to_primary_screen(self) -> None:
+        # the options are kept alive underneath, so going back never touches the disk
+        self.app.show_methods_pane()
 
 
 class AchievementManageGrid(Grid):
@@ -122,11 +121,11 @@ class AchievementManageGrid(Grid):
         if completed.value:
             self.achievement.completed = True
             self.achievement.progression = (
-                True if self.achievement.no_progression_count else self.achievement.MAX_PROGRESSION_VALUE
+                True if self.achievement.no_progression_count else self.achievement.max_progression_value
             )
         if received.value:
             self.achievement.received = True
 
-        setattr(self.app.save_file.unlockable_manager, self.achievement.attribute_name, self.achievement)
+        self.app.save_file.unlockable_manager.set_handler(self.achievement)
         self.app.refresh_code_container()
         self.app.notify(f"Submitted achievement info for {self.achievement.pretty_name}", title="Success!", timeout=3.0)
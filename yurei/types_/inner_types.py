@@ -4,7 +4,7 @@ if TYPE_CHECKING:
     from .colour import Colour
     from .difficulty import Difficulty
 
-__all__ = ("Bool", "ColourValue", "Dict", "DifficultyValue", "Float", "Int", "List", "String")
+__all__ = ("Bool", "ColourValue", "Dict", "DifficultyValue", "Float", "Int", "IntBool", "List", "String")
 
 
 class String(TypedDict):
@@ -17,6 +17,12 @@ class Int(TypedDict):
     value: int
 
 
+# tagged as an int, but the game writes a bool into some of these
+class IntBool(TypedDict):
+    __type: Literal["int"]
+    value: int | bool
+
+
 class Float(TypedDict):
     __type: Literal["float"]
     value: float
@@ -1,6 +1,6 @@
 from typing import TypedDict
 
-from .inner_types import Bool, ColourValue, Dict, DifficultyValue, Float, Int, List, SpecialPlayedMaps, String
+from .inner_types import Bool, ColourValue, Dict, DifficultyValue, Float, Int, IntBool, List, SpecialPlayedMaps, String
 
 __all__ = ("Save",)
 
@@ -410,7 +410,7 @@ Save = TypedDict(
         "itemsLost": Int,
         "lastSmallSunnyMeadowsMap": Int,
         "lighthouseFerrymenCompleted": Int,
-        "lighthouseFerrymenProgression": Int,
+        "lighthouseFerrymenProgression": IntBool,
         "lighthouseFerrymenReceived": Int,
         "lighthouseKeeperCompleted": Int,
         "lighthouseKeeperProgression": Int,
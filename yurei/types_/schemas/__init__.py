@@ -0,0 +1,7 @@
+# This file is generated by `create_type.py`, do not edit it by hand.
+from . import v_nells_diner
+
+__all__ = ("SCHEMA_MODULES",)
+
+# in order of registration, the last entry is the newest layout
+SCHEMA_MODULES = (v_nells_diner,)
@@ -0,0 +1,2956 @@
+# This file is generated by `create_type.py` from `yurei/types_/save.py`, do not edit it by hand.
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+__all__ = (
+    "EQUIPMENT",
+    "FINGERPRINTS",
+    "KEYS",
+    "NAME",
+    "UNLOCKABLES",
+    "UNLOCKABLES_BY_FINGERPRINT",
+    "validate_save",
+)
+
+NAME: str = "nells-diner"
+FINGERPRINTS: frozenset[str] = frozenset(
+    [
+        "4a1a706f4c12d4e32bcaf9db86dd0e57",
+        "4cc527a8f0027dd1998cf4827aa13e64",
+        "53a1155acadc34d46cc862514342f83f",
+        "9b36d7cb13f134dea6809346b2ff442d",
+    ]
+)
+# the unlockables of each layout above, so loading a save of one of them doesn't search its keys
+UNLOCKABLES_BY_FINGERPRINT: dict[str, tuple[str, ...]] = {
+    "4a1a706f4c12d4e32bcaf9db86dd0e57": (
+        "FarmhouseFieldwork",
+        "lighthouseFerrymen",
+        "lighthouseKeeper",
+        "rangerChallenge",
+        "sunnyMeadowsSurvival",
+    ),
+    "4cc527a8f0027dd1998cf4827aa13e64": (
+        "FarmhouseFieldwork",
+        "Moneybags",
+        "NellsDiner",
+        "dinerGhostInTheMachine",
+        "lighthouseFerrymen",
+        "lighthouseKeeper",
+        "rangerChallenge",
+        "sunnyMeadowsSurvival",
+    ),
+    "53a1155acadc34d46cc862514342f83f": (
+        "FarmhouseFieldwork",
+        "lighthouseFerrymen",
+        "lighthouseKeeper",
+        "rangerChallenge",
+        "sunnyMeadowsSurvival",
+    ),
+    "9b36d7cb13f134dea6809346b2ff442d": (
+        "FarmhouseFieldwork",
+        "Moneybags",
+        "NellsDiner",
+        "dinerGhostInTheMachine",
+        "lighthouseFerrymen",
+        "lighthouseKeeper",
+        "rangerChallenge",
+        "sunnyMeadowsSurvival",
+    ),
+}
+KEYS: frozenset[str] = frozenset(
+    [
+        "ACH_COMPLETE_10_WEEKLY_TASKS",
+        "ACH_COMPLETE_30_DAILY_TASKS",
+        "ACH_COMPLETE_FIFTY_OPTIONAL_OBJECTIVES",
+        "ACH_COMPLETE_THE_WEEKLY_CHALLENGE_MODE_FIVE_TIMES",
+        "ACH_COMPLETE_THE_WEEKLY_CHALLENGE_MODE_TEN_TIMES",
+        "ACH_GET_KILLED_BY_A_BANSHEE_IN_MULTIPLAYER",
+        "ACH_WITNESS_POLTERGEIST_ABILITY",
+        "AchievementHunterProgression",
+        "Bone0",
+        "Bone1",
+        "Bone10",
+        "Bone11",
+        "Bone12",
+        "Bone2",
+        "Bone3",
+        "Bone4",
+        "Bone5",
+        "Bone6",
+        "Bone7",
+        "Bone8",
+        "Bone9",
+        "CameraInventory",
+        "CandleInventory",
+        "Crucifix-1Tier",
+        "Crucifix0Tier",
+        "Crucifix1Tier",
+        "Crucifix2Tier",
+        "Crucifix3Tier",
+        "Crucifix4Tier",
+        "CrucifixInventory",
+        "CrucifixTier",
+        "CrucifixTierOneUnlockOwned",
+        "CrucifixTierThreeUnlockOwned",
+        "CrucifixTierTwoUnlockOwned",
+        "CursorColor",
+        "DOTSProjector-1Tier",
+        "DOTSProjector0Amount",
+        "DOTSProjector0Tier",
+        "DOTSProjector1Tier",
+        "DOTSProjector2Tier",
+        "DOTSProjector3Tier",
+        "DOTSProjector4Tier",
+        "DOTSProjectorInventory",
+        "DOTSProjectorTier",
+        "DOTSProjectorTierOneUnlockOwned",
+        "DOTSProjectorTierThreeUnlockOwned",
+        "DOTSProjectorTierTwoUnlockOwned",
+        "DSLRCameraInventory",
+        "EMFReader-1Tier",
+        "EMFReader0Tier",
+        "EMFReader1Tier",
+        "EMFReader2Tier",
+        "EMFReader3Tier",
+        "EMFReader4Tier",
+        "EMFReaderInventory",
+        "EMFReaderTier",
+        "EMFReaderTierOneUnlockOwned",
+        "EMFReaderTierThreeUnlockOwned",
+        "EMFReaderTierTwoUnlockOwned",
+        "EVPRecorderInventory",
+        "EquippedLoadout",
+        "Experience",
+        "FarmhouseFieldworkCompleted",
+        "FarmhouseFieldworkProgression",
+        "FarmhouseFieldworkReceived",
+        "Firelight-1Tier",
+        "Firelight0Tier",
+        "Firelight1Tier",
+        "Firelight2Tier",
+        "Firelight3Tier",
+        "Firelight4Tier",
+        "FirelightInventory",
+        "FirelightTier",
+        "FirelightTierOneUnlockOwned",
+        "FirelightTierThreeUnlockOwned",
+        "FirelightTierTwoUnlockOwned",
+        "Flashlight-1Tier",
+        "Flashlight0Tier",
+        "Flashlight1Tier",
+        "Flashlight2Tier",
+        "Flashlight3Tier",
+        "Flashlight4Tier",
+        "FlashlightInventory",
+        "FlashlightTier",
+        "FlashlightTierOneUnlockOwned",
+        "FlashlightTierThreeUnlockOwned",
+        "FlashlightTierTwoUnlockOwned",
+        "FoundMonkeyWishGhost",
+        "GhostType",
+        "GhostWritingBook-1Tier",
+        "GhostWritingBook0Tier",
+        "GhostWritingBook1Tier",
+        "GhostWritingBook2Tier",
+        "GhostWritingBook3Tier",
+        "GhostWritingBook4Tier",
+        "GhostWritingBookInventory",
+        "GhostWritingBookTier",
+        "GhostWritingBookTierOneUnlockOwned",
+        "GhostWritingBookTierThreeUnlockOwned",
+        "GhostWritingBookTierTwoUnlockOwned",
+        "GlowstickInventory",
+        "HeadGear-1Tier",
+        "HeadGear0Tier",
+        "HeadGear1Tier",
+        "HeadGear2Tier",
+        "HeadGear3Tier",
+        "HeadGear4Tier",
+        "HeadGearInventory",
+        "HeadGearTier",
+        "HeadGearTierOneUnlockOwned",
+        "HeadGearTierThreeUnlockOwned",
+        "HeadGearTierTwoUnlockOwned",
+        "HeadMountedCameraInventory",
+        "IRLightSensorInventory",
+        "Igniter-1Tier",
+        "Igniter0Tier",
+        "Igniter1Tier",
+        "Igniter2Tier",
+        "Igniter3Tier",
+        "Igniter4Tier",
+        "IgniterInventory",
+        "IgniterTier",
+        "IgniterTierOneUnlockOwned",
+        "IgniterTierThreeUnlockOwned",
+        "IgniterTierTwoUnlockOwned",
+        "InventoryTutorialComplete",
+        "LastDifficulty",
+        "LastLoadout",
+        "LastMode",
+        "LegacyColor",
+        "Level",
+        "LighterInventory",
+        "Loadout0Name",
+        "Loadout3Name",
+        "LoadoutTutorialComplete",
+        "MirrorsFound",
+        "MoneybagsCompleted",
+        "MoneybagsProgression",
+        "MoneybagsReceived",
+        "MonkeyPawFound",
+        "MotionSensor-1Tier",
+        "MotionSensor0Tier",
+        "MotionSensor1Tier",
+        "MotionSensor2Tier",
+        "MotionSensor3Tier",
+        "MotionSensor4Tier",
+        "MotionSensorInventory",
+        "MotionSensorTier",
+        "MotionSensorTierOneUnlockOwned",
+        "MotionSensorTierThreeUnlockOwned",
+        "MotionSensorTierTwoUnlockOwned",
+        "MusicBoxesFound",
+        "NellsDinerCompleted",
+        "NellsDinerProgression",
+        "NellsDinerReceived",
+        "NewLevel",
+        "OuijasFound",
+        "ParabolicMicrophone-1Tier",
+        "ParabolicMicrophone0Tier",
+        "ParabolicMicrophone1Tier",
+        "ParabolicMicrophone2Tier",
+        "ParabolicMicrophone3Tier",
+        "ParabolicMicrophone4Tier",
+        "ParabolicMicrophoneInventory",
+        "ParabolicMicrophoneTier",
+        "ParabolicMicrophoneTierOneUnlockOwned",
+        "ParabolicMicrophoneTierThreeUnlockOwned",
+        "ParabolicMicrophoneTierTwoUnlockOwned",
+        "PhotoCamera-1Tier",
+        "PhotoCamera0Amount",
+        "PhotoCamera0Tier",
+        "PhotoCamera1Tier",
+        "PhotoCamera2Tier",
+        "PhotoCamera3Tier",
+        "PhotoCamera4Tier",
+        "PhotoCameraInventory",
+        "PhotoCameraTier",
+        "PhotoCameraTierOneUnlockOwned",
+        "PhotoCameraTierThreeUnlockOwned",
+        "PhotoCameraTierTwoUnlockOwned",
+        "Player0Color",
+        "Player1Color",
+        "Player2Color",
+        "Player3Color",
+        "PlayersMoney",
+        "Prestige",
+        "PrestigeIndex",
+        "PrestigeTheme",
+        "Repellent-1Tier",
+        "Repellent0Tier",
+        "Repellent1Tier",
+        "Repellent2Tier",
+        "Repellent3Tier",
+        "Repellent4Tier",
+        "RepellentInventory",
+        "RepellentTier",
+        "RepellentTierOneUnlockOwned",
+        "RepellentTierThreeUnlockOwned",
+        "RepellentTierTwoUnlockOwned",
+        "RewardMultiplier",
+        "RoleType",
+        "SageInventory",
+        "Salt-1Tier",
+        "Salt0Tier",
+        "Salt1Tier",
+        "Salt2Tier",
+        "Salt3Tier",
+        "Salt4Tier",
+        "SaltInventory",
+        "SaltTier",
+        "SaltTierOneUnlockOwned",
+        "SaltTierThreeUnlockOwned",
+        "SaltTierTwoUnlockOwned",
+        "SanityMedication-1Tier",
+        "SanityMedication0Tier",
+        "SanityMedication1Tier",
+        "SanityMedication2Tier",
+        "SanityMedication3Tier",
+        "SanityMedication4Tier",
+        "SanityMedicationInventory",
+        "SanityMedicationTier",
+        "SanityMedicationTierOneUnlockOwned",
+        "SanityMedicationTierThreeUnlockOwned",
+        "SanityMedicationTierTwoUnlockOwned",
+        "SanityPillsInventory",
+        "SaveVersion",
+        "ShopTutorialComplete",
+        "SoundRecorder-1Tier",
+        "SoundRecorder0Tier",
+        "SoundRecorder1Tier",
+        "SoundRecorder2Tier",
+        "SoundRecorder3Tier",
+        "SoundRecorder4Tier",
+        "SoundRecorderInventory",
+        "SoundRecorderTier",
+        "SoundRecorderTierOneUnlockOwned",
+        "SoundRecorderTierThreeUnlockOwned",
+        "SoundRecorderTierTwoUnlockOwned",
+        "SoundSensor-1Tier",
+        "SoundSensor0Tier",
+        "SoundSensor1Tier",
+        "SoundSensor2Tier",
+        "SoundSensor3Tier",
+        "SoundSensor4Tier",
+        "SoundSensorInventory",
+        "SoundSensorTier",
+        "SoundSensorTierOneUnlockOwned",
+        "SoundSensorTierThreeUnlockOwned",
+        "SoundSensorTierTwoUnlockOwned",
+        "SpiritBox-1Tier",
+        "SpiritBox0Tier",
+        "SpiritBox1Tier",
+        "SpiritBox2Tier",
+        "SpiritBox3Tier",
+        "SpiritBox4Tier",
+        "SpiritBoxInventory",
+        "SpiritBoxTier",
+        "SpiritBoxTierOneUnlockOwned",
+        "SpiritBoxTierThreeUnlockOwned",
+        "SpiritBoxTierTwoUnlockOwned",
+        "StrongFlashlightInventory",
+        "SummoningCirclesUsed",
+        "TarotDeath",
+        "TarotDevil",
+        "TarotFool",
+        "TarotHermit",
+        "TarotMoon",
+        "TarotPriestess",
+        "TarotSun",
+        "TarotTower",
+        "TarotWheel",
+        "Thermometer-1Tier",
+        "Thermometer0Tier",
+        "Thermometer1Tier",
+        "Thermometer2Tier",
+        "Thermometer3Tier",
+        "Thermometer4Tier",
+        "ThermometerInventory",
+        "ThermometerTier",
+        "ThermometerTierOneUnlockOwned",
+        "ThermometerTierThreeUnlockOwned",
+        "ThermometerTierTwoUnlockOwned",
+        "Tripod-1Tier",
+        "Tripod0Tier",
+        "Tripod1Tier",
+        "Tripod2Tier",
+        "Tripod3Tier",
+        "Tripod4Tier",
+        "TripodInventory",
+        "TripodTier",
+        "TripodTierOneUnlockOwned",
+        "TripodTierThreeUnlockOwned",
+        "TripodTierTwoUnlockOwned",
+        "UVFlashlightInventory",
+        "UVLight-1Tier",
+        "UVLight0Tier",
+        "UVLight1Tier",
+        "UVLight2Tier",
+        "UVLight3Tier",
+        "UVLight4Tier",
+        "UVLightInventory",
+        "UVLightTier",
+        "UVLightTierOneUnlockOwned",
+        "UVLightTierThreeUnlockOwned",
+        "UVLightTierTwoUnlockOwned",
+        "VideoCamera-1Tier",
+        "VideoCamera0Tier",
+        "VideoCamera1Tier",
+        "VideoCamera2Tier",
+        "VideoCamera3Tier",
+        "VideoCamera4Tier",
+        "VideoCameraInventory",
+        "VideoCameraTier",
+        "VideoCameraTierOneUnlockOwned",
+        "VideoCameraTierThreeUnlockOwned",
+        "VideoCameraTierTwoUnlockOwned",
+        "VoodoosFound",
+        "abilitiesUsed",
+        "amountOfBonesCollected",
+        "amountOfCursedHuntsTriggered",
+        "amountOfCursedPossessionsUsed",
+        "amountOfGhostEvents",
+        "amountOfGhostHunts",
+        "amountOfGhostInteractions",
+        "committedCrucifixAmount",
+        "committedDOTSProjectorAmount",
+        "committedEMFReaderAmount",
+        "committedFirelightAmount",
+        "committedFlashlightAmount",
+        "committedGhostWritingBookAmount",
+        "committedHeadGearAmount",
+        "committedIgniterAmount",
+        "committedMotionSensorAmount",
+        "committedParabolicMicrophoneAmount",
+        "committedPhotoCameraAmount",
+        "committedRepellentAmount",
+        "committedSaltAmount",
+        "committedSanityMedicationAmount",
+        "committedSoundRecorderAmount",
+        "committedSoundSensorAmount",
+        "committedSpiritBoxAmount",
+        "committedThermometerAmount",
+        "committedTripodAmount",
+        "committedUVLightAmount",
+        "committedVideoCameraAmount",
+        "currentSeasonalEvent",
+        "daily-1Completed",
+        "daily-1Progression",
+        "daily-1Received",
+        "daily-1Recieved",
+        "daily-1Variant",
+        "daily0",
+        "daily0Completed",
+        "daily0Progression",
+        "daily0Received",
+        "daily0Recieved",
+        "daily0Variant",
+        "daily1",
+        "daily11Variant",
+        "daily12Variant",
+        "daily13Variant",
+        "daily14Variant",
+        "daily15Variant",
+        "daily1Completed",
+        "daily1Progression",
+        "daily1Received",
+        "daily1Recieved",
+        "daily1Variant",
+        "daily2",
+        "daily2Completed",
+        "daily2Progression",
+        "daily2Received",
+        "daily2Recieved",
+        "daily2Variant",
+        "daily3",
+        "daily3Completed",
+        "daily3Progression",
+        "daily3Received",
+        "daily3Recieved",
+        "daily3Variant",
+        "daily4Variant",
+        "daily6Variant",
+        "daily7Variant",
+        "daily8Variant",
+        "daily9Variant",
+        "dailyChallengeSeed",
+        "diedAmount",
+        "dinerGhostInTheMachineCompleted",
+        "dinerGhostInTheMachineProgression",
+        "dinerGhostInTheMachineReceived",
+        "distanceTravelled",
+        "doorsMoved",
+        "fuseboxToggles",
+        "ghostDistanceTravelled",
+        "ghostKills",
+        "ghostsIdentifiedAmount",
+        "ghostsMisidentifiedAmount",
+        "ghostsRepelled",
+        "halloween23Complete",
+        "itemsBought",
+        "itemsLost",
+        "lastSmallSunnyMeadowsMap",
+        "lighthouseFerrymenCompleted",
+        "lighthouseFerrymenProgression",
+        "lighthouseFerrymenReceived",
+        "lighthouseKeeperCompleted",
+        "lighthouseKeeperProgression",
+        "lighthouseKeeperReceived",
+        "lightsSwitched",
+        "moneyEarned",
+        "moneySpent",
+        "mostCommonGhosts",
+        "objective0Completed",
+        "objective1Completed",
+        "objective2Completed",
+        "objectivesCompleted",
+        "objectsUsed",
+        "photosTaken",
+        "phrasesRecognized",
+        "playedMaps",
+        "rangerChallengeCompleted",
+        "rangerChallengeProgression",
+        "rangerChallengeReceived",
+        "recentPlayerIDS",
+        "recentPlayerNames",
+        "recentPlayerPlatformIDS",
+        "recentPlayerPlatforms",
+        "revivedAmount",
+        "roomChanged",
+        "sanityGained",
+        "sanityLost",
+        "soundsTaken",
+        "sunnyMeadowsSurvivalCompleted",
+        "sunnyMeadowsSurvivalProgression",
+        "sunnyMeadowsSurvivalReceived",
+        "timeInFavouriteRoom",
+        "timeSpentBeingChased",
+        "timeSpentInDark",
+        "timeSpentInGhostsRoom",
+        "timeSpentInLight",
+        "timeSpentInTruck",
+        "timeSpentInvestigating",
+        "totalHuntTime",
+        "videosTaken",
+        "weekly-1Completed",
+        "weekly-1Progression",
+        "weekly-1Received",
+        "weekly-1Recieved",
+        "weekly-1Variant",
+        "weekly0",
+        "weekly0Completed",
+        "weekly0Progression",
+        "weekly0Received",
+        "weekly0Recieved",
+        "weekly0Variant",
+        "weekly1",
+        "weekly1Completed",
+        "weekly1Progression",
+        "weekly1Received",
+        "weekly1Recieved",
+        "weekly1Variant",
+        "weekly2",
+        "weekly2Completed",
+        "weekly2Progression",
+        "weekly2Received",
+        "weekly2Recieved",
+        "weekly2Variant",
+        "weeklyChallengeSeed",
+        "weeklyDifficultyCompleted",
+        "weeklyDifficultyProgression",
+        "weeklyDifficultyRecieved",
+        "weeklyDifficultySeed",
+    ]
+)
+EQUIPMENT: tuple[str, ...] = (
+    "Crucifix",
+    "DOTSProjector",
+    "EMFReader",
+    "Firelight",
+    "Flashlight",
+    "GhostWritingBook",
+    "HeadGear",
+    "Igniter",
+    "MotionSensor",
+    "ParabolicMicrophone",
+    "PhotoCamera",
+    "Repellent",
+    "Salt",
+    "SanityMedication",
+    "SoundRecorder",
+    "SoundSensor",
+    "SpiritBox",
+    "Thermometer",
+    "Tripod",
+    "UVLight",
+    "VideoCamera",
+)
+UNLOCKABLES: tuple[str, ...] = (
+    "FarmhouseFieldwork",
+    "Moneybags",
+    "NellsDiner",
+    "dinerGhostInTheMachine",
+    "lighthouseFerrymen",
+    "lighthouseKeeper",
+    "rangerChallenge",
+    "sunnyMeadowsSurvival",
+)
+
+
+# exact type checks throughout, `isinstance` would take a bool for an int
+def _is_colour(value: Any) -> bool:
+    return type(value) is dict and all(type(value.get(channel)) in {int, float} for channel in "rgba")
+
+
+def _is_list_of(value: Any, inner: type) -> bool:
+    return type(value) is list and all(type(item) is inner for item in value)
+
+
+def _is_dict_of(value: Any, inner: type) -> bool:
+    return type(value) is dict and all(type(item) is inner for item in value.values())
+
+
+def _describe(key: str, expected: str, entry: Any) -> str:
+    if type(entry) is not dict:
+        return f"{key}: expected an object with `__type` and `value`, got {type(entry).__name__}"
+    return f"{key}: expected {expected}, got `__type`={entry.get('__type')!r} value={entry.get('value')!r:.50}"
+
+
+def validate_save(data: Mapping[str, Any], /) -> list[str]:  # noqa: PLR0915 # one straight-line check per key
+    errors: list[str] = []
+    get = data.get
+    entry = get("ACH_COMPLETE_10_WEEKLY_TASKS")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ACH_COMPLETE_10_WEEKLY_TASKS", "int", entry))
+    entry = get("ACH_COMPLETE_30_DAILY_TASKS")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ACH_COMPLETE_30_DAILY_TASKS", "int", entry))
+    entry = get("ACH_COMPLETE_FIFTY_OPTIONAL_OBJECTIVES")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ACH_COMPLETE_FIFTY_OPTIONAL_OBJECTIVES", "int", entry))
+    entry = get("ACH_COMPLETE_THE_WEEKLY_CHALLENGE_MODE_FIVE_TIMES")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ACH_COMPLETE_THE_WEEKLY_CHALLENGE_MODE_FIVE_TIMES", "int", entry))
+    entry = get("ACH_COMPLETE_THE_WEEKLY_CHALLENGE_MODE_TEN_TIMES")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ACH_COMPLETE_THE_WEEKLY_CHALLENGE_MODE_TEN_TIMES", "int", entry))
+    entry = get("ACH_GET_KILLED_BY_A_BANSHEE_IN_MULTIPLAYER")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ACH_GET_KILLED_BY_A_BANSHEE_IN_MULTIPLAYER", "int", entry))
+    entry = get("ACH_WITNESS_POLTERGEIST_ABILITY")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ACH_WITNESS_POLTERGEIST_ABILITY", "int", entry))
+    entry = get("AchievementHunterProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("AchievementHunterProgression", "int", entry))
+    entry = get("Bone0")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone0", "int", entry))
+    entry = get("Bone1")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone1", "int", entry))
+    entry = get("Bone10")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone10", "int", entry))
+    entry = get("Bone11")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone11", "int", entry))
+    entry = get("Bone12")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone12", "int", entry))
+    entry = get("Bone2")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone2", "int", entry))
+    entry = get("Bone3")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone3", "int", entry))
+    entry = get("Bone4")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone4", "int", entry))
+    entry = get("Bone5")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone5", "int", entry))
+    entry = get("Bone6")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone6", "int", entry))
+    entry = get("Bone7")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone7", "int", entry))
+    entry = get("Bone8")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone8", "int", entry))
+    entry = get("Bone9")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Bone9", "int", entry))
+    entry = get("CameraInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("CameraInventory", "int", entry))
+    entry = get("CandleInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("CandleInventory", "int", entry))
+    entry = get("Crucifix-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Crucifix-1Tier", "int", entry))
+    entry = get("Crucifix0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Crucifix0Tier", "int", entry))
+    entry = get("Crucifix1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Crucifix1Tier", "int", entry))
+    entry = get("Crucifix2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Crucifix2Tier", "int", entry))
+    entry = get("Crucifix3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Crucifix3Tier", "int", entry))
+    entry = get("Crucifix4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Crucifix4Tier", "int", entry))
+    entry = get("CrucifixInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("CrucifixInventory", "int", entry))
+    entry = get("CrucifixTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("CrucifixTier", "int", entry))
+    entry = get("CrucifixTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("CrucifixTierOneUnlockOwned", "bool", entry))
+    entry = get("CrucifixTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("CrucifixTierThreeUnlockOwned", "bool", entry))
+    entry = get("CrucifixTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("CrucifixTierTwoUnlockOwned", "bool", entry))
+    entry = get("CursorColor")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "Color" or not _is_colour(value):
+            errors.append(_describe("CursorColor", "Color", entry))
+    entry = get("DOTSProjector-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DOTSProjector-1Tier", "int", entry))
+    entry = get("DOTSProjector0Amount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DOTSProjector0Amount", "int", entry))
+    entry = get("DOTSProjector0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DOTSProjector0Tier", "int", entry))
+    entry = get("DOTSProjector1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DOTSProjector1Tier", "int", entry))
+    entry = get("DOTSProjector2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DOTSProjector2Tier", "int", entry))
+    entry = get("DOTSProjector3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DOTSProjector3Tier", "int", entry))
+    entry = get("DOTSProjector4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DOTSProjector4Tier", "int", entry))
+    entry = get("DOTSProjectorInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DOTSProjectorInventory", "int", entry))
+    entry = get("DOTSProjectorTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DOTSProjectorTier", "int", entry))
+    entry = get("DOTSProjectorTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("DOTSProjectorTierOneUnlockOwned", "bool", entry))
+    entry = get("DOTSProjectorTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("DOTSProjectorTierThreeUnlockOwned", "bool", entry))
+    entry = get("DOTSProjectorTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("DOTSProjectorTierTwoUnlockOwned", "bool", entry))
+    entry = get("DSLRCameraInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("DSLRCameraInventory", "int", entry))
+    entry = get("EMFReader-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EMFReader-1Tier", "int", entry))
+    entry = get("EMFReader0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EMFReader0Tier", "int", entry))
+    entry = get("EMFReader1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EMFReader1Tier", "int", entry))
+    entry = get("EMFReader2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EMFReader2Tier", "int", entry))
+    entry = get("EMFReader3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EMFReader3Tier", "int", entry))
+    entry = get("EMFReader4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EMFReader4Tier", "int", entry))
+    entry = get("EMFReaderInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EMFReaderInventory", "int", entry))
+    entry = get("EMFReaderTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EMFReaderTier", "int", entry))
+    entry = get("EMFReaderTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("EMFReaderTierOneUnlockOwned", "bool", entry))
+    entry = get("EMFReaderTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("EMFReaderTierThreeUnlockOwned", "bool", entry))
+    entry = get("EMFReaderTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("EMFReaderTierTwoUnlockOwned", "bool", entry))
+    entry = get("EVPRecorderInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EVPRecorderInventory", "int", entry))
+    entry = get("EquippedLoadout")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("EquippedLoadout", "int", entry))
+    entry = get("Experience")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Experience", "int", entry))
+    entry = get("FarmhouseFieldworkCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("FarmhouseFieldworkCompleted", "int", entry))
+    entry = get("FarmhouseFieldworkProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("FarmhouseFieldworkProgression", "int", entry))
+    entry = get("FarmhouseFieldworkReceived")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("FarmhouseFieldworkReceived", "int", entry))
+    entry = get("Firelight-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Firelight-1Tier", "int", entry))
+    entry = get("Firelight0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Firelight0Tier", "int", entry))
+    entry = get("Firelight1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Firelight1Tier", "int", entry))
+    entry = get("Firelight2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Firelight2Tier", "int", entry))
+    entry = get("Firelight3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Firelight3Tier", "int", entry))
+    entry = get("Firelight4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Firelight4Tier", "int", entry))
+    entry = get("FirelightInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("FirelightInventory", "int", entry))
+    entry = get("FirelightTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("FirelightTier", "int", entry))
+    entry = get("FirelightTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("FirelightTierOneUnlockOwned", "bool", entry))
+    entry = get("FirelightTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("FirelightTierThreeUnlockOwned", "bool", entry))
+    entry = get("FirelightTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("FirelightTierTwoUnlockOwned", "bool", entry))
+    entry = get("Flashlight-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Flashlight-1Tier", "int", entry))
+    entry = get("Flashlight0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Flashlight0Tier", "int", entry))
+    entry = get("Flashlight1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Flashlight1Tier", "int", entry))
+    entry = get("Flashlight2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Flashlight2Tier", "int", entry))
+    entry = get("Flashlight3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Flashlight3Tier", "int", entry))
+    entry = get("Flashlight4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Flashlight4Tier", "int", entry))
+    entry = get("FlashlightInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("FlashlightInventory", "int", entry))
+    entry = get("FlashlightTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("FlashlightTier", "int", entry))
+    entry = get("FlashlightTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("FlashlightTierOneUnlockOwned", "bool", entry))
+    entry = get("FlashlightTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("FlashlightTierThreeUnlockOwned", "bool", entry))
+    entry = get("FlashlightTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("FlashlightTierTwoUnlockOwned", "bool", entry))
+    entry = get("FoundMonkeyWishGhost")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("FoundMonkeyWishGhost", "int", entry))
+    entry = get("GhostType")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "string" or type(value) is not str:
+            errors.append(_describe("GhostType", "string", entry))
+    entry = get("GhostWritingBook-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("GhostWritingBook-1Tier", "int", entry))
+    entry = get("GhostWritingBook0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("GhostWritingBook0Tier", "int", entry))
+    entry = get("GhostWritingBook1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("GhostWritingBook1Tier", "int", entry))
+    entry = get("GhostWritingBook2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("GhostWritingBook2Tier", "int", entry))
+    entry = get("GhostWritingBook3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("GhostWritingBook3Tier", "int", entry))
+    entry = get("GhostWritingBook4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("GhostWritingBook4Tier", "int", entry))
+    entry = get("GhostWritingBookInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("GhostWritingBookInventory", "int", entry))
+    entry = get("GhostWritingBookTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("GhostWritingBookTier", "int", entry))
+    entry = get("GhostWritingBookTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("GhostWritingBookTierOneUnlockOwned", "bool", entry))
+    entry = get("GhostWritingBookTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("GhostWritingBookTierThreeUnlockOwned", "bool", entry))
+    entry = get("GhostWritingBookTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("GhostWritingBookTierTwoUnlockOwned", "bool", entry))
+    entry = get("GlowstickInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("GlowstickInventory", "int", entry))
+    entry = get("HeadGear-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("HeadGear-1Tier", "int", entry))
+    entry = get("HeadGear0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("HeadGear0Tier", "int", entry))
+    entry = get("HeadGear1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("HeadGear1Tier", "int", entry))
+    entry = get("HeadGear2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("HeadGear2Tier", "int", entry))
+    entry = get("HeadGear3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("HeadGear3Tier", "int", entry))
+    entry = get("HeadGear4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("HeadGear4Tier", "int", entry))
+    entry = get("HeadGearInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("HeadGearInventory", "int", entry))
+    entry = get("HeadGearTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("HeadGearTier", "int", entry))
+    entry = get("HeadGearTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("HeadGearTierOneUnlockOwned", "bool", entry))
+    entry = get("HeadGearTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("HeadGearTierThreeUnlockOwned", "bool", entry))
+    entry = get("HeadGearTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("HeadGearTierTwoUnlockOwned", "bool", entry))
+    entry = get("HeadMountedCameraInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("HeadMountedCameraInventory", "int", entry))
+    entry = get("IRLightSensorInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("IRLightSensorInventory", "int", entry))
+    entry = get("Igniter-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Igniter-1Tier", "int", entry))
+    entry = get("Igniter0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Igniter0Tier", "int", entry))
+    entry = get("Igniter1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Igniter1Tier", "int", entry))
+    entry = get("Igniter2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Igniter2Tier", "int", entry))
+    entry = get("Igniter3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Igniter3Tier", "int", entry))
+    entry = get("Igniter4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Igniter4Tier", "int", entry))
+    entry = get("IgniterInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("IgniterInventory", "int", entry))
+    entry = get("IgniterTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("IgniterTier", "int", entry))
+    entry = get("IgniterTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("IgniterTierOneUnlockOwned", "bool", entry))
+    entry = get("IgniterTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("IgniterTierThreeUnlockOwned", "bool", entry))
+    entry = get("IgniterTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("IgniterTierTwoUnlockOwned", "bool", entry))
+    entry = get("InventoryTutorialComplete")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("InventoryTutorialComplete", "bool", entry))
+    entry = get("LastDifficulty")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "Difficulty,Assembly-CSharp" or type(value) is not dict:
+            errors.append(_describe("LastDifficulty", "Difficulty", entry))
+    entry = get("LastLoadout")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("LastLoadout", "int", entry))
+    entry = get("LastMode")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("LastMode", "int", entry))
+    entry = get("LegacyColor")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("LegacyColor", "int", entry))
+    entry = get("Level")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Level", "int", entry))
+    entry = get("LighterInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("LighterInventory", "int", entry))
+    entry = get("Loadout0Name")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "string" or type(value) is not str:
+            errors.append(_describe("Loadout0Name", "string", entry))
+    entry = get("Loadout3Name")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "string" or type(value) is not str:
+            errors.append(_describe("Loadout3Name", "string", entry))
+    entry = get("LoadoutTutorialComplete")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("LoadoutTutorialComplete", "bool", entry))
+    entry = get("MirrorsFound")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MirrorsFound", "int", entry))
+    entry = get("MoneybagsCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MoneybagsCompleted", "int", entry))
+    entry = get("MoneybagsProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MoneybagsProgression", "int", entry))
+    entry = get("MoneybagsReceived")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MoneybagsReceived", "int", entry))
+    entry = get("MonkeyPawFound")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MonkeyPawFound", "int", entry))
+    entry = get("MotionSensor-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MotionSensor-1Tier", "int", entry))
+    entry = get("MotionSensor0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MotionSensor0Tier", "int", entry))
+    entry = get("MotionSensor1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MotionSensor1Tier", "int", entry))
+    entry = get("MotionSensor2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MotionSensor2Tier", "int", entry))
+    entry = get("MotionSensor3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MotionSensor3Tier", "int", entry))
+    entry = get("MotionSensor4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MotionSensor4Tier", "int", entry))
+    entry = get("MotionSensorInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MotionSensorInventory", "int", entry))
+    entry = get("MotionSensorTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MotionSensorTier", "int", entry))
+    entry = get("MotionSensorTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("MotionSensorTierOneUnlockOwned", "bool", entry))
+    entry = get("MotionSensorTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("MotionSensorTierThreeUnlockOwned", "bool", entry))
+    entry = get("MotionSensorTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("MotionSensorTierTwoUnlockOwned", "bool", entry))
+    entry = get("MusicBoxesFound")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("MusicBoxesFound", "int", entry))
+    entry = get("NellsDinerCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("NellsDinerCompleted", "int", entry))
+    entry = get("NellsDinerProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("NellsDinerProgression", "int", entry))
+    entry = get("NellsDinerReceived")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("NellsDinerReceived", "int", entry))
+    entry = get("NewLevel")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("NewLevel", "int", entry))
+    entry = get("OuijasFound")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("OuijasFound", "int", entry))
+    entry = get("ParabolicMicrophone-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ParabolicMicrophone-1Tier", "int", entry))
+    entry = get("ParabolicMicrophone0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ParabolicMicrophone0Tier", "int", entry))
+    entry = get("ParabolicMicrophone1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ParabolicMicrophone1Tier", "int", entry))
+    entry = get("ParabolicMicrophone2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ParabolicMicrophone2Tier", "int", entry))
+    entry = get("ParabolicMicrophone3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ParabolicMicrophone3Tier", "int", entry))
+    entry = get("ParabolicMicrophone4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ParabolicMicrophone4Tier", "int", entry))
+    entry = get("ParabolicMicrophoneInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ParabolicMicrophoneInventory", "int", entry))
+    entry = get("ParabolicMicrophoneTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ParabolicMicrophoneTier", "int", entry))
+    entry = get("ParabolicMicrophoneTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("ParabolicMicrophoneTierOneUnlockOwned", "bool", entry))
+    entry = get("ParabolicMicrophoneTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("ParabolicMicrophoneTierThreeUnlockOwned", "bool", entry))
+    entry = get("ParabolicMicrophoneTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("ParabolicMicrophoneTierTwoUnlockOwned", "bool", entry))
+    entry = get("PhotoCamera-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PhotoCamera-1Tier", "int", entry))
+    entry = get("PhotoCamera0Amount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PhotoCamera0Amount", "int", entry))
+    entry = get("PhotoCamera0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PhotoCamera0Tier", "int", entry))
+    entry = get("PhotoCamera1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PhotoCamera1Tier", "int", entry))
+    entry = get("PhotoCamera2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PhotoCamera2Tier", "int", entry))
+    entry = get("PhotoCamera3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PhotoCamera3Tier", "int", entry))
+    entry = get("PhotoCamera4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PhotoCamera4Tier", "int", entry))
+    entry = get("PhotoCameraInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PhotoCameraInventory", "int", entry))
+    entry = get("PhotoCameraTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PhotoCameraTier", "int", entry))
+    entry = get("PhotoCameraTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("PhotoCameraTierOneUnlockOwned", "bool", entry))
+    entry = get("PhotoCameraTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("PhotoCameraTierThreeUnlockOwned", "bool", entry))
+    entry = get("PhotoCameraTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("PhotoCameraTierTwoUnlockOwned", "bool", entry))
+    entry = get("Player0Color")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "Color" or not _is_colour(value):
+            errors.append(_describe("Player0Color", "Color", entry))
+    entry = get("Player1Color")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "Color" or not _is_colour(value):
+            errors.append(_describe("Player1Color", "Color", entry))
+    entry = get("Player2Color")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "Color" or not _is_colour(value):
+            errors.append(_describe("Player2Color", "Color", entry))
+    entry = get("Player3Color")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "Color" or not _is_colour(value):
+            errors.append(_describe("Player3Color", "Color", entry))
+    entry = get("PlayersMoney")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PlayersMoney", "int", entry))
+    entry = get("Prestige")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Prestige", "int", entry))
+    entry = get("PrestigeIndex")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("PrestigeIndex", "int", entry))
+    entry = get("PrestigeTheme")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("PrestigeTheme", "bool", entry))
+    entry = get("Repellent-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Repellent-1Tier", "int", entry))
+    entry = get("Repellent0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Repellent0Tier", "int", entry))
+    entry = get("Repellent1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Repellent1Tier", "int", entry))
+    entry = get("Repellent2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Repellent2Tier", "int", entry))
+    entry = get("Repellent3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Repellent3Tier", "int", entry))
+    entry = get("Repellent4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Repellent4Tier", "int", entry))
+    entry = get("RepellentInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("RepellentInventory", "int", entry))
+    entry = get("RepellentTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("RepellentTier", "int", entry))
+    entry = get("RepellentTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("RepellentTierOneUnlockOwned", "bool", entry))
+    entry = get("RepellentTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("RepellentTierThreeUnlockOwned", "bool", entry))
+    entry = get("RepellentTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("RepellentTierTwoUnlockOwned", "bool", entry))
+    entry = get("RewardMultiplier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("RewardMultiplier", "float", entry))
+    entry = get("RoleType")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if type(tag) is not str or type(value) is not int:
+            errors.append(_describe("RoleType", "int", entry))
+    entry = get("SageInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SageInventory", "int", entry))
+    entry = get("Salt-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Salt-1Tier", "int", entry))
+    entry = get("Salt0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Salt0Tier", "int", entry))
+    entry = get("Salt1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Salt1Tier", "int", entry))
+    entry = get("Salt2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Salt2Tier", "int", entry))
+    entry = get("Salt3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Salt3Tier", "int", entry))
+    entry = get("Salt4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Salt4Tier", "int", entry))
+    entry = get("SaltInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SaltInventory", "int", entry))
+    entry = get("SaltTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SaltTier", "int", entry))
+    entry = get("SaltTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SaltTierOneUnlockOwned", "bool", entry))
+    entry = get("SaltTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SaltTierThreeUnlockOwned", "bool", entry))
+    entry = get("SaltTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SaltTierTwoUnlockOwned", "bool", entry))
+    entry = get("SanityMedication-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SanityMedication-1Tier", "int", entry))
+    entry = get("SanityMedication0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SanityMedication0Tier", "int", entry))
+    entry = get("SanityMedication1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SanityMedication1Tier", "int", entry))
+    entry = get("SanityMedication2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SanityMedication2Tier", "int", entry))
+    entry = get("SanityMedication3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SanityMedication3Tier", "int", entry))
+    entry = get("SanityMedication4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SanityMedication4Tier", "int", entry))
+    entry = get("SanityMedicationInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SanityMedicationInventory", "int", entry))
+    entry = get("SanityMedicationTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SanityMedicationTier", "int", entry))
+    entry = get("SanityMedicationTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SanityMedicationTierOneUnlockOwned", "bool", entry))
+    entry = get("SanityMedicationTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SanityMedicationTierThreeUnlockOwned", "bool", entry))
+    entry = get("SanityMedicationTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SanityMedicationTierTwoUnlockOwned", "bool", entry))
+    entry = get("SanityPillsInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SanityPillsInventory", "int", entry))
+    entry = get("SaveVersion")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SaveVersion", "int", entry))
+    entry = get("ShopTutorialComplete")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("ShopTutorialComplete", "bool", entry))
+    entry = get("SoundRecorder-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundRecorder-1Tier", "int", entry))
+    entry = get("SoundRecorder0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundRecorder0Tier", "int", entry))
+    entry = get("SoundRecorder1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundRecorder1Tier", "int", entry))
+    entry = get("SoundRecorder2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundRecorder2Tier", "int", entry))
+    entry = get("SoundRecorder3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundRecorder3Tier", "int", entry))
+    entry = get("SoundRecorder4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundRecorder4Tier", "int", entry))
+    entry = get("SoundRecorderInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundRecorderInventory", "int", entry))
+    entry = get("SoundRecorderTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundRecorderTier", "int", entry))
+    entry = get("SoundRecorderTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SoundRecorderTierOneUnlockOwned", "bool", entry))
+    entry = get("SoundRecorderTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SoundRecorderTierThreeUnlockOwned", "bool", entry))
+    entry = get("SoundRecorderTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SoundRecorderTierTwoUnlockOwned", "bool", entry))
+    entry = get("SoundSensor-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundSensor-1Tier", "int", entry))
+    entry = get("SoundSensor0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundSensor0Tier", "int", entry))
+    entry = get("SoundSensor1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundSensor1Tier", "int", entry))
+    entry = get("SoundSensor2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundSensor2Tier", "int", entry))
+    entry = get("SoundSensor3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundSensor3Tier", "int", entry))
+    entry = get("SoundSensor4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundSensor4Tier", "int", entry))
+    entry = get("SoundSensorInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundSensorInventory", "int", entry))
+    entry = get("SoundSensorTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SoundSensorTier", "int", entry))
+    entry = get("SoundSensorTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SoundSensorTierOneUnlockOwned", "bool", entry))
+    entry = get("SoundSensorTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SoundSensorTierThreeUnlockOwned", "bool", entry))
+    entry = get("SoundSensorTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SoundSensorTierTwoUnlockOwned", "bool", entry))
+    entry = get("SpiritBox-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SpiritBox-1Tier", "int", entry))
+    entry = get("SpiritBox0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SpiritBox0Tier", "int", entry))
+    entry = get("SpiritBox1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SpiritBox1Tier", "int", entry))
+    entry = get("SpiritBox2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SpiritBox2Tier", "int", entry))
+    entry = get("SpiritBox3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SpiritBox3Tier", "int", entry))
+    entry = get("SpiritBox4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SpiritBox4Tier", "int", entry))
+    entry = get("SpiritBoxInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SpiritBoxInventory", "int", entry))
+    entry = get("SpiritBoxTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SpiritBoxTier", "int", entry))
+    entry = get("SpiritBoxTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SpiritBoxTierOneUnlockOwned", "bool", entry))
+    entry = get("SpiritBoxTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SpiritBoxTierThreeUnlockOwned", "bool", entry))
+    entry = get("SpiritBoxTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("SpiritBoxTierTwoUnlockOwned", "bool", entry))
+    entry = get("StrongFlashlightInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("StrongFlashlightInventory", "int", entry))
+    entry = get("SummoningCirclesUsed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("SummoningCirclesUsed", "int", entry))
+    entry = get("TarotDeath")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TarotDeath", "int", entry))
+    entry = get("TarotDevil")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TarotDevil", "int", entry))
+    entry = get("TarotFool")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TarotFool", "int", entry))
+    entry = get("TarotHermit")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TarotHermit", "int", entry))
+    entry = get("TarotMoon")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TarotMoon", "int", entry))
+    entry = get("TarotPriestess")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TarotPriestess", "int", entry))
+    entry = get("TarotSun")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TarotSun", "int", entry))
+    entry = get("TarotTower")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TarotTower", "int", entry))
+    entry = get("TarotWheel")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TarotWheel", "int", entry))
+    entry = get("Thermometer-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Thermometer-1Tier", "int", entry))
+    entry = get("Thermometer0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Thermometer0Tier", "int", entry))
+    entry = get("Thermometer1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Thermometer1Tier", "int", entry))
+    entry = get("Thermometer2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Thermometer2Tier", "int", entry))
+    entry = get("Thermometer3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Thermometer3Tier", "int", entry))
+    entry = get("Thermometer4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Thermometer4Tier", "int", entry))
+    entry = get("ThermometerInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ThermometerInventory", "int", entry))
+    entry = get("ThermometerTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ThermometerTier", "int", entry))
+    entry = get("ThermometerTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("ThermometerTierOneUnlockOwned", "bool", entry))
+    entry = get("ThermometerTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("ThermometerTierThreeUnlockOwned", "bool", entry))
+    entry = get("ThermometerTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("ThermometerTierTwoUnlockOwned", "bool", entry))
+    entry = get("Tripod-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Tripod-1Tier", "int", entry))
+    entry = get("Tripod0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Tripod0Tier", "int", entry))
+    entry = get("Tripod1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Tripod1Tier", "int", entry))
+    entry = get("Tripod2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Tripod2Tier", "int", entry))
+    entry = get("Tripod3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Tripod3Tier", "int", entry))
+    entry = get("Tripod4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("Tripod4Tier", "int", entry))
+    entry = get("TripodInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TripodInventory", "int", entry))
+    entry = get("TripodTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("TripodTier", "int", entry))
+    entry = get("TripodTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("TripodTierOneUnlockOwned", "bool", entry))
+    entry = get("TripodTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("TripodTierThreeUnlockOwned", "bool", entry))
+    entry = get("TripodTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("TripodTierTwoUnlockOwned", "bool", entry))
+    entry = get("UVFlashlightInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("UVFlashlightInventory", "int", entry))
+    entry = get("UVLight-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("UVLight-1Tier", "int", entry))
+    entry = get("UVLight0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("UVLight0Tier", "int", entry))
+    entry = get("UVLight1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("UVLight1Tier", "int", entry))
+    entry = get("UVLight2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("UVLight2Tier", "int", entry))
+    entry = get("UVLight3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("UVLight3Tier", "int", entry))
+    entry = get("UVLight4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("UVLight4Tier", "int", entry))
+    entry = get("UVLightInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("UVLightInventory", "int", entry))
+    entry = get("UVLightTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("UVLightTier", "int", entry))
+    entry = get("UVLightTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("UVLightTierOneUnlockOwned", "bool", entry))
+    entry = get("UVLightTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("UVLightTierThreeUnlockOwned", "bool", entry))
+    entry = get("UVLightTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("UVLightTierTwoUnlockOwned", "bool", entry))
+    entry = get("VideoCamera-1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("VideoCamera-1Tier", "int", entry))
+    entry = get("VideoCamera0Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("VideoCamera0Tier", "int", entry))
+    entry = get("VideoCamera1Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("VideoCamera1Tier", "int", entry))
+    entry = get("VideoCamera2Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("VideoCamera2Tier", "int", entry))
+    entry = get("VideoCamera3Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("VideoCamera3Tier", "int", entry))
+    entry = get("VideoCamera4Tier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("VideoCamera4Tier", "int", entry))
+    entry = get("VideoCameraInventory")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("VideoCameraInventory", "int", entry))
+    entry = get("VideoCameraTier")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("VideoCameraTier", "int", entry))
+    entry = get("VideoCameraTierOneUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("VideoCameraTierOneUnlockOwned", "bool", entry))
+    entry = get("VideoCameraTierThreeUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("VideoCameraTierThreeUnlockOwned", "bool", entry))
+    entry = get("VideoCameraTierTwoUnlockOwned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "bool" or type(value) is not bool:
+            errors.append(_describe("VideoCameraTierTwoUnlockOwned", "bool", entry))
+    entry = get("VoodoosFound")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("VoodoosFound", "int", entry))
+    entry = get("abilitiesUsed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("abilitiesUsed", "int", entry))
+    entry = get("amountOfBonesCollected")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("amountOfBonesCollected", "int", entry))
+    entry = get("amountOfCursedHuntsTriggered")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("amountOfCursedHuntsTriggered", "int", entry))
+    entry = get("amountOfCursedPossessionsUsed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("amountOfCursedPossessionsUsed", "int", entry))
+    entry = get("amountOfGhostEvents")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("amountOfGhostEvents", "int", entry))
+    entry = get("amountOfGhostHunts")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("amountOfGhostHunts", "int", entry))
+    entry = get("amountOfGhostInteractions")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("amountOfGhostInteractions", "int", entry))
+    entry = get("committedCrucifixAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedCrucifixAmount", "int", entry))
+    entry = get("committedDOTSProjectorAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedDOTSProjectorAmount", "int", entry))
+    entry = get("committedEMFReaderAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedEMFReaderAmount", "int", entry))
+    entry = get("committedFirelightAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedFirelightAmount", "int", entry))
+    entry = get("committedFlashlightAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedFlashlightAmount", "int", entry))
+    entry = get("committedGhostWritingBookAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedGhostWritingBookAmount", "int", entry))
+    entry = get("committedHeadGearAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedHeadGearAmount", "int", entry))
+    entry = get("committedIgniterAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedIgniterAmount", "int", entry))
+    entry = get("committedMotionSensorAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedMotionSensorAmount", "int", entry))
+    entry = get("committedParabolicMicrophoneAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedParabolicMicrophoneAmount", "int", entry))
+    entry = get("committedPhotoCameraAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedPhotoCameraAmount", "int", entry))
+    entry = get("committedRepellentAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedRepellentAmount", "int", entry))
+    entry = get("committedSaltAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedSaltAmount", "int", entry))
+    entry = get("committedSanityMedicationAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedSanityMedicationAmount", "int", entry))
+    entry = get("committedSoundRecorderAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedSoundRecorderAmount", "int", entry))
+    entry = get("committedSoundSensorAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedSoundSensorAmount", "int", entry))
+    entry = get("committedSpiritBoxAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedSpiritBoxAmount", "int", entry))
+    entry = get("committedThermometerAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedThermometerAmount", "int", entry))
+    entry = get("committedTripodAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedTripodAmount", "int", entry))
+    entry = get("committedUVLightAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedUVLightAmount", "int", entry))
+    entry = get("committedVideoCameraAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("committedVideoCameraAmount", "int", entry))
+    entry = get("currentSeasonalEvent")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if type(tag) is not str or type(value) is not int:
+            errors.append(_describe("currentSeasonalEvent", "int", entry))
+    entry = get("daily-1Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily-1Completed", "int", entry))
+    entry = get("daily-1Progression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily-1Progression", "int", entry))
+    entry = get("daily-1Received")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily-1Received", "int", entry))
+    entry = get("daily-1Recieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily-1Recieved", "int", entry))
+    entry = get("daily-1Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily-1Variant", "int", entry))
+    entry = get("daily0")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily0", "int", entry))
+    entry = get("daily0Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily0Completed", "int", entry))
+    entry = get("daily0Progression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily0Progression", "int", entry))
+    entry = get("daily0Received")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily0Received", "int", entry))
+    entry = get("daily0Recieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily0Recieved", "int", entry))
+    entry = get("daily0Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily0Variant", "int", entry))
+    entry = get("daily1")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily1", "int", entry))
+    entry = get("daily11Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily11Variant", "int", entry))
+    entry = get("daily12Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily12Variant", "int", entry))
+    entry = get("daily13Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily13Variant", "int", entry))
+    entry = get("daily14Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily14Variant", "int", entry))
+    entry = get("daily15Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily15Variant", "int", entry))
+    entry = get("daily1Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily1Completed", "int", entry))
+    entry = get("daily1Progression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily1Progression", "int", entry))
+    entry = get("daily1Received")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily1Received", "int", entry))
+    entry = get("daily1Recieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily1Recieved", "int", entry))
+    entry = get("daily1Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily1Variant", "int", entry))
+    entry = get("daily2")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily2", "int", entry))
+    entry = get("daily2Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily2Completed", "int", entry))
+    entry = get("daily2Progression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily2Progression", "int", entry))
+    entry = get("daily2Received")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily2Received", "int", entry))
+    entry = get("daily2Recieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily2Recieved", "int", entry))
+    entry = get("daily2Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily2Variant", "int", entry))
+    entry = get("daily3")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily3", "int", entry))
+    entry = get("daily3Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily3Completed", "int", entry))
+    entry = get("daily3Progression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily3Progression", "int", entry))
+    entry = get("daily3Received")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily3Received", "int", entry))
+    entry = get("daily3Recieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily3Recieved", "int", entry))
+    entry = get("daily3Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily3Variant", "int", entry))
+    entry = get("daily4Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily4Variant", "int", entry))
+    entry = get("daily6Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily6Variant", "int", entry))
+    entry = get("daily7Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily7Variant", "int", entry))
+    entry = get("daily8Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily8Variant", "int", entry))
+    entry = get("daily9Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("daily9Variant", "int", entry))
+    entry = get("dailyChallengeSeed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("dailyChallengeSeed", "int", entry))
+    entry = get("diedAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("diedAmount", "int", entry))
+    entry = get("dinerGhostInTheMachineCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("dinerGhostInTheMachineCompleted", "int", entry))
+    entry = get("dinerGhostInTheMachineProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("dinerGhostInTheMachineProgression", "int", entry))
+    entry = get("dinerGhostInTheMachineReceived")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("dinerGhostInTheMachineReceived", "int", entry))
+    entry = get("distanceTravelled")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("distanceTravelled", "float", entry))
+    entry = get("doorsMoved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("doorsMoved", "int", entry))
+    entry = get("fuseboxToggles")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("fuseboxToggles", "int", entry))
+    entry = get("ghostDistanceTravelled")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("ghostDistanceTravelled", "float", entry))
+    entry = get("ghostKills")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if not tag.startswith("System.Collections.Generic.Dictionary`2[[System.String,") or not _is_dict_of(value, int):
+            errors.append(_describe("ghostKills", "Dictionary<string, int>", entry))
+    entry = get("ghostsIdentifiedAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ghostsIdentifiedAmount", "int", entry))
+    entry = get("ghostsMisidentifiedAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ghostsMisidentifiedAmount", "int", entry))
+    entry = get("ghostsRepelled")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("ghostsRepelled", "int", entry))
+    entry = get("halloween23Complete")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("halloween23Complete", "int", entry))
+    entry = get("itemsBought")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("itemsBought", "int", entry))
+    entry = get("itemsLost")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("itemsLost", "int", entry))
+    entry = get("lastSmallSunnyMeadowsMap")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("lastSmallSunnyMeadowsMap", "int", entry))
+    entry = get("lighthouseFerrymenCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("lighthouseFerrymenCompleted", "int", entry))
+    entry = get("lighthouseFerrymenProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) not in {int, bool}:
+            errors.append(_describe("lighthouseFerrymenProgression", "int", entry))
+    entry = get("lighthouseFerrymenReceived")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("lighthouseFerrymenReceived", "int", entry))
+    entry = get("lighthouseKeeperCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("lighthouseKeeperCompleted", "int", entry))
+    entry = get("lighthouseKeeperProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("lighthouseKeeperProgression", "int", entry))
+    entry = get("lighthouseKeeperReceived")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("lighthouseKeeperReceived", "int", entry))
+    entry = get("lightsSwitched")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("lightsSwitched", "int", entry))
+    entry = get("moneyEarned")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("moneyEarned", "int", entry))
+    entry = get("moneySpent")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("moneySpent", "int", entry))
+    entry = get("mostCommonGhosts")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if not tag.startswith("System.Collections.Generic.Dictionary`2[[System.String,") or not _is_dict_of(value, int):
+            errors.append(_describe("mostCommonGhosts", "Dictionary<string, int>", entry))
+    entry = get("objective0Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("objective0Completed", "int", entry))
+    entry = get("objective1Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("objective1Completed", "int", entry))
+    entry = get("objective2Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("objective2Completed", "int", entry))
+    entry = get("objectivesCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("objectivesCompleted", "int", entry))
+    entry = get("objectsUsed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("objectsUsed", "int", entry))
+    entry = get("photosTaken")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("photosTaken", "int", entry))
+    entry = get("phrasesRecognized")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("phrasesRecognized", "int", entry))
+    entry = get("playedMaps")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if type(tag) is not str or not _is_dict_of(value, int):
+            errors.append(_describe("playedMaps", "Dictionary<int, int>", entry))
+    entry = get("rangerChallengeCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("rangerChallengeCompleted", "int", entry))
+    entry = get("rangerChallengeProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("rangerChallengeProgression", "int", entry))
+    entry = get("rangerChallengeReceived")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("rangerChallengeReceived", "int", entry))
+    entry = get("recentPlayerIDS")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if not tag.startswith("System.Collections.Generic.List`1[[System.String,") or not _is_list_of(value, str):
+            errors.append(_describe("recentPlayerIDS", "List<string>", entry))
+    entry = get("recentPlayerNames")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if not tag.startswith("System.Collections.Generic.List`1[[System.String,") or not _is_list_of(value, str):
+            errors.append(_describe("recentPlayerNames", "List<string>", entry))
+    entry = get("recentPlayerPlatformIDS")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if not tag.startswith("System.Collections.Generic.List`1[[System.String,") or not _is_list_of(value, str):
+            errors.append(_describe("recentPlayerPlatformIDS", "List<string>", entry))
+    entry = get("recentPlayerPlatforms")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if not tag.startswith("System.Collections.Generic.List`1[[System.Int32,") or not _is_list_of(value, int):
+            errors.append(_describe("recentPlayerPlatforms", "List<int>", entry))
+    entry = get("revivedAmount")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("revivedAmount", "int", entry))
+    entry = get("roomChanged")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("roomChanged", "int", entry))
+    entry = get("sanityGained")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("sanityGained", "float", entry))
+    entry = get("sanityLost")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("sanityLost", "float", entry))
+    entry = get("soundsTaken")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("soundsTaken", "int", entry))
+    entry = get("sunnyMeadowsSurvivalCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("sunnyMeadowsSurvivalCompleted", "int", entry))
+    entry = get("sunnyMeadowsSurvivalProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("sunnyMeadowsSurvivalProgression", "int", entry))
+    entry = get("sunnyMeadowsSurvivalReceived")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("sunnyMeadowsSurvivalReceived", "int", entry))
+    entry = get("timeInFavouriteRoom")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("timeInFavouriteRoom", "float", entry))
+    entry = get("timeSpentBeingChased")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("timeSpentBeingChased", "float", entry))
+    entry = get("timeSpentInDark")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("timeSpentInDark", "float", entry))
+    entry = get("timeSpentInGhostsRoom")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("timeSpentInGhostsRoom", "float", entry))
+    entry = get("timeSpentInLight")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("timeSpentInLight", "float", entry))
+    entry = get("timeSpentInTruck")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("timeSpentInTruck", "float", entry))
+    entry = get("timeSpentInvestigating")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("timeSpentInvestigating", "float", entry))
+    entry = get("totalHuntTime")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "float" or type(value) not in {int, float}:
+            errors.append(_describe("totalHuntTime", "float", entry))
+    entry = get("videosTaken")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("videosTaken", "int", entry))
+    entry = get("weekly-1Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly-1Completed", "int", entry))
+    entry = get("weekly-1Progression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly-1Progression", "int", entry))
+    entry = get("weekly-1Received")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly-1Received", "int", entry))
+    entry = get("weekly-1Recieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly-1Recieved", "int", entry))
+    entry = get("weekly-1Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly-1Variant", "int", entry))
+    entry = get("weekly0")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly0", "int", entry))
+    entry = get("weekly0Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly0Completed", "int", entry))
+    entry = get("weekly0Progression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly0Progression", "int", entry))
+    entry = get("weekly0Received")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly0Received", "int", entry))
+    entry = get("weekly0Recieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly0Recieved", "int", entry))
+    entry = get("weekly0Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly0Variant", "int", entry))
+    entry = get("weekly1")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly1", "int", entry))
+    entry = get("weekly1Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly1Completed", "int", entry))
+    entry = get("weekly1Progression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly1Progression", "int", entry))
+    entry = get("weekly1Received")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly1Received", "int", entry))
+    entry = get("weekly1Recieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly1Recieved", "int", entry))
+    entry = get("weekly1Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly1Variant", "int", entry))
+    entry = get("weekly2")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly2", "int", entry))
+    entry = get("weekly2Completed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly2Completed", "int", entry))
+    entry = get("weekly2Progression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly2Progression", "int", entry))
+    entry = get("weekly2Received")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly2Received", "int", entry))
+    entry = get("weekly2Recieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly2Recieved", "int", entry))
+    entry = get("weekly2Variant")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weekly2Variant", "int", entry))
+    entry = get("weeklyChallengeSeed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weeklyChallengeSeed", "int", entry))
+    entry = get("weeklyDifficultyCompleted")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weeklyDifficultyCompleted", "int", entry))
+    entry = get("weeklyDifficultyProgression")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weeklyDifficultyProgression", "int", entry))
+    entry = get("weeklyDifficultyRecieved")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "int" or type(value) is not int:
+            errors.append(_describe("weeklyDifficultyRecieved", "int", entry))
+    entry = get("weeklyDifficultySeed")
+    if entry is not None:
+        tag, value = (entry.get("__type"), entry.get("value")) if type(entry) is dict else (None, None)
+        if tag != "string" or type(value) is not str:
+            errors.append(_describe("weeklyDifficultySeed", "string", entry))
+    return errors
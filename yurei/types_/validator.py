@@ -0,0 +1,4 @@
+# This file is generated by `create_type.py` from `yurei/types_/save.py`, do not edit it by hand.
+from .schemas.v_nells_diner import validate_save
+
+__all__ = ("validate_save",)
@@ -1,10 +1,13 @@
+import operator
+import re
 from typing import TYPE_CHECKING, Literal, final
 
 if TYPE_CHECKING:
+    from .index import KeyIndex
     from .save import Save
     from .types_.inner_types import Int
 
-__all__ = ("Achievement", "UnlockableManager")
+__all__ = ("Achievement", "UnlockableManager", "discover_unlockables")
 
 type CURRENT_UNLOCKABLES = Literal[
     "farmhouse_fieldwork",
@@ -34,6 +37,7 @@ LOOKUP: dict[str, CURRENT_UNLOCKABLES] = {
     "Sunny Meadows Survival": "sunny_meadows_survival",
     "Nell's Diner": "nells_diner",
     "Moneybags": "moneybags",
+    "Ghost in the Machine": "ghost_in_the_machine",
 }
 REVERSE_LOOKUP: dict[CURRENT_UNLOCKABLES, str] = {v: k for k, v in LOOKUP.items()}
 DATA_KEY_TO_PRETTY_LOOKUP: dict[CURRENT_UNLOCKABLES_DATA_KEY, str] = {
@@ -56,16 +60,49 @@ DATA_KEY_TO_ATTRIBUTE_LOOKUP: dict[CURRENT_UNLOCKABLES_DATA_KEY, CURRENT_UNLOCKA
     "dinerGhostInTheMachine": "ghost_in_the_machine",
     "Moneybags": "moneybags",
 }
+# per unlockable overrides for the `Achievement` constructor
+DATA_KEY_OPTIONS: dict[str, dict[str, bool]] = {"lighthouseFerrymen": {"no_progression_count": True}}
+UNLOCKABLE_SUFFIXES: tuple[str, str, str] = ("Completed", "Progression", "Received")
+CAMEL_CASE_BOUNDARY_PATTERN: re.Pattern[str] = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+# daily and weekly tasks share the unlockable key layout but are rerolled by the game
+TASK_PATTERN: re.Pattern[str] = re.compile(r"^(?:daily|weekly)-?\d+$")
+
+
+def discover_unlockables(index: KeyIndex, /) -> list[str]:
+    """Return the data key of every unlockable within ``index``, in sorted order.
+
+    These are the known unlockables with any of their keys present, plus any name with a full
+    ``Completed``/``Progression``/``Received`` key triple.
+    """
+    found = {name for name in DATA_KEY_TO_ATTRIBUTE_LOOKUP if any(name + suffix in index for suffix in UNLOCKABLE_SUFFIXES)}
+    for key in index.with_suffix("Completed"):
+        name = key.removesuffix("Completed")
+        if name + "Progression" in index and name + "Received" in index and not TASK_PATTERN.match(name):
+            found.add(name)
+    return sorted(found)
+
+
+def _attribute_name(name: str, /) -> str:
+    if name in DATA_KEY_TO_ATTRIBUTE_LOOKUP:
+        return DATA_KEY_TO_ATTRIBUTE_LOOKUP[name]
+    return CAMEL_CASE_BOUNDARY_PATTERN.sub("_", name).lower()
+
+
+def _pretty_name(name: str, /) -> str:
+    if name in DATA_KEY_TO_PRETTY_LOOKUP:
+        return DATA_KEY_TO_PRETTY_LOOKUP[name]
+    words = CAMEL_CASE_BOUNDARY_PATTERN.sub(" ", name).split(" ")
+    return " ".join(word[:1].upper() + word[1:] for word in words)
 
 
 @final
 class Achievement:
     MAX_PROGRESSION_VALUE: int = 50
-    __slots__ = ("_completed", "_progression", "_received", "name", "no_progression_count")
+    __slots__ = ("_completed", "_progression", "_received", "dirty", "max_progression_value", "name", "no_progression_count")
 
     def __init__(
         self,
-        name: CURRENT_UNLOCKABLES_DATA_KEY,
+        name: str,
         /,
         *,
         completed: int | bool,
@@ -74,13 +111,14 @@ class Achievement:
         no_progression_count: bool = False,
         max_progression_value: int | None = None,
     ) -> None:
-        self.name: CURRENT_UNLOCKABLES_DATA_KEY = name
+        self.name: str = name
         self._completed = int(completed)
         self._received = int(received)
         self._progression = progression
         self.no_progression_count = no_progression_count
-        if max_progression_value:
-            self.__class__.MAX_PROGRESSION_VALUE = max_progression_value
+        self.dirty: bool = False
+        # per instance, overriding the class default would change it for every save in every thread
+        self.max_progression_value: int = max_progression_value or self.MAX_PROGRESSION_VALUE
 
     def __repr__(self) -> str:
         return (
@@ -90,11 +128,11 @@ class Achievement:
 
     @property
     def pretty_name(self) -> str:
-        return DATA_KEY_TO_PRETTY_LOOKUP[self.name]
+        return _pretty_name(self.name)
 
     @property
-    def attribute_name(self) -> CURRENT_UNLOCKABLES:
-        return DATA_KEY_TO_ATTRIBUTE_LOOKUP[self.name]
+    def attribute_name(self) -> str:
+        return _attribute_name(self.name)
 
     @property
     def completed(self) -> bool:
@@ -103,6 +141,7 @@ class Achievement:
     @completed.setter
     def completed(self, value: bool | int) -> None:
         self._completed = int(value)
+        self.dirty = True
 
     @property
     def received(self) -> bool:
@@ -111,6 +150,7 @@ class Achievement:
     @received.setter
     def received(self, value: bool | int) -> None:
         self._received = int(value)
+        self.dirty = True
 
     @property
     def progression(self) -> bool | int:
@@ -122,6 +162,7 @@ class Achievement:
             self._progression = int(bool(value))
         else:
             self._progression = int(value)
+        self.dirty = True
 
     def to_data(self) -> dict[str, Int]:
         return {
@@ -133,75 +174,66 @@ class Achievement:
 
 @final
 class UnlockableManager:
-    __slots__ = (
-        "_save",
-        "farmhouse_fieldwork",
-        "ghost_in_the_machine",
-        "lighthouse_ferrymen",
-        "lighthouse_keeper",
-        "moneybags",
-        "nells_diner",
-        "ranger_challenge",
-        "sunny_meadows_survival",
-    )
+    """The unlockables present within a save, keyed by attribute name.
+
+    The `Achievement` handlers are only built on first access, and only the ones that were changed are merged back.
+    """
+
+    __slots__ = ("_handlers", "_names", "_save")
 
     def __init__(self, save: Save, /) -> None:
         self._save = save
-        self.farmhouse_fieldwork = Achievement(
-            "FarmhouseFieldwork",
-            completed=save.get_value("FarmhouseFieldworkCompleted", int, default=0),
-            progression=save.get_value("FarmhouseFieldworkProgression", int, default=0),
-            received=save.get_value("FarmhouseFieldworkReceived", int, default=0),
-        )
-        self.lighthouse_ferrymen = Achievement(
-            "lighthouseFerrymen",
-            completed=save.get_value("lighthouseFerrymenCompleted", int, default=0),
-            progression=save.get_value("lighthouseFerrymenProgression", int, default=0),
-            received=save.get_value("lighthouseFerrymenReceived", int, default=0),
-            no_progression_count=True,
-        )
-        self.lighthouse_keeper = Achievement(
-            "lighthouseKeeper",
-            completed=save.get_value("lighthouseKeeperCompleted", int, default=0),
-            progression=save.get_value("lighthouseKeeperProgression", int, default=0),
-            received=save.get_value("lighthouseKeeperReceived", int, default=0),
-        )
-        self.ranger_challenge = Achievement(
-            "rangerChallenge",
-            completed=save.get_value("rangerChallengeCompleted", int, default=0),
-            progression=save.get_value("rangerChallengeProgression", int, default=0),
-            received=save.get_value("rangerChallengeReceived", int, default=0),
-        )
-        self.sunny_meadows_survival = Achievement(
-            "sunnyMeadowsSurvival",
-            completed=save.get_value("sunnyMeadowsSurvivalCompleted", int, default=0),
-            progression=save.get_value("sunnyMeadowsSurvivalProgression", int, default=0),
-            received=save.get_value("sunnyMeadowsSurvivalReceived", int, default=0),
-        )
-        self.nells_diner = Achievement(
-            "NellsDiner",
-            completed=save.get_value("NellsDinerCompleted", int, default=0),
-            progression=save.get_value("NellsDinerProgression", int, default=0),
-            received=save.get_value("NellsDinerReceived", int, default=0),
-        )
-        self.ghost_in_the_machine = Achievement(
-            "dinerGhostInTheMachine",
-            completed=save.get_value("dinerGhostInTheMachineCompleted", int, default=0),
-            progression=save.get_value("dinerGhostInTheMachineProgression", int, default=0),
-            received=save.get_value("dinerGhostInTheMachineReceived", int, default=0),
-        )
-        self.moneybags = Achievement(
-            "Moneybags",
-            completed=save.get_value("MoneybagsCompleted", int, default=0),
-            progression=save.get_value("MoneybagsProgression", int, default=0),
-            received=save.get_value("MoneybagsReceived", int, default=0),
-        )
+        self._names: dict[str, str] = {_attribute_name(name): name for name in save.schema.unlockables_of(save.key_index)}
+        self._handlers: dict[str, Achievement] = {}
+
+    def __getattr__(self, key: str, /) -> Achievement:
+        if key.startswith("_"):
+            raise AttributeError(key)
+        try:
+            return self.get_handler(key)
+        except KeyError:
+            raise AttributeError(key) from None
 
     def __contains__(self, key: str, /) -> bool:
-        return hasattr(self, key)
+        return key in self._names
 
     def __bool__(self) -> bool:
-        return any(hasattr(self, key) for key in self.__slots__ if not key.startswith("_"))
-
-    def get_handler(self, key: CURRENT_UNLOCKABLES) -> Achievement:
-        return getattr(self, key)
+        return bool(self._names)
+
+    def available(self) -> dict[str, str]:
+        """A mapping of attribute name to display name, without building any handlers."""
+        pretty = {key: _pretty_name(name) for key, name in self._names.items()}
+        return dict(sorted(pretty.items(), key=operator.itemgetter(1)))
+
+    def get_handler(self, key: CURRENT_UNLOCKABLES | str) -> Achievement:
+        try:
+            return self._handlers[key]
+        except KeyError:
+            pass
+
+        name = self._names[key]
+        handler = Achievement(
+            name,
+            completed=self._save.get_value(f"{name}Completed", int, default=0),
+            progression=self._save.get_value(f"{name}Progression", int, default=0),
+            received=self._save.get_value(f"{name}Received", int, default=0),
+            **DATA_KEY_OPTIONS.get(name, {}),
+        )
+        self._handlers[key] = handler
+        return handler
+
+    def set_handler(self, handler: Achievement, /) -> None:
+        key = handler.attribute_name
+        self._names[key] = handler.name
+        self._handlers[key] = handler
+        handler.dirty = True
+
+    def has_dirty(self) -> bool:
+        return any(handler.dirty for handler in self._handlers.values())
+
+    def pop_dirty(self) -> list[Achievement]:
+        """Return the handlers changed since the last call, marking them clean."""
+        dirty = [handler for handler in self._handlers.values() if handler.dirty]
+        for handler in dirty:
+            handler.dirty = False
+        return dirty
@@ -0,0 +1,187 @@
+import ctypes
+import ctypes.util
+import functools
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from .save import DiskState, Save
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from .recipe import Recipe
+
+__all__ = ("InotifyWatcher", "PollingWatcher", "reapply", "watch", "watcher_for")
+
+LOGGER = logging.getLogger(__name__)
+# the game writes the save once per match, anything closer together than this is the same write
+DEFAULT_DEBOUNCE = 0.1
+DEFAULT_POLL_INTERVAL = 1.0
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+# the directory is watched rather than the file, so a save replaced by a rename is still seen
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+@functools.cache
+def _libc() -> ctypes.CDLL:
+    return ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+
+class PollingWatcher:
+    """Notices changes to a file by comparing its ``stat`` every ``interval`` seconds, one stat per poll."""
+
+    __slots__ = ("_last", "interval", "path")
+
+    def __init__(self, path: pathlib.Path, /, *, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.path = path
+        self.interval = interval
+        self._last = self._signature()
+
+    def _signature(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def wait(self, timeout: float | None, /) -> bool:
+        """Block until the file changes, returning ``False`` if ``timeout`` seconds pass first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            signature = self._signature()
+            if signature != self._last:
+                self._last = signature
+                return True
+
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Blocks on inotify events for the file's directory, so waiting costs no CPU at all."""
+
+    __slots__ = ("_fd", "path")
+
+    def __init__(self, path: pathlib.Path, /) -> None:
+        self.path = path
+        libc = _libc()
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        if libc.inotify_add_watch(fd, os.fsencode(path.parent), INOTIFY_MASK) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, os.strerror(err), str(path.parent))
+        self._fd: int = fd
+
+    def _drain(self) -> bool:
+        name = os.fsencode(self.path.name)
+        matched = False
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return matched
+
+            offset = 0
+            while offset < len(buffer):
+                _, _, _, length = INOTIFY_EVENT.unpack_from(buffer, offset)
+                start = offset + INOTIFY_EVENT.size
+                matched = matched or buffer[start : start + length].rstrip(b"\0") == name
+                offset = start + length
+
+    def wait(self, timeout: float | None, /) -> bool:
+        """Block until the file changes, returning ``False`` if ``timeout`` seconds pass first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                return False
+            # events for other files in the directory wake us too, they are drained and ignored
+            if self._drain():
+                return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def watcher_for(path: pathlib.Path, /, *, poll_interval: float = DEFAULT_POLL_INTERVAL) -> InotifyWatcher | PollingWatcher:
+    if sys.platform == "linux":
+        try:
+            return InotifyWatcher(path)
+        except (OSError, AttributeError) as err:
+            LOGGER.info("inotify is unavailable (%s), polling %s instead", err, path)
+    return PollingWatcher(path, interval=poll_interval)
+
+
+def reapply(path: pathlib.Path, recipe: Recipe, /, *, seen: bytes | None = None, create_backup: bool = True) -> Save | None:
+    """Apply ``recipe`` to the save at ``path``, unless its ciphertext still hashes to ``seen``.
+
+    Returns the save when it was decrypted, its ``disk_state`` describes the file as it was left.
+    """
+    started = time.perf_counter()
+    try:
+        if DiskState.read(path).digest == seen:
+            # our own write, or the game rewriting what we left there
+            return None
+
+        save = Save.from_path(path, create_backup=create_backup)
+        applied = recipe.apply(save)
+        if applied:
+            save.write()
+    except (OSError, ValueError, KeyError) as err:
+        # usually the game writing again mid-apply, its write wakes us up to try again
+        LOGGER.warning("Could not apply the recipe to %s: %s", path, err)
+        return None
+
+    if applied:
+        LOGGER.info("Applied %s to %s in %.1fms", ", ".join(applied), path, (time.perf_counter() - started) * 1e3)
+    return save
+
+
+def watch(
+    path: pathlib.Path,
+    recipe: Recipe,
+    /,
+    *,
+    debounce: float = DEFAULT_DEBOUNCE,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    poll: bool = False,
+    create_backup: bool = True,
+) -> None:
+    """Keep ``recipe`` applied to the save at ``path`` every time something else rewrites it, until interrupted."""
+    watcher = PollingWatcher(path, interval=poll_interval) if poll else watcher_for(path, poll_interval=poll_interval)
+    LOGGER.info("Watching %s with %s", path, type(watcher).__name__)
+    seen: bytes | None = None
+    try:
+        while True:
+            save = reapply(path, recipe, seen=seen, create_backup=create_backup)
+            if save and save.disk_state:
+                seen = save.disk_state.digest
+                # the original is backed up once per session, not once per match
+                create_backup = create_backup and not save.last_backup
+
+            watcher.wait(None)
+            while watcher.wait(debounce):
+                pass
+    finally:
+        watcher.close()